@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""Load test for the online game server using AI-driven clients.
+
+Each simulated client connects over localhost, introduces itself, and plays
+match after match with one of the ``AI_OPPONENTS`` strategies choosing its
+moves, until the test ends. Clients are started according to a ramp
+profile:
+
+* ``flat``: everyone connects at once
+* ``linear``: clients join evenly over ``--ramp`` seconds
+* ``step``: clients join in ``--steps`` equal batches over ``--ramp`` seconds
+
+after which the full load is held for ``--hold`` seconds. Unless ``--port``
+points at a running server, a fresh ``python -m src.server`` is started on
+a free port with an empty leaderboard and stopped afterwards.
+
+Reported figures (latencies in milliseconds):
+
+* ``move``: from sending a move to receiving the round result
+* ``queue``: from asking to play to the match starting
+* ``connect``: TCP connect plus the hello/welcome exchange
+* throughput in matches and moves per second, and error counts by kind
+
+    python benchmarks/loadtest.py --clients 2000 --profile linear --ramp 10
+    python benchmarks/loadtest.py --clients 500 --json > report.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.ai import AI_OPPONENTS, create_ai  # noqa: E402
+from src.client import ConnectionClosed, GameClient, play_match  # noqa: E402
+from src.game import GameResult, Move  # noqa: E402
+from src.protocol import DEFAULT_HOST  # noqa: E402
+
+PROFILES = ("flat", "linear", "step")
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """p50/p90/p99/max of ``samples`` (seconds) in milliseconds."""
+    if not samples:
+        return {"count": 0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": ordered[-1] * 1000,
+    }
+
+
+def start_offset(
+    index: int, clients: int, profile: str, ramp: float, steps: int
+) -> float:
+    """Seconds after the start at which client ``index`` connects."""
+    if profile == "flat" or ramp <= 0:
+        return 0.0
+    if profile == "linear":
+        return ramp * index / clients
+    batch = max(1, -(-clients // steps))  # Ceiling division
+    return ramp * (index // batch) / steps
+
+
+class Results:
+    """Measurements shared by all simulated clients."""
+
+    def __init__(self):
+        self.move: List[float] = []
+        self.queue: List[float] = []
+        self.connect: List[float] = []
+        self.matches = 0
+        self.moves = 0
+        self.errors: Counter = Counter()
+        self.unmatched = 0
+        # Only counted up to the deadline, for throughput
+        self.matches_in_window = 0
+        self.moves_in_window = 0
+        self.peak_connected = 0
+        self.connected = 0
+
+
+async def run_client(
+    index: int,
+    host: str,
+    port: int,
+    delay: float,
+    deadline: float,
+    grace: float,
+    results: Results,
+):
+    """One simulated player: connect, then play matches until the deadline.
+
+    A match still queued ``grace`` seconds after the deadline is abandoned
+    (its would-be opponents have stopped); one still in progress is an error.
+    """
+    await asyncio.sleep(delay)
+    ai = create_ai(index % len(AI_OPPONENTS))
+    client = GameClient()
+    started = time.perf_counter()
+    try:
+        await client.connect(host, port)
+        await client.hello(f"loadbot-{index}")
+    except (OSError, ConnectionClosed) as exc:
+        results.errors[f"connect: {type(exc).__name__}"] += 1
+        await client.close()
+        return
+    results.connect.append(time.perf_counter() - started)
+    results.connected += 1
+    results.peak_connected = max(results.peak_connected, results.connected)
+
+    opponent_history: List[Move] = []
+    sent_at = 0.0
+    queued_at = 0.0
+    in_match = False
+
+    async def choose_move(message: Dict) -> Move:
+        nonlocal sent_at
+        move = ai.make_move(opponent_history)
+        ai.record_move(move)
+        sent_at = time.perf_counter()
+        return move
+
+    async def on_event(message: Dict):
+        nonlocal in_match
+        kind = message["type"]
+        if kind == "match_start":
+            in_match = True
+            results.queue.append(time.perf_counter() - queued_at)
+        elif kind == "round_result":
+            results.move.append(time.perf_counter() - sent_at)
+            results.moves += 1
+            if time.perf_counter() <= deadline:
+                results.moves_in_window += 1
+            if message["opponent_move"]:
+                opponent_history.append(Move(message["opponent_move"]))
+                if message["your_move"]:
+                    ai.record_result(
+                        Move(message["your_move"]),
+                        opponent_history[-1],
+                        GameResult(message["result"]),
+                    )
+        elif kind == "match_end":
+            in_match = False
+            results.matches += 1
+            if time.perf_counter() <= deadline:
+                results.matches_in_window += 1
+            if message["reason"] != "done":
+                results.errors[f"match ended: {message['reason']}"] += 1
+        elif kind == "error":
+            results.errors[f"server error: {message['message']}"] += 1
+
+    try:
+        while time.perf_counter() < deadline:
+            queued_at = time.perf_counter()
+            try:
+                await asyncio.wait_for(
+                    play_match(client, choose_move, on_event, allow_bots=False),
+                    timeout=deadline - queued_at + grace,
+                )
+            except asyncio.TimeoutError:
+                if in_match:
+                    results.errors["match timeout"] += 1
+                else:
+                    results.unmatched += 1
+                break
+    except (OSError, ConnectionClosed) as exc:
+        results.errors[f"disconnected: {type(exc).__name__}"] += 1
+    finally:
+        results.connected -= 1
+        await client.close()
+
+
+async def fetch_server_stats(host: str, port: int) -> Optional[Dict]:
+    """Ask the server for its own counters (queue depth, time to match)."""
+    client = GameClient()
+    try:
+        await client.connect(host, port)
+        await client.send({"type": "stats"})
+        stats = await client.recv()
+        stats.pop("type", None)
+        return stats
+    except (OSError, ConnectionClosed):
+        return None
+    finally:
+        await client.close()
+
+
+async def run_load(args, port: int) -> Dict:
+    results = Results()
+    ramp = 0.0 if args.profile == "flat" else args.ramp
+    started = time.perf_counter()
+    deadline = started + ramp + args.hold
+    await asyncio.gather(
+        *[
+            run_client(
+                i,
+                args.host,
+                port,
+                start_offset(i, args.clients, args.profile, ramp, args.steps),
+                deadline,
+                args.grace,
+                results,
+            )
+            for i in range(args.clients)
+        ]
+    )
+    elapsed = time.perf_counter() - started
+    # Rates cover the ramp and hold, not matches finishing during the grace
+    window = max(ramp + args.hold, 1e-9)
+
+    return {
+        "config": {
+            "clients": args.clients,
+            "profile": args.profile,
+            "ramp_s": ramp,
+            "hold_s": args.hold,
+            "steps": args.steps,
+            "rounds": args.rounds,
+        },
+        "elapsed_s": elapsed,
+        "peak_connected": results.peak_connected,
+        "matches": results.matches,
+        "moves": results.moves,
+        "matches_per_s": results.matches_in_window / window,
+        "moves_per_s": results.moves_in_window / window,
+        "latency_ms": {
+            "move": percentiles(results.move),
+            "queue": percentiles(results.queue),
+            "connect": percentiles(results.connect),
+        },
+        "unmatched_at_end": results.unmatched,
+        "errors": dict(results.errors),
+        "error_rate": sum(results.errors.values()) / max(1, results.moves),
+        "server": await fetch_server_stats(args.host, port),
+    }
+
+
+def free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(host: str, port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server did not start on {host}:{port}")
+
+
+def raise_fd_limit():
+    """Thousands of clients need thousands of file descriptors."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def print_report(report: Dict):
+    config = report["config"]
+    print(
+        f"Load test: {config['clients']} clients, {config['profile']} ramp "
+        f"{config['ramp_s']:.0f}s, hold {config['hold_s']:.0f}s"
+    )
+    print(
+        f"  {report['matches']} matches, {report['moves']} moves in "
+        f"{report['elapsed_s']:.1f}s ({report['matches_per_s']:.1f} matches/s, "
+        f"{report['moves_per_s']:.1f} moves/s), peak {report['peak_connected']} "
+        f"connected"
+    )
+    for name, stats in report["latency_ms"].items():
+        print(
+            f"  {name:<8} p50 {stats['p50']:8.1f}  p90 {stats['p90']:8.1f}  "
+            f"p99 {stats['p99']:8.1f}  max {stats['max']:8.1f} ms  "
+            f"(n={stats['count']})"
+        )
+    if report["errors"]:
+        print(f"  errors (rate {report['error_rate']:.2%}):")
+        for kind, count in sorted(report["errors"].items()):
+            print(f"    {count:6d}  {kind}")
+    else:
+        print("  no errors")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument(
+        "--port", type=int, default=None, help="Use a running server on this port"
+    )
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--profile", choices=PROFILES, default="linear")
+    parser.add_argument(
+        "--ramp", type=float, default=10.0, help="Seconds to reach full load"
+    )
+    parser.add_argument(
+        "--steps", type=int, default=5, help="Batches for the step profile"
+    )
+    parser.add_argument(
+        "--hold", type=float, default=20.0, help="Seconds to hold full load"
+    )
+    parser.add_argument(
+        "--grace",
+        type=float,
+        default=5.0,
+        help="Seconds after the hold for matches in progress to finish",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="Rounds per match (spawned server)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    raise_fd_limit()
+    server = None
+    port = args.port
+    with tempfile.TemporaryDirectory() as work_dir:
+        if port is None:
+            port = free_port(args.host)
+            server = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "src.server",
+                    "--host",
+                    args.host,
+                    "--port",
+                    str(port),
+                    "--rounds",
+                    str(args.rounds),
+                ],
+                cwd=work_dir,
+                env=dict(os.environ, PYTHONPATH=ROOT),
+                stdout=subprocess.DEVNULL,
+            )
+            wait_for_port(args.host, port)
+        try:
+            report = asyncio.run(run_load(args, port))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=10)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Startup benchmark: import cost of src.main and time to the first menu.
+
+Runs fresh interpreters so every measurement is a cold start:
+
+* ``import``: cumulative ``-X importtime`` figure for ``src.main``
+* ``first_menu``: wall time from launching ``play.py`` until the main menu
+  prompt is printed, with a generated leaderboard of ``--players`` entries
+  (so a growing leaderboard shows up as a growing number)
+
+Exits non-zero when the median of either figure exceeds its budget.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --players 100000 --json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLAY = os.path.join(ROOT, "play.py")
+
+# Budgets in milliseconds; tighten them as startup gets faster
+IMPORT_BUDGET_MS = 250.0
+FIRST_MENU_BUDGET_MS = 600.0
+
+MENU_PROMPT = b"Choose an option"
+
+
+def measure_import_ms() -> float:
+    """Cumulative import time of src.main in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*src\.main$", line)
+        if match:
+            return int(match.group(1)) / 1000
+    raise RuntimeError("src.main not found in -X importtime output")
+
+
+def write_leaderboard(data_dir: str, players: int):
+    """Create data/leaderboard.json with ``players`` synthetic entries."""
+    os.makedirs(os.path.join(data_dir, "data"), exist_ok=True)
+    entries = {
+        f"player{i}": {
+            "player_name": f"player{i}",
+            "wins": i % 50,
+            "losses": i % 30,
+            "ties": i % 7,
+            "last_played": "2026-01-01T00:00:00",
+        }
+        for i in range(players)
+    }
+    with open(os.path.join(data_dir, "data", "leaderboard.json"), "w") as f:
+        json.dump(entries, f)
+
+
+def measure_first_menu_ms(work_dir: str) -> float:
+    """Launch play.py and time how long until the menu prompt appears."""
+    env = dict(os.environ, RPS_AUDIO="off")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, PLAY, "--pace", "turbo"],
+        cwd=work_dir,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        output = b""
+        while MENU_PROMPT not in output:
+            chunk = process.stdout.read1(65536)
+            if not chunk:
+                raise RuntimeError("play.py exited before showing the menu")
+            output += chunk
+        elapsed = (time.perf_counter() - start) * 1000
+        process.stdin.write(b"8\n")
+        process.stdin.close()
+        process.wait(timeout=30)
+        return elapsed
+    finally:
+        if process.poll() is None:
+            process.kill()
+
+
+def run(repeat: int, players: int) -> dict:
+    """Run both measurements ``repeat`` times and summarise them."""
+    import_ms = [measure_import_ms() for _ in range(repeat)]
+    with tempfile.TemporaryDirectory() as work_dir:
+        if players:
+            write_leaderboard(work_dir, players)
+        menu_ms = [measure_first_menu_ms(work_dir) for _ in range(repeat)]
+
+    return {
+        "players": players,
+        "repeat": repeat,
+        "import_ms": {
+            "median": statistics.median(import_ms),
+            "min": min(import_ms),
+            "budget": IMPORT_BUDGET_MS,
+        },
+        "first_menu_ms": {
+            "median": statistics.median(menu_ms),
+            "min": min(menu_ms),
+            "budget": FIRST_MENU_BUDGET_MS,
+        },
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    parser.add_argument(
+        "--players", type=int, default=10000, help="Leaderboard size to start with"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat, args.players)
+    over_budget = [
+        name
+        for name in ("import_ms", "first_menu_ms")
+        if report[name]["median"] > report[name]["budget"]
+    ]
+    report["over_budget"] = over_budget
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Startup ({args.repeat} runs, {args.players} leaderboard entries)")
+        for name in ("import_ms", "first_menu_ms"):
+            stats = report[name]
+            status = "OVER BUDGET" if name in over_budget else "ok"
+            print(
+                f"  {name:<14} median {stats['median']:7.1f} ms  "
+                f"min {stats['min']:7.1f} ms  budget {stats['budget']:.0f} ms  {status}"
+            )
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
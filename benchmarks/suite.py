@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the game, AI and leaderboard hot paths.
+
+Groups (select with ``--only``):
+
+* ``game``: ``Game.determine_winner`` over all nine move pairs
+* ``ai``: ``make_move`` for every ``AI_OPPONENTS`` strategy against an
+  opponent history of 10 up to 10^6 moves
+* ``matchups``: headless matchups (``src.engine.Matchup``) for every pair
+  of AI opponents
+* ``leaderboard``: ``record_win`` (with its save, and without as the
+  server batches it), ``get_top_players``, ``save`` and ``load`` with
+  10^2 up to 10^6 entries
+* ``startup``: import time and time to first menu (see ``startup.py``)
+* ``sessions``: end-to-end replays of the recorded TUI sessions in
+  ``benchmarks/sessions`` (see ``src/session.py``), per screen
+
+Every result is a time per operation in seconds (lower is better), the
+median of several timed repeats. ``--quick`` trims the largest sizes.
+
+    python benchmarks/suite.py run --output baseline.json
+    python benchmarks/suite.py run --quick --compare baseline.json
+    python benchmarks/suite.py compare baseline.json current.json --threshold 0.2
+
+``compare`` (and ``run --compare``) exits non-zero when any benchmark got
+slower than the baseline by more than the threshold.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.ai import AI_OPPONENTS, create_ai  # noqa: E402
+from src.engine import Matchup  # noqa: E402
+from src.game import Game, Move  # noqa: E402
+from src.leaderboard import Leaderboard, LeaderboardEntry  # noqa: E402
+
+GROUPS = ("game", "ai", "matchups", "leaderboard", "startup", "sessions")
+SESSIONS_DIR = os.path.join(ROOT, "benchmarks", "sessions")
+
+HISTORY_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+LEADERBOARD_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+QUICK_LIMIT = 10_000
+
+MATCHUP_GAMES = 1000
+DEFAULT_THRESHOLD = 0.10
+
+
+def time_per_op(
+    fn: Callable[[], object],
+    min_time: float = 0.05,
+    repeat: int = 5,
+    setup: Optional[Callable[[], object]] = None,
+) -> float:
+    """Median seconds per call of ``fn``.
+
+    Calls are batched so each timed repeat lasts at least ``min_time``.
+    ``setup`` runs untimed before every repeat (e.g. to reset state).
+    """
+    number = 1
+    while True:
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples)
+
+
+def _sizes(sizes: List[int], quick: bool) -> List[int]:
+    return [n for n in sizes if not quick or n <= QUICK_LIMIT]
+
+
+# --- Groups -----------------------------------------------------------------
+
+
+def bench_game(quick: bool) -> Dict[str, float]:
+    pairs = list(itertools.product(Move, Move))
+
+    def all_pairs():
+        for move1, move2 in pairs:
+            Game.determine_winner(move1, move2)
+
+    return {"game.determine_winner": time_per_op(all_pairs) / len(pairs)}
+
+
+def bench_ai(quick: bool) -> Dict[str, float]:
+    results = {}
+    rng = random.Random(0)
+    moves = list(Move)
+    for size in _sizes(HISTORY_SIZES, quick):
+        history = [rng.choice(moves) for _ in range(size)]
+        for index, config in enumerate(AI_OPPONENTS):
+            ai = create_ai(index)
+            # The AI's own history matters to some strategies; give it one too
+            for move in history[-1000:]:
+                ai.record_move(move)
+            results[f"ai.make_move[{config['name']},n={size}]"] = time_per_op(
+                lambda: ai.make_move(history), repeat=3
+            )
+    return results
+
+
+def bench_matchups(quick: bool) -> Dict[str, float]:
+    games = MATCHUP_GAMES // 10 if quick else MATCHUP_GAMES
+    results = {}
+    for i, j in itertools.combinations(range(len(AI_OPPONENTS)), 2):
+        name = f"{AI_OPPONENTS[i]['name']} vs {AI_OPPONENTS[j]['name']}"
+        samples = []
+        for _ in range(3):
+            matchup = Matchup(create_ai(i), create_ai(j))
+            start = time.perf_counter()
+            matchup.play(games)
+            samples.append((time.perf_counter() - start) / games)
+        results[f"matchup.game[{name},games={games}]"] = statistics.median(samples)
+    return results
+
+
+def _populated_leaderboard(path: str, size: int) -> Leaderboard:
+    board = Leaderboard(path)
+    board.entries = {
+        f"player{i}": LeaderboardEntry(f"player{i}", i % 50, i % 30, i % 7)
+        for i in range(size)
+    }
+    return board
+
+
+def bench_leaderboard(quick: bool) -> Dict[str, float]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data", "leaderboard.json")
+        for size in _sizes(LEADERBOARD_SIZES, quick):
+            board = _populated_leaderboard(path, size)
+            names = [f"player{i}" for i in range(0, size, max(1, size // 1000))]
+            cycle = itertools.cycle(names)
+
+            # Big files take seconds; one timed call per repeat is plenty
+            slow = dict(min_time=0.0, repeat=3)
+            # As a local game records a result: update, then save the file
+            results[f"leaderboard.record_win[n={size}]"] = time_per_op(
+                lambda: board.record_win(next(cycle)), **slow
+            )
+            # The in-memory update alone, as the server batches its saves
+            results[f"leaderboard.record_win_unsaved[n={size}]"] = time_per_op(
+                lambda: board.record_win(next(cycle), save=False)
+            )
+            results[f"leaderboard.get_top_players[n={size}]"] = time_per_op(
+                lambda: board.get_top_players(10), repeat=3
+            )
+            results[f"leaderboard.save[n={size}]"] = time_per_op(board.save, **slow)
+            results[f"leaderboard.load[n={size}]"] = time_per_op(
+                Leaderboard(path).load, **slow
+            )
+    return results
+
+
+def bench_startup(quick: bool) -> Dict[str, float]:
+    import startup
+
+    repeat = 3 if quick else 5
+    report = startup.run(repeat, players=10_000)
+    return {
+        "startup.import": report["import_ms"]["median"] / 1000,
+        "startup.first_menu": report["first_menu_ms"]["median"] / 1000,
+    }
+
+
+def bench_sessions(quick: bool) -> Dict[str, float]:
+    from src.session import replay
+
+    os.environ["RPS_AUDIO"] = "off"
+    results = {}
+    for filename in sorted(os.listdir(SESSIONS_DIR)):
+        if not filename.endswith(".jsonl"):
+            continue
+        name = filename[: -len(".jsonl")]
+        report = replay(os.path.join(SESSIONS_DIR, filename), repeat=3 if quick else 5)
+        results[f"session[{name}]"] = report["total_s"]
+        for screen_name, stats in sorted(report["screens"].items()):
+            results[f"session[{name}].{screen_name}"] = stats["total"]
+    return results
+
+
+BENCHMARKS = {
+    "game": bench_game,
+    "ai": bench_ai,
+    "matchups": bench_matchups,
+    "leaderboard": bench_leaderboard,
+    "startup": bench_startup,
+    "sessions": bench_sessions,
+}
+
+
+# --- Reporting --------------------------------------------------------------
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:8.2f} {unit}"
+    return f"{seconds * 1e9:8.1f} ns"
+
+
+def run(groups: List[str], quick: bool) -> Dict:
+    results: Dict[str, float] = {}
+    for group in groups:
+        print(f"[{group}]", file=sys.stderr)
+        group_results = BENCHMARKS[group](quick)
+        for name, value in group_results.items():
+            print(f"  {name:<64} {_format_time(value)}", file=sys.stderr)
+        results.update(group_results)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+            "groups": groups,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """Print a comparison table; returns the names that regressed."""
+    base, cur = baseline["results"], current["results"]
+    regressions = []
+    print(f"{'benchmark':<64} {'baseline':>11} {'current':>11} {'change':>8}")
+    for name in sorted(base.keys() & cur.keys()):
+        change = cur[name] / base[name] - 1 if base[name] else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(
+            f"{name:<64} {_format_time(base[name])} {_format_time(cur[name])} "
+            f"{change:+7.1%}{flag}"
+        )
+
+    only_base = sorted(base.keys() - cur.keys())
+    only_cur = sorted(cur.keys() - base.keys())
+    if only_base:
+        print(f"\nNot run this time: {len(only_base)} benchmark(s)")
+    if only_cur:
+        print(f"New since the baseline: {len(only_cur)} benchmark(s)")
+    print(
+        f"\n{len(regressions)} regression(s) beyond {threshold:.0%}"
+        if regressions
+        else f"\nNo regressions beyond {threshold:.0%}"
+    )
+    return regressions
+
+
+def _load(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument(
+        "--only", nargs="+", choices=GROUPS, default=list(GROUPS), metavar="GROUP"
+    )
+    run_parser.add_argument(
+        "--quick", action="store_true", help=f"Sizes up to {QUICK_LIMIT} only"
+    )
+    run_parser.add_argument("--output", help="Write results JSON here")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="Compare when done")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction (0.1 = 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+        return 1 if regressions else 0
+
+    random.seed(0)
+    report = run(args.only, args.quick)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        return 1 if compare(_load(args.compare), report, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,19 @@
 """AI opponents with different strategies and personalities."""
 
+import math
 import random
-from typing import List
-from src.game import Move
+from array import array
+from typing import Dict, List
+from src.game import GameResult, Move
+
+# Moves by index, and the index of the move each one beats / loses to
+_MOVES = list(Move)
+_INDEX = {move: i for i, move in enumerate(_MOVES)}
+_BEATS = [_INDEX[Move.SCISSORS], _INDEX[Move.ROCK], _INDEX[Move.PAPER]]
+_LOSES_TO = [_INDEX[Move.PAPER], _INDEX[Move.SCISSORS], _INDEX[Move.ROCK]]
+_NO_TRANSITIONS = array("i", [-1] * 9)
+# Payoff of move a against move b, indexed by (a - b) % 3
+_PAYOFF = (0, 1, -1)
 
 
 class AIPlayer:
@@ -21,6 +32,22 @@ class AIPlayer:
         """Record a move to history."""
         self.move_history.append(move)
 
+    def record_result(self, my_move: Move, opponent_move: Move, result: GameResult):
+        """Learn from a finished round (``result`` is from this AI's side).
+
+        Game loops call this after every round, whatever the outcome.
+        """
+
+    def get_state(self) -> Dict:
+        """Everything the AI has learned so far (used by checkpoints)."""
+        return {
+            name: value for name, value in vars(self).items() if not callable(value)
+        }
+
+    def set_state(self, state: Dict):
+        """Restore what ``get_state`` returned."""
+        vars(self).update(state)
+
 
 class RandomAI(AIPlayer):
     """AI that makes random moves."""
@@ -114,6 +141,12 @@ class AdaptiveAI(AIPlayer):
                 return random.choice(list(Move))
             return best_move
 
+    def record_result(self, my_move: Move, opponent_move: Move, result: GameResult):
+        if result == GameResult.WIN:
+            self.record_win(my_move)
+        elif result == GameResult.LOSE:
+            self.record_loss(my_move)
+
     def record_win(self, winning_move: Move):
         """Record a winning move to adjust strategy."""
         self.wins_by_move[winning_move] += 1
@@ -232,6 +265,423 @@ class PsychologicalAI(AIPlayer):
         self.opponent_last_move = move
 
 
+class MarkovAI(AIPlayer):
+    """AI that predicts the opponent from what followed the last few rounds.
+
+    Each round is one of 9 joint symbols (my move, their move). For every
+    order k = 1..MAX_ORDER the AI counts which move the opponent played after
+    each run of k rounds. All the counts live in one flat array, a block per
+    order, indexed by a rolling code of the last MAX_ORDER rounds: a move
+    costs O(MAX_ORDER) and memory stays the same however long the match runs.
+    A context's counts are halved when they reach COUNT_LIMIT, so old habits
+    fade and the counts never overflow.
+    """
+
+    MAX_ORDER = 4
+    COUNT_LIMIT = 64
+    # Observations a context needs before its prediction is trusted
+    MIN_SEEN = 2
+
+    def __init__(self, name: str, personality: str):
+        super().__init__(name, personality)
+        # Start of each order's block; order k has 9**k contexts of 3 counts
+        self.offsets = [0] * (self.MAX_ORDER + 1)
+        size = 0
+        for k in range(1, self.MAX_ORDER + 1):
+            self.offsets[k] = size
+            size += 9**k * 3
+        self.counts = array("H", bytes(2 * size))
+        self.context = 0  # Last MAX_ORDER joint symbols in base 9, newest lowest
+        self.rounds_seen = 0
+
+    def _learn(self, my_move: Move, their_move: Move):
+        """Count ``their_move`` after each context, then roll it in."""
+        counts = self.counts
+        mine, theirs = _INDEX[my_move], _INDEX[their_move]
+        modulus = 1
+        for k in range(1, min(self.rounds_seen, self.MAX_ORDER) + 1):
+            modulus *= 9
+            base = self.offsets[k] + (self.context % modulus) * 3
+            counts[base + theirs] += 1
+            if counts[base] + counts[base + 1] + counts[base + 2] >= self.COUNT_LIMIT:
+                for i in range(base, base + 3):
+                    counts[i] >>= 1
+        self.context = (self.context * 9 + mine * 3 + theirs) % 9**self.MAX_ORDER
+        self.rounds_seen += 1
+
+    def make_move(self, opponent_history: List[Move]) -> Move:
+        # Learn the rounds finished since the last move (both moves known)
+        finished = min(len(self.move_history), len(opponent_history))
+        for i in range(self.rounds_seen, finished):
+            self._learn(self.move_history[i], opponent_history[i])
+
+        # Longest context with enough data predicts; beat what it expects
+        counts = self.counts
+        for k in range(min(self.rounds_seen, self.MAX_ORDER), 0, -1):
+            base = self.offsets[k] + (self.context % 9**k) * 3
+            seen = counts[base : base + 3]
+            if sum(seen) >= self.MIN_SEEN:
+                payoffs = [seen[_BEATS[i]] - seen[_LOSES_TO[i]] for i in range(3)]
+                best = max(payoffs)
+                return _MOVES[
+                    random.choice([i for i in range(3) if payoffs[i] == best])
+                ]
+        return random.choice(_MOVES)
+
+
+class HistoryMatchAI(AIPlayer):
+    """AI that finds the longest earlier repeat of recent play.
+
+    The joint history (my move, their move per round) is kept as one symbol
+    per round in an online suffix automaton. After each round, the suffix
+    link of the automaton's last state is the longest suffix of the history
+    that occurred before, so the lookup is amortized O(1) instead of a rescan.
+    The AI expects the opponent to repeat what they played right after that
+    earlier occurrence, and beats it.
+
+    The automaton covers at most MAX_ROUNDS rounds; when full it is rebuilt
+    from the most recent half, which keeps memory bounded and the cost per
+    round amortized O(1).
+    """
+
+    MAX_ROUNDS = 50_000
+
+    def __init__(self, name: str, personality: str):
+        super().__init__(name, personality)
+        self.rounds_seen = 0
+        self.expected = -1  # Index of the opponent's predicted move, -1 for none
+        self._reset(bytearray())
+
+    def _reset(self, symbols: bytearray):
+        """Start a fresh automaton (state 0 is the root) and add ``symbols``."""
+        self.symbols = bytearray()  # Joint symbol per round: my * 3 + theirs
+        self.length = array("i", [0])  # Longest string in each state
+        self.link = array("i", [-1])  # Suffix links
+        self.end = array("i", [-1])  # Some earlier end position of each state
+        self.next = array("i", [-1] * 9)  # 9 transitions per state
+        self.last = 0
+        for symbol in symbols:
+            self._extend(symbol)
+
+    def _new_state(self, length: int, end: int, link: int) -> int:
+        self.length.append(length)
+        self.end.append(end)
+        self.link.append(link)
+        self.next.extend(_NO_TRANSITIONS)
+        return len(self.length) - 1
+
+    def _extend(self, symbol: int):
+        """Standard online suffix automaton construction step."""
+        nxt, link, length = self.next, self.link, self.length
+        pos = len(self.symbols)
+        self.symbols.append(symbol)
+        cur = self._new_state(length[self.last] + 1, pos, 0)
+        p = self.last
+        while p != -1 and nxt[p * 9 + symbol] == -1:
+            nxt[p * 9 + symbol] = cur
+            p = link[p]
+        if p != -1:
+            q = nxt[p * 9 + symbol]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else:
+                clone = self._new_state(length[p] + 1, self.end[q], link[q])
+                nxt[clone * 9 : clone * 9 + 9] = nxt[q * 9 : q * 9 + 9]
+                while p != -1 and nxt[p * 9 + symbol] == q:
+                    nxt[p * 9 + symbol] = clone
+                    p = link[p]
+                link[q] = link[cur] = clone
+        self.last = cur
+
+    def make_move(self, opponent_history: List[Move]) -> Move:
+        # Add the rounds finished since the last move (both moves known)
+        finished = min(len(self.move_history), len(opponent_history))
+        if finished > self.rounds_seen:
+            for i in range(self.rounds_seen, finished):
+                if len(self.symbols) >= self.MAX_ROUNDS:
+                    self._reset(self.symbols[self.MAX_ROUNDS // 2 :])
+                mine = _INDEX[self.move_history[i]]
+                self._extend(mine * 3 + _INDEX[opponent_history[i]])
+            self.rounds_seen = finished
+
+            state = self.link[self.last]
+            if state > 0:
+                # What followed the earlier match; next time use this latest one
+                self.expected = self.symbols[self.end[state] + 1] % 3
+                self.end[state] = len(self.symbols) - 1
+            else:  # Nothing has repeated yet
+                self.expected = -1
+
+        if self.expected < 0:
+            return random.choice(_MOVES)
+        return _MOVES[_LOSES_TO[self.expected]]
+
+
+class EnsembleAI(AIPlayer):
+    """Iocaine Powder style ensemble of predictors.
+
+    Every round each predictor guesses the opponent's next move and (from
+    the opponent's side) this AI's own next move. The predictors are the
+    other AIs' ideas made incremental: most common move (Pattern Pete),
+    most common of the last WINDOW moves (Adaptive Ada), winners repeat and
+    losers switch to Rock (Mind Reader Mike), plus "repeats the last move"
+    and history matching: what followed the last occurrence of the latest
+    1..MATCH_ORDER rounds of their moves, my moves and both.
+
+    Each guess becomes three strategies by second-guessing: beat the guess,
+    beat the counter to it, or beat the counter to that. Every strategy is
+    scored by how it would have done with decays of several lengths, and
+    each horizon backs its best strategy. The horizons are scored in turn
+    and the best one plays, unless none has been winning lately, in which
+    case the AI plays randomly. All scores update in O(#strategies) a round.
+    """
+
+    WINDOW = 10
+    MATCH_ORDER = 4
+    DECAYS = (0.5, 0.8, 0.95, 0.99)
+    META_DECAY = 0.9
+
+    def __init__(self, name: str, personality: str):
+        super().__init__(name, personality)
+        self.rounds_seen = 0
+        # Per player (0 = opponent, 1 = me): all-time and recent move counts
+        self.counts = [0] * 6
+        self.recent = [0] * 6
+        self.last_result = 0  # Opponent's last round: 1 won, -1 lost, 0 tie
+        # Rolling codes of the last MATCH_ORDER rounds: theirs, mine, joint
+        self.codes = [0, 0, 0]
+        # Per sequence and order, the round that followed each context (0: none)
+        self.followers = [
+            array("i", bytes(4 * bases**k))
+            for bases in (3, 3, 9)
+            for k in range(1, self.MATCH_ORDER + 1)
+        ]
+        predictions = 2 * (4 + len(self.followers))
+        self.strategy_moves = [-1] * (3 * predictions)
+        self.scores = array("d", bytes(8 * len(self.DECAYS) * 3 * predictions))
+        self.horizon_moves = [-1] * len(self.DECAYS)
+        self.meta_scores = array("d", bytes(8 * len(self.DECAYS)))
+
+    def _score(self, theirs: int):
+        """Credit every strategy with how its last move did against ``theirs``."""
+        strategies = len(self.strategy_moves)
+        scores = self.scores
+        for h, decay in enumerate(self.DECAYS):
+            offset = h * strategies
+            for s, move in enumerate(self.strategy_moves):
+                if move >= 0:
+                    i = offset + s
+                    scores[i] = scores[i] * decay + _PAYOFF[(move - theirs) % 3]
+        for h, move in enumerate(self.horizon_moves):
+            if move >= 0:
+                self.meta_scores[h] = (
+                    self.meta_scores[h] * self.META_DECAY
+                    + _PAYOFF[(move - theirs) % 3]
+                )
+
+    def _learn(self, i: int, history: List[Move], opponent_history: List[Move]):
+        """Fold round ``i`` into the predictors' state."""
+        theirs, mine = _INDEX[opponent_history[i]], _INDEX[history[i]]
+        counts, recent = self.counts, self.recent
+        counts[theirs] += 1
+        counts[3 + mine] += 1
+        recent[theirs] += 1
+        recent[3 + mine] += 1
+        if i >= self.WINDOW:
+            recent[_INDEX[opponent_history[i - self.WINDOW]]] -= 1
+            recent[3 + _INDEX[history[i - self.WINDOW]]] -= 1
+        self.last_result = _PAYOFF[(theirs - mine) % 3]
+
+        # Record round i as what followed each context ending at round i - 1
+        order = self.MATCH_ORDER
+        known = min(i, order)
+        for seq, (code, base) in enumerate(zip(self.codes, (3, 3, 9))):
+            modulus = 1
+            for k in range(1, known + 1):
+                modulus *= base
+                self.followers[seq * order + k - 1][code % modulus] = i
+        self.codes[0] = (self.codes[0] * 3 + theirs) % 3**order
+        self.codes[1] = (self.codes[1] * 3 + mine) % 3**order
+        self.codes[2] = (self.codes[2] * 9 + mine * 3 + theirs) % 9**order
+
+    def _predict(self, history: List[Move], opponent_history: List[Move]) -> List[int]:
+        """Guesses as (opponent's move, my move) pairs, -1 where there's none."""
+        n = self.rounds_seen
+        if n == 0:
+            return [-1] * (len(self.strategy_moves) // 3)
+        counts, recent = self.counts, self.recent
+        their_last, my_last = _INDEX[opponent_history[n - 1]], _INDEX[history[n - 1]]
+        guesses = [
+            max(range(3), key=counts.__getitem__),
+            max(range(3, 6), key=counts.__getitem__) - 3,
+            max(range(3), key=recent.__getitem__),
+            max(range(3, 6), key=recent.__getitem__) - 3,
+            their_last,
+            my_last,
+        ]
+        # Winners repeat, losers go to Rock, a tie is anyone's guess
+        rock = _INDEX[Move.ROCK]
+        result = self.last_result
+        guesses.append(their_last if result > 0 else rock if result < 0 else -1)
+        guesses.append(my_last if result < 0 else rock if result > 0 else -1)
+
+        order = self.MATCH_ORDER
+        for seq, (code, base) in enumerate(zip(self.codes, (3, 3, 9))):
+            modulus = 1
+            for k in range(1, order + 1):
+                modulus *= base
+                follower = self.followers[seq * order + k - 1][code % modulus]
+                if k <= n and follower:
+                    guesses.append(_INDEX[opponent_history[follower]])
+                    guesses.append(_INDEX[history[follower]])
+                else:
+                    guesses.extend((-1, -1))
+        return guesses
+
+    def make_move(self, opponent_history: List[Move]) -> Move:
+        finished = min(len(self.move_history), len(opponent_history))
+        if finished > self.rounds_seen:
+            for i in range(self.rounds_seen, finished):
+                self._score(_INDEX[opponent_history[i]])
+                self._learn(i, self.move_history, opponent_history)
+            self.rounds_seen = finished
+
+            # Beat their guessed move / beat their counter to my guessed move,
+            # then the two second-guessing rotations of each
+            moves = self.strategy_moves
+            guesses = self._predict(self.move_history, opponent_history)
+            for g, guess in enumerate(guesses):
+                shift = 1 if g % 2 == 0 else 2
+                for r in range(3):
+                    moves[3 * g + r] = (guess + shift + r) % 3 if guess >= 0 else -1
+
+            strategies = len(moves)
+            scores = self.scores
+            for h in range(len(self.DECAYS)):
+                offset = h * strategies
+                best, best_score = -1, 0.0
+                for s, move in enumerate(moves):
+                    if move >= 0 and (best < 0 or scores[offset + s] > best_score):
+                        best, best_score = move, scores[offset + s]
+                self.horizon_moves[h] = best
+
+        h = max(range(len(self.DECAYS)), key=self.meta_scores.__getitem__)
+        if self.meta_scores[h] <= 0 or self.horizon_moves[h] < 0:
+            return random.choice(_MOVES)
+        return _MOVES[self.horizon_moves[h]]
+
+
+class BanditAI(AIPlayer):
+    """AI that treats simple strategies as the arms of a multi-armed bandit.
+
+    The nine arms are: always Rock, Paper or Scissors; beat, copy or lose
+    to the opponent's last move; and beat, copy or lose to its own last
+    move. Each round the AI pulls one arm and learns only from how that arm
+    did (1 for a win, 1/2 for a tie, 0 for a loss) via ``record_result``.
+    Subclasses pick the arm; state and work per round are fixed by the
+    number of arms, not the length of the match.
+    """
+
+    ARMS = 9
+    _REWARDS = {GameResult.WIN: 1.0, GameResult.TIE: 0.5, GameResult.LOSE: 0.0}
+
+    def __init__(self, name: str, personality: str):
+        super().__init__(name, personality)
+        self.arm = -1  # Arm pulled for the current round
+        self.their_last = -1
+        self.my_last = -1
+
+    def _arm_move(self, arm: int) -> int:
+        if arm < 3:
+            return arm
+        last = self.their_last if arm < 6 else self.my_last
+        return (last + 1 + arm % 3) % 3  # Beat it, lose to it, copy it
+
+    def _choose_arm(self) -> int:
+        raise NotImplementedError
+
+    def _reward(self, arm: int, reward: float):
+        raise NotImplementedError
+
+    def make_move(self, opponent_history: List[Move]) -> Move:
+        if self.their_last < 0:  # First round: the relative arms mean nothing
+            self.arm = random.randrange(3)
+        else:
+            self.arm = self._choose_arm()
+        return _MOVES[self._arm_move(self.arm)]
+
+    def record_result(self, my_move: Move, opponent_move: Move, result: GameResult):
+        if self.arm >= 0:
+            self._reward(self.arm, self._REWARDS[result])
+        self.their_last, self.my_last = _INDEX[opponent_move], _INDEX[my_move]
+
+
+class Exp3AI(BanditAI):
+    """EXP3: samples arms from exponential weights, mixed with exploration.
+
+    The weights are kept as logarithms, shifted so the largest is 0, so
+    they never overflow however long the match runs.
+    """
+
+    GAMMA = 0.1  # Share of rounds spent exploring uniformly
+
+    def __init__(self, name: str, personality: str):
+        super().__init__(name, personality)
+        self.log_weights = [0.0] * self.ARMS
+        self.probabilities = [1.0 / self.ARMS] * self.ARMS
+
+    def _choose_arm(self) -> int:
+        return random.choices(range(self.ARMS), weights=self.probabilities)[0]
+
+    def _reward(self, arm: int, reward: float):
+        # Importance-weighted estimate: rarely pulled arms count for more
+        estimate = reward / self.probabilities[arm]
+        self.log_weights[arm] += self.GAMMA * estimate / self.ARMS
+        top = max(self.log_weights)
+        weights = [math.exp(w - top) for w in self.log_weights]
+        total = sum(weights)
+        self.log_weights = [w - top for w in self.log_weights]
+        self.probabilities = [
+            (1 - self.GAMMA) * w / total + self.GAMMA / self.ARMS for w in weights
+        ]
+
+
+class DiscountedUCBAI(BanditAI):
+    """Discounted UCB: the arm with the best optimistic recent average.
+
+    Every round all pull counts and reward sums shrink by DISCOUNT, so
+    results from long ago fade and the AI follows an opponent who changes
+    tactics.
+    """
+
+    DISCOUNT = 0.98
+    EXPLORATION = 0.3
+
+    def __init__(self, name: str, personality: str):
+        super().__init__(name, personality)
+        self.pulls = [0.0] * self.ARMS
+        self.rewards = [0.0] * self.ARMS
+
+    def _choose_arm(self) -> int:
+        untried = [arm for arm in range(self.ARMS) if self.pulls[arm] == 0]
+        if untried:
+            return random.choice(untried)
+        log_total = math.log(sum(self.pulls))
+        bounds = [
+            self.rewards[arm] / self.pulls[arm]
+            + self.EXPLORATION * math.sqrt(max(log_total, 0.0) / self.pulls[arm])
+            for arm in range(self.ARMS)
+        ]
+        return max(range(self.ARMS), key=bounds.__getitem__)
+
+    def _reward(self, arm: int, reward: float):
+        for i in range(self.ARMS):
+            self.pulls[i] *= self.DISCOUNT
+            self.rewards[i] *= self.DISCOUNT
+        self.pulls[arm] += 1
+        self.rewards[arm] += reward
+
+
 # AI opponents with personalities
 AI_OPPONENTS: List[dict] = [
     {
@@ -264,6 +714,36 @@ AI_OPPONENTS: List[dict] = [
         "personality": "I know what you're thinking! Psychology and math are on my side.",
         "difficulty": "Expert",
     },
+    {
+        "class": MarkovAI,
+        "name": "Markov Marge",
+        "personality": "Your last few moves already told me your next one.",
+        "difficulty": "Expert",
+    },
+    {
+        "class": HistoryMatchAI,
+        "name": "Deja Vu Dana",
+        "personality": "I've seen this exact sequence before. I remember how it ended.",
+        "difficulty": "Expert",
+    },
+    {
+        "class": EnsembleAI,
+        "name": "Vizzini",
+        "personality": "I know that you know that I know... so clearly not Rock!",
+        "difficulty": "Expert",
+    },
+    {
+        "class": DiscountedUCBAI,
+        "name": "Bandit Betty",
+        "personality": "I keep score of every trick I know and play the one that pays.",
+        "difficulty": "Hard",
+    },
+    {
+        "class": Exp3AI,
+        "name": "Gambler Gus",
+        "personality": "I spread my bets, follow the winners, and never go all in.",
+        "difficulty": "Hard",
+    },
 ]
 
 
@@ -0,0 +1,311 @@
+"""In-process audio playback: preloaded PCM clips played by a background worker."""
+
+import io
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+from typing import Dict, Optional, Set, Tuple
+
+from src import metrics
+
+SOUND_LATENCY = metrics.histogram(
+    "rps_sound_latency_seconds",
+    "Time from a sound being requested to it starting to play",
+    buckets=metrics.FAST_BUCKETS,
+)
+SOUND_REQUESTS = metrics.counter(
+    "rps_sound_requests_total",
+    "Sound requests, by outcome (queued, merged, dropped)",
+    ["outcome"],
+)
+
+
+class AudioUnavailable(Exception):
+    """Raised by a sink when the audio device has gone away."""
+
+
+class Clip:
+    """Decoded PCM audio held in memory."""
+
+    def __init__(
+        self, pcm: bytes, sample_rate: int, channels: int = 1, sample_width: int = 2
+    ):
+        self.pcm = pcm
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self._wav_bytes: Optional[bytes] = None
+
+    @property
+    def duration(self) -> float:
+        """Length of the clip in seconds."""
+        frame_size = self.channels * self.sample_width
+        return len(self.pcm) / (frame_size * self.sample_rate)
+
+    def to_wav_bytes(self) -> bytes:
+        """Encode as an in-memory WAV file (cached after the first call)."""
+        if self._wav_bytes is None:
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav:
+                wav.setnchannels(self.channels)
+                wav.setsampwidth(self.sample_width)
+                wav.setframerate(self.sample_rate)
+                wav.writeframes(self.pcm)
+            self._wav_bytes = buffer.getvalue()
+        return self._wav_bytes
+
+    @classmethod
+    def from_wav_file(cls, path: str) -> "Clip":
+        """Read a whole WAV file into memory."""
+        with wave.open(path, "rb") as wav:
+            return cls(
+                wav.readframes(wav.getnframes()),
+                wav.getframerate(),
+                wav.getnchannels(),
+                wav.getsampwidth(),
+            )
+
+
+class NullSink:
+    """Sink that discards everything (no audio device, CI, muted)."""
+
+    name = "null"
+
+    def play(self, clip: Clip):
+        pass
+
+    def close(self):
+        pass
+
+
+class WinsoundSink:
+    """Windows playback straight from memory via winsound."""
+
+    name = "winsound"
+
+    def __init__(self):
+        import winsound
+
+        self._winsound = winsound
+
+    def play(self, clip: Clip):
+        self._winsound.PlaySound(clip.to_wav_bytes(), self._winsound.SND_MEMORY)
+
+    def close(self):
+        pass
+
+
+class SimpleaudioSink:
+    """Cross-platform playback via the optional ``simpleaudio`` package."""
+
+    name = "simpleaudio"
+
+    def __init__(self):
+        import simpleaudio
+
+        self._simpleaudio = simpleaudio
+
+    def play(self, clip: Clip):
+        self._simpleaudio.play_buffer(
+            clip.pcm, clip.channels, clip.sample_width, clip.sample_rate
+        ).wait_done()
+
+    def close(self):
+        pass
+
+
+class AplayStreamSink:
+    """Linux playback through a single long-lived ``aplay`` reading raw PCM.
+
+    The process is started once; every clip is just written to its stdin, so
+    there is no process spawn per sound.
+    """
+
+    name = "aplay"
+
+    def __init__(self, sample_rate: int, channels: int, sample_width: int):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self._process = subprocess.Popen(
+            [
+                "aplay",
+                "-q",
+                "-t",
+                "raw",
+                "-f",
+                f"S{8 * sample_width}_LE",
+                "-r",
+                str(sample_rate),
+                "-c",
+                str(channels),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def play(self, clip: Clip):
+        if (clip.sample_rate, clip.channels, clip.sample_width) != (
+            self.sample_rate,
+            self.channels,
+            self.sample_width,
+        ):
+            return  # The stream has a fixed format
+        if self._process.poll() is not None:
+            raise AudioUnavailable("aplay exited")
+        try:
+            self._process.stdin.write(clip.pcm)
+            self._process.stdin.flush()
+        except OSError as exc:
+            raise AudioUnavailable(str(exc)) from exc
+        # aplay buffers the write; wait it out so the queue reflects real backlog
+        time.sleep(clip.duration)
+
+    def close(self):
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+
+
+class AfplaySink:
+    """macOS fallback using ``afplay`` when simpleaudio is not installed.
+
+    afplay cannot read from a pipe, so this one still starts a process per
+    sound; it only runs on the worker thread, never on the UI.
+    """
+
+    name = "afplay"
+
+    def __init__(self):
+        self._paths: Dict[int, str] = {}
+
+    def play(self, clip: Clip):
+        path = self._paths.get(id(clip))
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".wav")
+            with os.fdopen(fd, "wb") as f:
+                f.write(clip.to_wav_bytes())
+            self._paths[id(clip)] = path
+        subprocess.run(["afplay", path], check=False, capture_output=True)
+
+    def close(self):
+        for path in self._paths.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def open_sink(sample_rate: int, channels: int = 1, sample_width: int = 2):
+    """Pick the best available audio sink, falling back to ``NullSink``.
+
+    Set ``RPS_AUDIO=off`` to force silence.
+    """
+    if os.environ.get("RPS_AUDIO", "").lower() in ("0", "off", "null", "none"):
+        return NullSink()
+
+    if sys.platform == "win32":
+        try:
+            return WinsoundSink()
+        except ImportError:
+            return NullSink()
+
+    try:
+        return SimpleaudioSink()
+    except ImportError:
+        pass
+
+    if sys.platform == "darwin":
+        return AfplaySink() if shutil.which("afplay") else NullSink()
+
+    if shutil.which("aplay"):
+        try:
+            return AplayStreamSink(sample_rate, channels, sample_width)
+        except OSError:
+            pass
+    return NullSink()
+
+
+class AudioPlayer:
+    """Plays named, preloaded clips from a background worker.
+
+    ``play`` never blocks: requests go through a small bounded queue, a
+    request for a clip that is already waiting is merged into it, and when
+    the queue is full the new request is dropped.
+    """
+
+    def __init__(self, sink, max_pending: int = 2):
+        self.sink = sink
+        self.clips: Dict[str, Clip] = {}
+        self.dropped = 0
+        self.merged = 0
+        # Items are (clip name, time requested)
+        self._queue: "queue.Queue[Optional[Tuple[str, float]]]" = queue.Queue(
+            maxsize=max_pending
+        )
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run, name="audio-player", daemon=True
+        )
+        self._worker.start()
+
+    def load(self, name: str, clip: Clip):
+        """Register a clip under ``name``."""
+        self.clips[name] = clip
+
+    def play(self, name: str) -> bool:
+        """Queue a clip for playback.
+
+        Returns:
+            True if the clip was queued, False if it was merged or dropped
+        """
+        if name not in self.clips:
+            return False
+        with self._lock:
+            if name in self._pending:
+                self.merged += 1
+                SOUND_REQUESTS.inc(outcome="merged")
+                return False
+            try:
+                self._queue.put_nowait((name, time.perf_counter()))
+            except queue.Full:
+                self.dropped += 1
+                SOUND_REQUESTS.inc(outcome="dropped")
+                return False
+            self._pending.add(name)
+        SOUND_REQUESTS.inc(outcome="queued")
+        return True
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            name, requested_at = item
+            with self._lock:
+                self._pending.discard(name)
+            SOUND_LATENCY.observe(time.perf_counter() - requested_at)
+            try:
+                self.sink.play(self.clips[name])
+            except AudioUnavailable:
+                self.sink = NullSink()
+            except Exception:
+                pass
+
+    def close(self):
+        """Stop the worker and release the sink."""
+        try:
+            self._queue.put(None, timeout=1)
+        except queue.Full:
+            pass
+        self._worker.join(timeout=1)  # Let a clip that's playing finish
+        self.sink.close()
@@ -0,0 +1,103 @@
+"""Live-updating battle view for AI vs AI battles."""
+
+import threading
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from rich import box
+from rich.console import Group
+from rich.panel import Panel
+from rich.table import Table
+
+from src.game import Game, GameResult, Move
+
+
+RESULT_TEXT = {
+    GameResult.WIN: "[bold green]WIN[/bold green]",
+    GameResult.LOSE: "[bold red]LOSS[/bold red]",
+    GameResult.TIE: "[yellow]TIE[/yellow]",
+}
+
+
+class BattleView:
+    """Renderable view of a battle: recent games plus a running score.
+
+    Only the last ``window`` games are kept, so each frame costs the same no
+    matter how long the battle runs. The view is meant to be handed to
+    ``rich.live.Live``, which renders it from its own refresh thread at a
+    capped frame rate while the battle loop keeps simulating.
+    """
+
+    def __init__(self, ai1_name: str, ai2_name: str, num_games: int, window: int = 15):
+        self.ai1_name = ai1_name
+        self.ai2_name = ai2_name
+        self.num_games = num_games
+        self.games_played = 0
+        self.ai1_wins = 0
+        self.ai2_wins = 0
+        self.ties = 0
+        self.rows: Deque[Tuple[str, str, str, str, str]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add_game(
+        self,
+        ai1_move: Move,
+        ai2_move: Move,
+        result: GameResult,
+        score: Optional[Tuple[int, int, int]] = None,
+    ):
+        """Record a finished game (result from AI 1's perspective).
+
+        Pass ``score`` (AI 1 wins, AI 2 wins, ties) to set the running totals
+        directly, e.g. when a spectator may have missed some games.
+        """
+        with self._lock:
+            if score is not None:
+                self.ai1_wins, self.ai2_wins, self.ties = score
+                self.games_played = sum(score)
+            else:
+                self.games_played += 1
+                if result == GameResult.WIN:
+                    self.ai1_wins += 1
+                elif result == GameResult.LOSE:
+                    self.ai2_wins += 1
+                else:
+                    self.ties += 1
+
+            self.rows.append(
+                (
+                    f"#{self.games_played}",
+                    f"{Game.get_move_emoji(ai1_move)} {ai1_move}",
+                    RESULT_TEXT[result],
+                    f"{Game.get_move_emoji(ai2_move)} {ai2_move}",
+                    f"{self.ai1_wins}-{self.ai2_wins}-{self.ties}",
+                )
+            )
+
+    def __rich__(self) -> Group:
+        with self._lock:
+            rows = list(self.rows)
+            games_played = self.games_played
+            ai1_wins, ai2_wins, ties = self.ai1_wins, self.ai2_wins, self.ties
+
+        results_display = Table(
+            show_header=True, box=box.ROUNDED, style="cyan", title="Battle Results"
+        )
+        results_display.add_column("Game", justify="center", style="bold", min_width=8)
+        results_display.add_column(self.ai1_name, justify="center", style="green")
+        results_display.add_column("Result", justify="center", width=10)
+        results_display.add_column(self.ai2_name, justify="center", style="yellow")
+        results_display.add_column("Score", justify="center", min_width=14)
+
+        for row in rows:
+            results_display.add_row(*row)
+
+        score_panel = Panel(
+            f"[bold green]{self.ai1_name}: {ai1_wins}[/bold green]  |  "
+            f"[bold yellow]{self.ai2_name}: {ai2_wins}[/bold yellow]  |  "
+            f"Ties: {ties}",
+            title=f"Score After Game {games_played}/{self.num_games}",
+            style="cyan",
+        )
+
+        return Group(results_display, score_panel)
@@ -0,0 +1,206 @@
+"""Checkpoints for long-running tournaments.
+
+A checkpoint holds everything needed to carry on exactly where a
+tournament stopped: its settings, its progress (standings, which matchups
+are done), the state of any matchup in progress, including both AIs'
+learned state (``AIPlayer.get_state``), and the shared RNG's state.
+
+Checkpoints are gzipped JSON. ``Checkpointer.save`` writes to a temporary
+file, syncs it to disk and renames it over the previous checkpoint, so a
+crash or power cut mid-write leaves the last complete checkpoint in place.
+
+Move histories are stored one letter per move and learned tables keyed by
+``Move`` are tagged so they come back with ``Move`` keys.
+"""
+
+import array
+import base64
+import gzip
+import json
+import os
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from src.ai import AIPlayer
+from src.engine import Matchup
+from src.game import Move
+
+CHECKPOINT_VERSION = 1
+# Seconds between checkpoints while a tournament runs
+DEFAULT_INTERVAL = 30.0
+
+_LETTERS = {Move.ROCK: "r", Move.PAPER: "p", Move.SCISSORS: "s"}
+_FROM_LETTER = {letter: move for move, letter in _LETTERS.items()}
+_BY_VALUE = {move.value: move for move in Move}
+
+
+def encode(value: Any) -> Any:
+    """A JSON-able form of an AI attribute (see ``decode``)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Move):
+        return {"$move": value.value}
+    if isinstance(value, list):
+        if value and all(isinstance(item, Move) for item in value):
+            return {"$moves": "".join(_LETTERS[move] for move in value)}
+        return [encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"$tuple": [encode(item) for item in value]}
+    if isinstance(value, dict):
+        if value and all(isinstance(key, Move) for key in value):
+            return {"$by_move": {k.value: encode(v) for k, v in value.items()}}
+        if all(isinstance(key, str) for key in value):
+            return {"$dict": {k: encode(v) for k, v in value.items()}}
+    if isinstance(value, array.array):
+        data = base64.b64encode(value.tobytes()).decode("ascii")
+        return {"$array": [value.typecode, data]}
+    if isinstance(value, (bytes, bytearray)):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"can't checkpoint a {type(value).__name__}")
+
+
+def decode(value: Any) -> Any:
+    """Undo ``encode``."""
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    (tag, data), = value.items()
+    if tag == "$move":
+        return _BY_VALUE[data]
+    if tag == "$moves":
+        return [_FROM_LETTER[letter] for letter in data]
+    if tag == "$tuple":
+        return tuple(decode(item) for item in data)
+    if tag == "$by_move":
+        return {_BY_VALUE[k]: decode(v) for k, v in data.items()}
+    if tag == "$dict":
+        return {k: decode(v) for k, v in data.items()}
+    if tag == "$array":
+        typecode, encoded = data
+        restored = array.array(typecode)
+        restored.frombytes(base64.b64decode(encoded))
+        return restored
+    if tag == "$bytes":
+        return bytearray(base64.b64decode(data))
+    raise ValueError(f"unknown checkpoint tag {tag!r}")
+
+
+def ai_state(ai: AIPlayer) -> Dict:
+    return {name: encode(value) for name, value in ai.get_state().items()}
+
+
+def restore_ai(ai: AIPlayer, state: Dict):
+    ai.set_state({name: decode(value) for name, value in state.items()})
+
+
+def matchup_state(matchup: Matchup) -> Dict:
+    """A matchup in progress: score, histories and both AIs' state."""
+    return {
+        "score": list(matchup.score),
+        "ai1_history": encode(matchup.ai1_history),
+        "ai2_history": encode(matchup.ai2_history),
+        "ai1": ai_state(matchup.ai1),
+        "ai2": ai_state(matchup.ai2),
+    }
+
+
+def restore_matchup(matchup: Matchup, state: Dict):
+    """Put a freshly built matchup back where ``matchup_state`` left it."""
+    matchup.ai1_wins, matchup.ai2_wins, matchup.ties = state["score"]
+    matchup.ai1_history = decode(state["ai1_history"]) or []
+    matchup.ai2_history = decode(state["ai2_history"]) or []
+    restore_ai(matchup.ai1, state["ai1"])
+    restore_ai(matchup.ai2, state["ai2"])
+
+
+def restore_random(checkpoint: Dict):
+    """Set the shared RNG to its state when ``checkpoint`` was saved."""
+    version, internal, gauss = checkpoint["random"]
+    random.setstate((version, tuple(internal), gauss))
+
+
+def load_checkpoint(path: str) -> Dict:
+    """Read a checkpoint: ``kind``, ``config``, ``progress`` and more."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, EOFError, json.JSONDecodeError) as exc:
+        raise ValueError(f"{path} is not a readable checkpoint ({exc})") from None
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {checkpoint.get('version')}")
+    return checkpoint
+
+
+class Checkpointer:
+    """Saves one tournament's checkpoints to ``path``.
+
+    ``due`` says whether ``interval`` seconds have passed since the last
+    save; callers check it at points where the tournament is consistent.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        kind: str,
+        config: Dict,
+        interval: float = DEFAULT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = path
+        self.kind = kind
+        self.config = config
+        self.interval = interval
+        self.clock = clock
+        self.saves = 0
+        self._last = clock()
+
+    def due(self) -> bool:
+        return self.clock() - self._last >= self.interval
+
+    def save(self, progress: Dict):
+        version, internal, gauss = random.getstate()
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "kind": self.kind,
+            "saved": datetime.now().isoformat(timespec="seconds"),
+            "config": self.config,
+            "progress": progress,
+            "random": [version, list(internal), gauss],
+        }
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(json.dumps(checkpoint, separators=(",", ":")).encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())  # On disk before it replaces the old one
+        os.replace(temp_path, self.path)
+        self.saves += 1
+        self._last = self.clock()
+
+    def clear(self):
+        """Remove the checkpoint once the tournament has finished."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def describe(checkpoint: Dict) -> Optional[str]:
+    """One line about a checkpoint for resume prompts."""
+    progress = checkpoint["progress"]
+    if checkpoint["kind"] == "round_robin":
+        return (
+            f"round robin, {progress['next_matchup']} of "
+            f"{progress['matchups']} matchups done"
+        )
+    if checkpoint["kind"] == "swiss":
+        return (
+            f"Swiss, {checkpoint['config']['entrants']} entrants, "
+            f"{progress['matchups_played']} matchups played "
+            f"(round {progress['round']}/{checkpoint['config']['rounds']})"
+        )
+    return None
@@ -0,0 +1,201 @@
+"""Thin client for the online game server.
+
+Run a terminal client with ``python -m src.client --name bob``; the TUI's
+"Play Online" mode and the tools under ``benchmarks/`` use ``GameClient``
+and ``play_match`` directly.
+"""
+
+import argparse
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.game import Move
+from src.protocol import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, decode, encode
+
+
+class ConnectionClosed(Exception):
+    """The server closed the connection."""
+
+
+class GameClient:
+    """Newline-delimited JSON connection to a ``GameServer``."""
+
+    def __init__(self):
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self._reader, self._writer = await asyncio.open_connection(
+            host, port, limit=MAX_LINE
+        )
+
+    async def send(self, message: Dict):
+        self._writer.write(encode(message))
+        await self._writer.drain()
+
+    async def recv(self) -> Dict:
+        """Read the next message from the server."""
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionClosed()
+        return decode(line)
+
+    async def hello(self, name: str) -> Dict:
+        """Introduce ourselves; returns the server's reply."""
+        await self.send({"type": "hello", "name": name})
+        return await self.recv()
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def play_match(
+    client: GameClient,
+    choose_move: Callable[[Dict], Awaitable[Move]],
+    on_event: Callable[[Dict], Awaitable[None]],
+    allow_bots: bool = True,
+) -> Dict:
+    """Queue for a match and play it to the end.
+
+    ``choose_move`` is awaited with each ``round_start`` message and returns
+    the move to submit; every other server message is passed to ``on_event``.
+    Messages keep being read while ``choose_move`` runs: if the round times
+    out first (its ``round_result`` arrives), the prompt is cancelled and
+    its answer never sent. With ``allow_bots=False`` the server only pairs
+    us with another client.
+
+    Returns:
+        The ``match_end`` message
+    """
+    message = {"type": "play"}
+    if not allow_bots:
+        message["bots"] = False
+    await client.send(message)
+
+    receive: Optional[asyncio.Task] = None
+    prompt: Optional[asyncio.Task] = None  # choose_move for the current round
+    prompt_round = None
+    try:
+        while True:
+            if receive is None:
+                receive = asyncio.ensure_future(client.recv())
+            waiting = {receive} if prompt is None else {receive, prompt}
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            if receive.done():
+                message = receive.result()
+                receive = None
+                if message["type"] == "round_start":
+                    if prompt is not None:
+                        prompt.cancel()
+                    prompt = asyncio.ensure_future(choose_move(message))
+                    prompt_round = message["round"]
+                    continue
+                if (
+                    message["type"] in ("round_result", "match_end")
+                    and prompt is not None
+                    and message.get("round", prompt_round) == prompt_round
+                ):
+                    prompt.cancel()  # Too late: the round is over
+                    prompt = None
+                await on_event(message)
+                if message["type"] == "match_end":
+                    return message
+
+            if prompt is not None and prompt.done():
+                move = prompt.result()
+                prompt = None
+                await client.send(
+                    {"type": "move", "round": prompt_round, "move": move.value}
+                )
+    finally:
+        for task in (receive, prompt):
+            if task is not None:
+                task.cancel()
+
+
+async def _run(args):
+    from rich.console import Console
+    from rich.prompt import Prompt
+
+    from src.tasks import run_blocking
+
+    console = Console()
+    move_map = {"1": Move.ROCK, "2": Move.PAPER, "3": Move.SCISSORS}
+
+    # A prompt left open by a round that timed out keeps reading the
+    # terminal, so it answers the next round instead of a second prompt
+    prompt: List[asyncio.Future] = []
+
+    async def choose_move(message: Dict) -> Move:
+        console.print(
+            f"\n[bold]Round {message['round']}[/bold] "
+            f"[dim]({message['timeout']:.0f}s to choose)[/dim]"
+        )
+        console.print("1. 🪨 Rock   2. 📄 Paper   3. ✂️  Scissors")
+        if prompt and not prompt[0].done():
+            console.print("Your choice [1/2/3]: ", end="", markup=False)
+        else:
+            prompt[:] = [
+                asyncio.ensure_future(
+                    run_blocking(Prompt.ask, "Your choice", choices=["1", "2", "3"])
+                )
+            ]
+        return move_map[await asyncio.shield(prompt[0])]
+
+    async def on_event(message: Dict):
+        kind = message["type"]
+        if kind == "waiting":
+            console.print("[yellow]Waiting for an opponent...[/yellow]")
+        elif kind == "match_start":
+            console.print(
+                f"\n[bold cyan]Match {message['match']}: you vs "
+                f"{message['opponent']} ({message['rounds']} rounds)[/bold cyan]"
+            )
+        elif kind == "round_result":
+            wins, losses, ties = message["score"]
+            console.print(
+                f"You: {message['your_move'] or '-'}  |  "
+                f"Opponent: {message['opponent_move'] or '-'}  ->  "
+                f"[bold]{message['result'].upper()}[/bold]  "
+                f"(score {wins}-{losses}-{ties})"
+            )
+        elif kind == "match_end":
+            console.print(
+                f"\n[bold]Match over: {message['result'].upper()}[/bold] "
+                f"[dim]({message['reason']})[/dim]"
+            )
+        elif kind == "error":
+            console.print(f"[red]Server: {message['message']}[/red]")
+
+    client = GameClient()
+    await client.connect(args.host, args.port)
+    try:
+        await client.hello(args.name)
+        await play_match(client, choose_move, on_event)
+    finally:
+        await client.close()
+
+
+def main(argv=None):
+    """Command-line entry point: ``python -m src.client``."""
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors online client")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--name", required=True, help="Your player name")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_run(args))
+    except (KeyboardInterrupt, ConnectionClosed):
+        print("\nDisconnected.")
+    except OSError as exc:
+        print(f"Could not connect to {args.host}:{args.port}: {exc}")
+
+
+if __name__ == "__main__":
+    main()
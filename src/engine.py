@@ -0,0 +1,85 @@
+"""Headless AI vs AI matchups, shared by the TUI, tournaments and tools."""
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from src.ai import AIPlayer
+from src.game import Game, GameResult, Move
+
+if TYPE_CHECKING:
+    from src.profiling import Profiler
+
+_FLIPPED = {
+    GameResult.WIN: GameResult.LOSE,
+    GameResult.LOSE: GameResult.WIN,
+    GameResult.TIE: GameResult.TIE,
+}
+
+
+class Matchup:
+    """Two AIs playing a series of games, scored from AI 1's side.
+
+    Each AI sees the other's move history up to the previous game, so both
+    choose blind and neither seat has an edge; the TUI's battle and
+    tournament modes play through here too. Pass a ``profiler`` to time both AIs'
+    decisions (see ``src/profiling.py``).
+    """
+
+    def __init__(
+        self, ai1: AIPlayer, ai2: AIPlayer, profiler: Optional["Profiler"] = None
+    ):
+        if profiler is not None:
+            profiler.instrument(ai1)
+            profiler.instrument(ai2)
+        self.ai1 = ai1
+        self.ai2 = ai2
+        self.ai1_history: List[Move] = []
+        self.ai2_history: List[Move] = []
+        self.ai1_wins = 0
+        self.ai2_wins = 0
+        self.ties = 0
+
+    @property
+    def games_played(self) -> int:
+        return self.ai1_wins + self.ai2_wins + self.ties
+
+    @property
+    def score(self) -> Tuple[int, int, int]:
+        """(AI 1 wins, AI 2 wins, ties)"""
+        return (self.ai1_wins, self.ai2_wins, self.ties)
+
+    @property
+    def winner(self) -> Optional[AIPlayer]:
+        """The AI that won more games, or None for a draw."""
+        if self.ai1_wins > self.ai2_wins:
+            return self.ai1
+        if self.ai2_wins > self.ai1_wins:
+            return self.ai2
+        return None
+
+    def play_game(self) -> Tuple[Move, Move, GameResult]:
+        """Play one game; returns both moves and the result for AI 1."""
+        ai1_move = self.ai1.make_move(self.ai2_history)
+        self.ai1.record_move(ai1_move)
+        # AI 2 mustn't see AI 1's move for this game
+        ai2_move = self.ai2.make_move(self.ai1_history)
+        self.ai2.record_move(ai2_move)
+        self.ai1_history.append(ai1_move)
+        self.ai2_history.append(ai2_move)
+
+        result = Game.determine_winner(ai1_move, ai2_move)
+        self.ai1.record_result(ai1_move, ai2_move, result)
+        self.ai2.record_result(ai2_move, ai1_move, _FLIPPED[result])
+
+        if result == GameResult.WIN:
+            self.ai1_wins += 1
+        elif result == GameResult.LOSE:
+            self.ai2_wins += 1
+        else:
+            self.ties += 1
+        return ai1_move, ai2_move, result
+
+    def play(self, games: int) -> "Matchup":
+        """Play ``games`` more games without any display."""
+        for _ in range(games):
+            self.play_game()
+        return self
@@ -3,6 +3,13 @@
 from enum import Enum
 from typing import List
 
+from src import metrics
+
+# Labelled by mode: vs_ai, vs_human, online, ai_battle, tournament, server
+ROUNDS_PLAYED = metrics.counter(
+    "rps_rounds_total", "Rounds played, by game mode", ["mode"]
+)
+
 
 class Move(Enum):
     """Possible moves in Rock Paper Scissors."""
@@ -0,0 +1,340 @@
+"""Read-only JSON HTTP API for the leaderboard and online match history.
+
+Endpoints (``GET`` or ``HEAD``):
+
+    /leaderboard?limit=10     top players, best first
+    /players/<name>           one player's stats (404 if unknown)
+    /matches?limit=20         most recent online matches, newest first
+    /metrics                  all metrics in the Prometheus text format
+
+Every response carries an ``ETag``; send it back in ``If-None-Match`` to get
+an empty ``304 Not Modified`` when nothing changed. Run it on its own with
+``python -m src.http_api`` or next to the game server with
+``python -m src.server --http-port 8080``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src import metrics
+from src.leaderboard import Leaderboard, LeaderboardEntry
+from src.protocol import DEFAULT_HOST
+
+if TYPE_CHECKING:
+    from src.server import GameServer
+
+DEFAULT_HTTP_PORT = 8080
+MAX_LIMIT = 100
+MAX_HEADERS = 64
+
+JSON_TYPE = "application/json"
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+class CachedResponse:
+    """A serialized response body and the version it was built from."""
+
+    __slots__ = ("version", "created", "body", "etag", "content_type")
+
+    def __init__(
+        self,
+        version: Hashable,
+        created: float,
+        body: bytes,
+        content_type: str = JSON_TYPE,
+    ):
+        self.version = version
+        self.created = created
+        self.body = body
+        self.content_type = content_type
+        self.etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+class ResponseCache:
+    """Serialized responses, reused until the data they came from changes.
+
+    Each entry remembers the version of its source data. A lookup with the
+    same version is a hit; so is one made within ``max_stale`` seconds of
+    the entry being built, so a steady stream of writes can't force a
+    rebuild on every read. The cache holds at most ``max_entries``
+    responses, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_stale: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+
+    def get(
+        self, key: Hashable, version: Hashable, build: Callable[[], object]
+    ) -> CachedResponse:
+        """Return the response for ``key``, calling ``build`` if it's stale."""
+        now = self.clock()
+        cached = self._entries.get(key)
+        if cached is not None and (
+            cached.version == version or now - cached.created < self.max_stale
+        ):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        cached = CachedResponse(version, now, _to_json(build()))
+        self._entries[key] = cached
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return cached
+
+
+def _to_json(data) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _entry_json(entry: LeaderboardEntry) -> Dict:
+    data = entry.to_dict()
+    data["total_games"] = entry.total_games
+    data["win_rate"] = round(entry.win_rate, 1)
+    return data
+
+
+def _limit(query: Dict, default: int) -> int:
+    """The ``limit`` query parameter, clamped to 1..MAX_LIMIT."""
+    try:
+        value = int(query.get("limit", [default])[0])
+    except ValueError:
+        raise ValueError("limit must be an integer") from None
+    return max(1, min(value, MAX_LIMIT))
+
+
+class ApiServer:
+    """Minimal asyncio HTTP/1.1 server (keep-alive, GET/HEAD only).
+
+    With no ``leaderboard`` only ``/matches`` and ``/metrics`` are served,
+    which is how the TUI exposes its metrics (``--metrics-port``).
+    """
+
+    def __init__(
+        self,
+        leaderboard: Optional[Leaderboard],
+        game_server: Optional["GameServer"] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.leaderboard = leaderboard
+        self.game_server = game_server
+        self.cache = cache if cache is not None else ResponseCache()
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_HTTP_PORT
+    ) -> int:
+        """Start listening; returns the bound port (``port=0`` picks one)."""
+        self._server = await asyncio.start_server(
+            self._handle, host, port, backlog=1024
+        )
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # --- Routing ----------------------------------------------------------
+
+    def respond(self, path: str, query: Dict) -> Tuple[int, CachedResponse]:
+        """Build (or fetch from cache) the response for a GET request."""
+        board = self.leaderboard
+        if path == "/metrics":
+            if self.game_server is not None:
+                self.game_server.update_metrics()
+            # Never cached: metrics change on every request
+            body = metrics.REGISTRY.render().encode("utf-8")
+            return 200, CachedResponse(None, 0.0, body, PROMETHEUS_TYPE)
+
+        if board is None and (
+            path == "/leaderboard" or path.startswith("/players/")
+        ):
+            return 404, self._error("no leaderboard here")
+
+        if path == "/leaderboard":
+            limit = _limit(query, 10)
+            return 200, self.cache.get(
+                ("leaderboard", limit),
+                board.version,
+                lambda: [_entry_json(e) for e in board.get_top_players(limit)],
+            )
+
+        if path.startswith("/players/"):
+            name = unquote(path[len("/players/"):])
+            # Don't use get_player_stats: it would create the player
+            if name not in board.entries:
+                return 404, self._error(f"unknown player {name!r}")
+            return 200, self.cache.get(
+                ("player", name),
+                board.version,
+                lambda: _entry_json(board.entries[name]),
+            )
+
+        if path == "/matches":
+            limit = _limit(query, 20)
+            server = self.game_server
+            if server is None:
+                return 200, self.cache.get(("matches", limit), 0, list)
+            return 200, self.cache.get(
+                ("matches", limit),
+                server.matches_played,
+                lambda: list(itertools.islice(reversed(server.history), limit)),
+            )
+
+        return 404, self._error("no such endpoint")
+
+    def _error(self, message: str) -> CachedResponse:
+        return CachedResponse(None, 0.0, _to_json({"error": message}))
+
+    # --- HTTP -------------------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers: Dict[str, str] = {}
+                for _ in range(MAX_HEADERS):
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = self._serve_one(request_line, headers, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):  # ValueError: line too long
+            pass
+        finally:
+            writer.close()
+
+    def _serve_one(
+        self, request_line: bytes, headers: Dict[str, str], writer: asyncio.StreamWriter
+    ) -> bool:
+        """Write the response to one request; returns whether to keep alive."""
+        self.requests += 1
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            error = self._error("malformed request line")
+            self._write(writer, 400, error, True, False)
+            return False
+
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+        if method not in ("GET", "HEAD"):
+            error = self._error("only GET and HEAD are supported")
+            self._write(writer, 405, error, True, False)
+            return False
+
+        url = urlsplit(target)
+        try:
+            status, response = self.respond(url.path, parse_qs(url.query))
+        except ValueError as exc:
+            status, response = 400, self._error(str(exc))
+        if status == 200 and headers.get("if-none-match") == response.etag:
+            status = 304
+        with_body = method == "GET" and status != 304
+        self._write(writer, status, response, with_body, keep_alive)
+        return keep_alive
+
+    @staticmethod
+    def _write(
+        writer: asyncio.StreamWriter,
+        status: int,
+        response: CachedResponse,
+        with_body: bool,
+        keep_alive: bool,
+    ):
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: {response.content_type}\r\n"
+            f"Content-Length: {len(response.body) if status != 304 else 0}\r\n"
+            f"ETag: {response.etag}\r\n"
+            f"Cache-Control: no-cache\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+        writer.write(head + response.body if with_body else head)
+
+
+async def _reload_on_change(leaderboard: Leaderboard, interval: float = 1.0):
+    """Reload the leaderboard whenever its file changes on disk."""
+    mtime = None
+    while True:
+        try:
+            current = os.stat(leaderboard.data_file).st_mtime_ns
+        except OSError:
+            current = None
+        if current != mtime:
+            mtime = current
+            await asyncio.to_thread(leaderboard.load)
+        await asyncio.sleep(interval)
+
+
+async def _serve(args):
+    leaderboard = Leaderboard(args.data_file)
+    api = ApiServer(leaderboard)
+    port = await api.start(args.host, args.port)
+    watcher = asyncio.ensure_future(_reload_on_change(leaderboard))
+    print(f"Leaderboard API listening on http://{args.host}:{port}")
+    try:
+        await api.serve_forever()
+    finally:
+        watcher.cancel()
+        await api.close()
+
+
+def main(argv=None):
+    """Command-line entry point: ``python -m src.http_api``."""
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors leaderboard API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument(
+        "--data-file", default="data/leaderboard.json", help="Leaderboard file to serve"
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        print("\nAPI stopped.")
+
+
+if __name__ == "__main__":
+    main()
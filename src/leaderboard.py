@@ -1,9 +1,23 @@
 """Leaderboard system with persistence."""
 
+import heapq
 import json
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from src import metrics
+
+SAVE_SECONDS = metrics.histogram(
+    "rps_leaderboard_save_seconds", "Time to write the leaderboard file"
+)
+SAVED_BYTES = metrics.counter(
+    "rps_leaderboard_saved_bytes_total", "Bytes written by leaderboard saves"
+)
+LOAD_SECONDS = metrics.histogram(
+    "rps_leaderboard_load_seconds", "Time to read and parse the leaderboard file"
+)
+ENTRIES = metrics.gauge("rps_leaderboard_entries", "Players on the leaderboard")
 
 
 class LeaderboardEntry:
@@ -51,9 +65,23 @@ class Leaderboard:
 
     def __init__(self, data_file: str = "data/leaderboard.json"):
         self.data_file = data_file
-        self.entries: Dict[str, LeaderboardEntry] = {}
-        self._ensure_data_dir()
-        self.load()
+        # Loaded lazily so creating a Leaderboard never touches the disk
+        self._entries: Optional[Dict[str, LeaderboardEntry]] = None
+        # Bumped on every change, so readers can tell when cached views are stale
+        self.version = 0
+
+    @property
+    def entries(self) -> Dict[str, LeaderboardEntry]:
+        """Entries by player name (loaded from file on first access)."""
+        if self._entries is None:
+            self.load()
+        return self._entries
+
+    @entries.setter
+    def entries(self, value: Dict[str, LeaderboardEntry]):
+        self._entries = value
+        self.version += 1
+        ENTRIES.set(len(value))
 
     def _ensure_data_dir(self):
         """Ensure the data directory exists."""
@@ -61,57 +89,84 @@ class Leaderboard:
 
     def load(self):
         """Load leaderboard from file."""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r") as f:
-                    data = json.load(f)
-                    self.entries = {
-                        name: LeaderboardEntry.from_dict(entry_data)
-                        for name, entry_data in data.items()
-                    }
-            except (json.JSONDecodeError, KeyError):
-                # If file is corrupted, start fresh
-                self.entries = {}
-
-    def save(self):
-        """Save leaderboard to file."""
-        data = {name: entry.to_dict() for name, entry in self.entries.items()}
-        with open(self.data_file, "w") as f:
-            json.dump(data, f, indent=2)
+        entries: Dict[str, LeaderboardEntry] = {}
+        with LOAD_SECONDS.time():
+            if os.path.exists(self.data_file):
+                try:
+                    with open(self.data_file, "r") as f:
+                        data = json.load(f)
+                        entries = {
+                            name: LeaderboardEntry.from_dict(entry_data)
+                            for name, entry_data in data.items()
+                        }
+                except (json.JSONDecodeError, KeyError):
+                    # If file is corrupted, start fresh
+                    entries = {}
+        self._entries = entries
+        self.version += 1
+        ENTRIES.set(len(entries))
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Snapshot of all entries as plain dicts (the file format)."""
+        return {name: entry.to_dict() for name, entry in self.entries.items()}
+
+    def save(self, data: Optional[Dict[str, Dict]] = None):
+        """Save leaderboard to file.
+
+        Args:
+            data: Snapshot from ``to_dict`` to write; taken now if omitted
+        """
+        with SAVE_SECONDS.time():
+            if data is None:
+                data = self.to_dict()
+            self._ensure_data_dir()
+            with open(self.data_file, "w") as f:
+                json.dump(data, f, indent=2)
+                written = f.tell()
+        SAVED_BYTES.inc(written)
+        ENTRIES.set(len(data))
 
     def get_or_create_player(self, player_name: str) -> LeaderboardEntry:
         """Get existing player or create new entry."""
         if player_name not in self.entries:
             self.entries[player_name] = LeaderboardEntry(player_name)
+            self.version += 1
+            ENTRIES.set(len(self.entries))
         return self.entries[player_name]
 
-    def record_win(self, player_name: str):
-        """Record a win for a player."""
+    def record_win(self, player_name: str, save: bool = True):
+        """Record a win for a player (``save=False`` leaves saving to the caller)."""
         entry = self.get_or_create_player(player_name)
         entry.wins += 1
         entry.last_played = datetime.now().isoformat()
-        self.save()
+        self.version += 1
+        if save:
+            self.save()
 
-    def record_loss(self, player_name: str):
-        """Record a loss for a player."""
+    def record_loss(self, player_name: str, save: bool = True):
+        """Record a loss for a player (``save=False`` leaves saving to the caller)."""
         entry = self.get_or_create_player(player_name)
         entry.losses += 1
         entry.last_played = datetime.now().isoformat()
-        self.save()
+        self.version += 1
+        if save:
+            self.save()
 
-    def record_tie(self, player_name: str):
-        """Record a tie for a player."""
+    def record_tie(self, player_name: str, save: bool = True):
+        """Record a tie for a player (``save=False`` leaves saving to the caller)."""
         entry = self.get_or_create_player(player_name)
         entry.ties += 1
         entry.last_played = datetime.now().isoformat()
-        self.save()
+        self.version += 1
+        if save:
+            self.save()
 
     def get_top_players(self, limit: int = 10) -> List[LeaderboardEntry]:
         """Get top players sorted by wins, then win rate."""
-        sorted_entries = sorted(
-            self.entries.values(), key=lambda e: (e.wins, e.win_rate), reverse=True
+        # Same order as sorting everything, without the full sort
+        return heapq.nlargest(
+            limit, self.entries.values(), key=lambda e: (e.wins, e.win_rate)
         )
-        return sorted_entries[:limit]
 
     def get_player_stats(self, player_name: str) -> LeaderboardEntry:
         """Get stats for a specific player."""
@@ -1,70 +1,227 @@
 """Main TUI application for Rock Paper Scissors."""
 
-import time
+import argparse
+import asyncio
+import os
+import random
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt
 from rich.table import Table
 from rich import box
-from typing import Optional
-
-from src.game import Game, Move, GameResult
-from src.ai import AI_OPPONENTS, create_ai, AIPlayer, AdaptiveAI
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from src import metrics
+from src.game import ROUNDS_PLAYED, Game, Move, GameResult
 from src.leaderboard import Leaderboard
-from src.sounds import play_win, play_lose
+from src.pacing import Pacer, PacingMode
+from src.render_cache import RenderCache
+from src.tasks import BackgroundTasks, run_blocking
+
+# AI, sound and battle-view modules are imported where they are first used,
+# so launching the game only pays for what the main menu needs.
+if TYPE_CHECKING:
+    from src.ai import AIPlayer
+    from src.sequential import SequentialTest
+    from src.session import ScriptedInput, SessionRecorder
+    from src.spectator import Broadcaster
+    from src.swiss import SwissTournament
 
 
 console = Console()
+screen = RenderCache(console)
+
+
+def use_console(new_console: Console):
+    """Send all TUI output to ``new_console`` (e.g. a virtual one for replays)."""
+    global console, screen
+    console = new_console
+    screen = RenderCache(new_console)
+
+TITLE_ART = """
+╦═╗┌─┐┌─┐┬┌─  ╔═╗┌─┐┌─┐┌─┐┬─┐  ╔═╗┌─┐┬┌─┐┌─┐┌─┐┬─┐┌─┐
+╠╦╝│ ││  ├┴┐  ╠═╝├─┤├─┘├┤ ├┬┘  ╚═╗│  │└─┐└─┐│ │├┬┘└─┐
+╩╚═└─┘└─┘┴ ┴  ╩  ┴ ┴┴  └─┘┴└─  ╚═╝└─┘┴└─┘└─┘└─┘┴└─└─┘
+        """
+
+DIFFICULTY_COLORS = {"Easy": "green", "Medium": "yellow", "Hard": "red"}
+
+# Rows of the Swiss tournament standings shown (and sent to spectators)
+SWISS_STANDINGS_ROWS = 20
+
+# Round-robin games between chances to checkpoint or be interrupted
+CHECKPOINT_GAMES = 1000
+
+# Main menu choice -> screen name for render metrics
+SCREEN_NAMES = {
+    "1": "vs_ai",
+    "2": "vs_human",
+    "3": "ai_battle",
+    "4": "tournament",
+    "5": "leaderboard",
+    "6": "player_stats",
+    "7": "online",
+}
+
+
+# Builders for static screen fragments; their output is cached in `screen`
+
+
+def _title_panel() -> Panel:
+    return Panel(TITLE_ART, style="bold cyan", subtitle="Team 9: The Vibe Tribe")
+
+
+def _menu_table() -> Table:
+    menu = Table(show_header=False, box=box.ROUNDED, style="cyan")
+    menu.add_column("Option", style="bold")
+    menu.add_column("Description")
+
+    menu.add_row("1", "🤖 Play vs AI")
+    menu.add_row("2", "👥 Play vs Human (Local)")
+    menu.add_row("3", "🤖⚔️🤖 Watch AI vs AI Battle")
+    menu.add_row("4", "🏆🤖 AI Tournament Mode")
+    menu.add_row("5", "🏆 View Leaderboard")
+    menu.add_row("6", "📊 View Your Stats")
+    menu.add_row("7", "🌐 Play Online")
+    menu.add_row("8", "👋 Quit")
+    return menu
+
+
+def _opponent_table(exclude: Tuple[int, ...] = ()) -> Table:
+    """Table of AI opponents, leaving out the indices in ``exclude``."""
+    from src.ai import AI_OPPONENTS
+
+    table = Table(show_header=True, box=box.ROUNDED, style="cyan")
+    table.add_column("#", style="bold", width=3)
+    table.add_column("Name", style="bold yellow")
+    table.add_column("Difficulty", style="bold")
+    table.add_column("Personality")
+
+    for i, ai in enumerate(AI_OPPONENTS):
+        if i in exclude:
+            continue
+        difficulty_color = DIFFICULTY_COLORS.get(ai["difficulty"], "white")
+        table.add_row(
+            str(i + 1),
+            ai["name"],
+            f"[{difficulty_color}]{ai['difficulty']}[/{difficulty_color}]",
+            ai["personality"],
+        )
+    return table
+
+
+def _round_frame(player1_move: Move, player2_move: Move) -> str:
+    """Side-by-side ASCII art for a move pair: left = player 1, right = player 2."""
+    lines1 = Game.get_move_ascii_art_lines(player1_move)
+    lines2 = Game.get_move_ascii_art_lines(player2_move)
+    width = 20  # fixed width per art block for alignment
+    max_lines = max(len(lines1), len(lines2))
+
+    rows = []
+    for i in range(max_lines):
+        left = (lines1[i] if i < len(lines1) else "").ljust(width)
+        right = (lines2[i] if i < len(lines2) else "").ljust(width)
+        rows.append(f"  {left}     [bold]VS[/bold]     {right}")
+    return "\n".join(rows)
+
+
+def _round_frame_builders() -> Dict[Hashable, Callable[[], str]]:
+    """Builders for all 9 move-pair frames, keyed as in display_round_result."""
+    return {
+        ("round", move1, move2): partial(_round_frame, move1, move2)
+        for move1 in Move
+        for move2 in Move
+    }
 
 
 class RockPaperScissorsGame:
     """Main game controller."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        pacer: Optional[Pacer] = None,
+        broadcaster: Optional["Broadcaster"] = None,
+        spectate_port: Optional[int] = None,
+        profile_ai: Optional[str] = None,
+        metrics_port: Optional[int] = None,
+        metrics_file: Optional[str] = None,
+        seed: Optional[int] = None,
+        session: Optional[Union["SessionRecorder", "ScriptedInput"]] = None,
+        replay_dir: Optional[str] = None,
+        checkpoint_file: Optional[str] = None,
+        resume: bool = False,
+    ):
         self.leaderboard = Leaderboard()
+        self.pacer = pacer or Pacer()
+        self.tasks = BackgroundTasks()
+        self.broadcaster = broadcaster
+        self.spectate_port = spectate_port
+        # "time" or "alloc": profile AI decisions in tournaments
+        self.profile_ai = profile_ai
+        # Serve src.metrics over HTTP and/or write them to a file
+        self.metrics_port = metrics_port
+        self.metrics_file = metrics_file
+        # Seed for the shared RNG, so a recorded session can be replayed
+        self.seed = seed
+        # Where _ask gets its answers (see src/session.py); None: the terminal
+        self.session = session
+        # Save each AI battle here as a replay (see src/replay.py)
+        self.replay_dir = replay_dir
+        # Tournaments checkpoint here (see src/checkpoint.py); resume: carry
+        # on from it before showing the menu
+        self.checkpoint_file = checkpoint_file
+        self.resume = resume
         self.player_name: Optional[str] = None
         self.player_move_history = []
-        self.current_ai: Optional[AIPlayer] = None
+        self.current_ai: Optional["AIPlayer"] = None
         self.player2_name: Optional[str] = None
 
-    def show_title(self):
-        """Display game title."""
-        console.clear()
-        title = """
-╦═╗┌─┐┌─┐┬┌─  ╔═╗┌─┐┌─┐┌─┐┬─┐  ╔═╗┌─┐┬┌─┐┌─┐┌─┐┬─┐┌─┐
-╠╦╝│ ││  ├┴┐  ╠═╝├─┤├─┘├┤ ├┬┘  ╚═╗│  │└─┐└─┐│ │├┬┘└─┐
-╩╚═└─┘└─┘┴ ┴  ╩  ┴ ┴┴  └─┘┴└─  ╚═╝└─┘┴└─┘└─┘└─┘┴└─└─┘
-        """
-        console.print(
-            Panel(title, style="bold cyan", subtitle="Team 9: The Vibe Tribe")
-        )
+    async def _ask(self, prompt_cls, *args, **kwargs):
+        """Ask a Rich prompt without blocking the event loop."""
+        if self.session is not None:
+            return await self.session.ask(screen.screen, prompt_cls, *args, **kwargs)
+        return await run_blocking(prompt_cls.ask, *args, **kwargs)
 
-    def main_menu(self):
-        """Display main menu and get user choice."""
-        self.show_title()
+    def _publish(self, event: Dict, retain: Optional[str] = None):
+        """Send an event to spectators, if broadcasting."""
+        if self.broadcaster is not None:
+            self.broadcaster.publish(event, retain)
 
-        menu = Table(show_header=False, box=box.ROUNDED, style="cyan")
-        menu.add_column("Option", style="bold")
-        menu.add_column("Description")
+    def show_title(self, *fragments: str):
+        """Clear the screen and display the game title.
 
-        menu.add_row("1", "🤖 Play vs AI")
-        menu.add_row("2", "👥 Play vs Human (Local)")
-        menu.add_row("3", "🤖⚔️🤖 Watch AI vs AI Battle")
-        menu.add_row("4", "🏆🤖 AI Tournament Mode")
-        menu.add_row("5", "🏆 View Leaderboard")
-        menu.add_row("6", "📊 View Your Stats")
-        menu.add_row("7", "👋 Quit")
+        Any pre-rendered ``fragments`` are written in the same batch.
+        """
+        screen.write(screen.cached("title", _title_panel), *fragments, clear=True)
 
-        console.print(menu)
-        choice = Prompt.ask(
-            "\nChoose an option", choices=["1", "2", "3", "4", "5", "6", "7"]
+    async def main_menu(self):
+        """Display main menu and get user choice."""
+        screen.screen = "menu"
+        if self.metrics_file:
+            self.tasks.spawn_serial(metrics.REGISTRY.write_textfile, self.metrics_file)
+        self.show_title(screen.cached("main_menu", _menu_table))
+        choice = await self._ask(
+            Prompt,
+            "\nChoose an option",
+            choices=["1", "2", "3", "4", "5", "6", "7", "8"],
         )
         return choice
 
-    def get_player_name(self) -> str:
+    async def get_player_name(self) -> str:
         """Get or confirm player name."""
         if self.player_name:
-            use_same = Prompt.ask(
+            use_same = await self._ask(
+                Prompt,
                 f"\nWelcome back, [bold]{self.player_name}[/bold]! Continue as this player?",
                 choices=["y", "n"],
                 default="y",
@@ -72,103 +229,100 @@ class RockPaperScissorsGame:
             if use_same == "y":
                 return self.player_name
 
-        name = Prompt.ask("\n[bold cyan]Enter your name[/bold cyan]")
+        name = await self._ask(Prompt, "\n[bold cyan]Enter your name[/bold cyan]")
         self.player_name = name
         return name
 
-    def select_ai_opponent(self) -> int:
+    async def select_ai_opponent(self) -> int:
         """Let player select an AI opponent."""
-        console.clear()
-        self.show_title()
+        from src.ai import AI_OPPONENTS
 
-        console.print("\n[bold cyan]Choose Your Opponent:[/bold cyan]\n")
-
-        table = Table(show_header=True, box=box.ROUNDED, style="cyan")
-        table.add_column("#", style="bold", width=3)
-        table.add_column("Name", style="bold yellow")
-        table.add_column("Difficulty", style="bold")
-        table.add_column("Personality")
-
-        for i, ai in enumerate(AI_OPPONENTS):
-            difficulty_color = {"Easy": "green", "Medium": "yellow", "Hard": "red"}.get(
-                ai["difficulty"], "white"
-            )
-
-            table.add_row(
-                str(i + 1),
-                ai["name"],
-                f"[{difficulty_color}]{ai['difficulty']}[/{difficulty_color}]",
-                ai["personality"],
-            )
-
-        console.print(table)
+        self.show_title(
+            screen.render("\n[bold cyan]Choose Your Opponent:[/bold cyan]\n"),
+            screen.cached(("opponents", ()), _opponent_table),
+        )
 
-        choice = IntPrompt.ask(
-            "\nSelect opponent", choices=[str(i + 1) for i in range(len(AI_OPPONENTS))]
+        choice = await self._ask(
+            IntPrompt,
+            "\nSelect opponent",
+            choices=[str(i + 1) for i in range(len(AI_OPPONENTS))],
         )
         return choice - 1
 
-    def get_move_choice(self, player_name: str) -> Move:
+    def _show_move_options(self, player_name: str):
+        screen.write(
+            screen.render(f"\n[bold]{player_name}[/bold], choose your move:"),
+            screen.cached("move_options", lambda: "1. 🪨 Rock\n2. 📄 Paper\n3. ✂️  Scissors"),
+        )
+
+    async def get_move_choice(self, player_name: str) -> Move:
         """Get player's move choice."""
-        console.print(f"\n[bold]{player_name}[/bold], choose your move:")
-        console.print("1. 🪨 Rock")
-        console.print("2. 📄 Paper")
-        console.print("3. ✂️  Scissors")
+        self._show_move_options(player_name)
 
-        choice = Prompt.ask("Your choice", choices=["1", "2", "3"])
+        choice = await self._ask(Prompt, "Your choice", choices=["1", "2", "3"])
 
         move_map = {"1": Move.ROCK, "2": Move.PAPER, "3": Move.SCISSORS}
         return move_map[choice]
 
-    def display_round_result(
+    async def display_round_result(
         self,
         player1_name: str,
         player1_move: Move,
         player2_name: str,
         player2_move: Move,
         result: GameResult,
+        pause: bool = True,
     ):
-        """Display the result of a round with side-by-side ASCII art."""
-        console.print("\n" + "=" * 50)
-
-        # Side-by-side ASCII art: left = player1 name + art, center = VS, right = player2 name + art
-        lines1 = Game.get_move_ascii_art_lines(player1_move)
-        lines2 = Game.get_move_ascii_art_lines(player2_move)
-        width = 20  # fixed width per art block for alignment
-        max_lines = max(len(lines1), len(lines2))
-        while len(lines1) < max_lines:
-            lines1.append("")
-        while len(lines2) < max_lines:
-            lines2.append("")
-
-        # Names row (above the art)
-        console.print(f"  [bold cyan]{player1_name}[/bold cyan]     [bold]VS[/bold]     [bold yellow]{player2_name}[/bold yellow]")
-        # Art lines
-        for i in range(max_lines):
-            left = (lines1[i] if i < len(lines1) else "").ljust(width)
-            right = (lines2[i] if i < len(lines2) else "").ljust(width)
-            console.print(f"  {left}     [bold]VS[/bold]     {right}")
-
-        # Show result and play sound (from player1's perspective)
+        """Display the result of a round with side-by-side ASCII art.
+
+        With ``pause=False`` it returns straight away instead of holding the
+        result on screen (online, where the next round's clock is running).
+        """
+        from src.sounds import play_win, play_lose
+
+        # Result line and sound (from player1's perspective)
         if result == GameResult.WIN:
-            console.print(f"\n[bold green]🎉 {player1_name} WINS![/bold green]")
-            play_win()
+            result_line = f"\n[bold green]🎉 {player1_name} WINS![/bold green]"
+            sound = play_win
         elif result == GameResult.LOSE:
-            console.print(f"\n[bold red]😢 {player2_name} WINS![/bold red]")
-            play_lose()
+            result_line = f"\n[bold red]😢 {player2_name} WINS![/bold red]"
+            sound = play_lose
         else:
-            console.print("\n[bold yellow]🤝 IT'S A TIE![/bold yellow]")
+            result_line = "\n[bold yellow]🤝 IT'S A TIE![/bold yellow]"
+            sound = None
+
+        # Names row, cached side-by-side art and result, emitted as one write
+        fragments = [
+            screen.render(
+                "\n" + "=" * 50,
+                f"  [bold cyan]{player1_name}[/bold cyan]     [bold]VS[/bold]     [bold yellow]{player2_name}[/bold yellow]",
+            ),
+            screen.cached(
+                ("round", player1_move, player2_move),
+                partial(_round_frame, player1_move, player2_move),
+            ),
+            screen.render(result_line, "=" * 50),
+        ]
+        if pause and self.pacer.skippable and self.pacer.scaled(5) > 0:
+            fragments.append(
+                screen.cached("skip_hint", lambda: "[dim](press any key to skip)[/dim]\n")
+            )
+        screen.write(*fragments)
 
-        console.print("=" * 50 + "\n")
-        time.sleep(5)
+        if sound:
+            sound()
+        if pause:
+            await self.pacer.wait_async(5)
 
-    def play_vs_ai(self):
+    async def play_vs_ai(self):
         """Play against an AI opponent."""
-        player_name = self.get_player_name()
-        ai_index = self.select_ai_opponent()
+        from src.ai import AI_OPPONENTS, create_ai
+
+        player_name = await self.get_player_name()
+        ai_index = await self.select_ai_opponent()
         self.current_ai = create_ai(ai_index)
+        self.player_move_history = []  # This match's moves only, like the AI's
 
-        console.clear()
         self.show_title()
 
         ai_info = AI_OPPONENTS[ai_index]
@@ -180,38 +334,41 @@ class RockPaperScissorsGame:
             )
         )
 
-        rounds = IntPrompt.ask("\nHow many rounds?", default=3)
+        rounds = await self._ask(IntPrompt, "\nHow many rounds?", default=3)
 
         player_wins = 0
         ai_wins = 0
         ties = 0
 
+        screen.warm(_round_frame_builders())
+
         for round_num in range(1, rounds + 1):
-            console.clear()
-            self.show_title()
-            console.print(f"\n[bold]Round {round_num}/{rounds}[/bold]")
-            console.print(
-                f"Score: [cyan]{player_name}: {player_wins}[/cyan] | [yellow]{self.current_ai.name}: {ai_wins}[/yellow] | Ties: {ties}"
+            self.show_title(
+                screen.render(
+                    f"\n[bold]Round {round_num}/{rounds}[/bold]",
+                    f"Score: [cyan]{player_name}: {player_wins}[/cyan] | [yellow]{self.current_ai.name}: {ai_wins}[/yellow] | Ties: {ties}",
+                )
             )
 
             # Player makes move
-            player_move = self.get_move_choice(player_name)
-            self.player_move_history.append(player_move)
+            player_move = await self.get_move_choice(player_name)
 
-            # AI makes move
+            # AI makes move, from the history up to the last round only
             ai_move = self.current_ai.make_move(self.player_move_history)
             self.current_ai.record_move(ai_move)
+            self.player_move_history.append(player_move)
 
             # Determine result
             result = Game.determine_winner(player_move, ai_move)
+            ROUNDS_PLAYED.inc(mode="vs_ai")
 
-            # Update adaptive AI
-            if isinstance(self.current_ai, AdaptiveAI):
-                if result == GameResult.LOSE:  # AI won
-                    self.current_ai.record_win(ai_move)
+            # Let the AI learn from the round, from its side
+            self.current_ai.record_result(
+                ai_move, player_move, Game.determine_winner(ai_move, player_move)
+            )
 
             # Display result
-            self.display_round_result(
+            await self.display_round_result(
                 player_name, player_move, self.current_ai.name, ai_move, result
             )
 
@@ -224,7 +381,6 @@ class RockPaperScissorsGame:
                 ties += 1
 
         # Final results
-        console.clear()
         self.show_title()
         console.print("\n[bold cyan]GAME OVER![/bold cyan]\n")
 
@@ -240,7 +396,7 @@ class RockPaperScissorsGame:
             results_table.add_row(
                 self.current_ai.name, str(ai_wins), "[red]Loser[/red]"
             )
-            self.leaderboard.record_win(player_name)
+            self.tasks.spawn_serial(self.leaderboard.record_win, player_name)
         elif ai_wins > player_wins:
             results_table.add_row(player_name, str(player_wins), "[red]Loser[/red]")
             results_table.add_row(
@@ -248,7 +404,7 @@ class RockPaperScissorsGame:
                 str(ai_wins),
                 "[bold green]WINNER! 🎉[/bold green]",
             )
-            self.leaderboard.record_loss(player_name)
+            self.tasks.spawn_serial(self.leaderboard.record_loss, player_name)
         else:
             results_table.add_row(
                 player_name, str(player_wins), "[yellow]Draw[/yellow]"
@@ -256,51 +412,55 @@ class RockPaperScissorsGame:
             results_table.add_row(
                 self.current_ai.name, str(ai_wins), "[yellow]Draw[/yellow]"
             )
-            self.leaderboard.record_tie(player_name)
+            self.tasks.spawn_serial(self.leaderboard.record_tie, player_name)
 
         console.print(results_table)
         console.print(f"\nTies: {ties}")
 
-        Prompt.ask("\nPress Enter to continue")
+        await self._ask(Prompt, "\nPress Enter to continue")
 
-    def play_vs_human(self):
+    async def play_vs_human(self):
         """Play against another human locally."""
-        console.clear()
         self.show_title()
 
-        player1_name = self.get_player_name()
-        player2_name = Prompt.ask("\n[bold cyan]Enter Player 2's name[/bold cyan]")
+        player1_name = await self.get_player_name()
+        player2_name = await self._ask(
+            Prompt, "\n[bold cyan]Enter Player 2's name[/bold cyan]"
+        )
 
-        rounds = IntPrompt.ask("\nHow many rounds?", default=3)
+        rounds = await self._ask(IntPrompt, "\nHow many rounds?", default=3)
 
         player1_wins = 0
         player2_wins = 0
         ties = 0
 
+        screen.warm(_round_frame_builders())
+
         for round_num in range(1, rounds + 1):
-            console.clear()
-            self.show_title()
-            console.print(f"\n[bold]Round {round_num}/{rounds}[/bold]")
-            console.print(
-                f"Score: [cyan]{player1_name}: {player1_wins}[/cyan] | [yellow]{player2_name}: {player2_wins}[/yellow] | Ties: {ties}"
+            self.show_title(
+                screen.render(
+                    f"\n[bold]Round {round_num}/{rounds}[/bold]",
+                    f"Score: [cyan]{player1_name}: {player1_wins}[/cyan] | [yellow]{player2_name}: {player2_wins}[/yellow] | Ties: {ties}",
+                )
             )
 
             # Player 1 makes move
-            player1_move = self.get_move_choice(player1_name)
+            player1_move = await self.get_move_choice(player1_name)
 
             console.print(
                 "\n[bold red]Player 2's turn... Player 1 look away![/bold red]"
             )
-            time.sleep(1)
+            await self.pacer.wait_async(1)
 
             # Player 2 makes move
-            player2_move = self.get_move_choice(player2_name)
+            player2_move = await self.get_move_choice(player2_name)
 
             # Determine result
             result = Game.determine_winner(player1_move, player2_move)
+            ROUNDS_PLAYED.inc(mode="vs_human")
 
             # Display result
-            self.display_round_result(
+            await self.display_round_result(
                 player1_name, player1_move, player2_name, player2_move, result
             )
 
@@ -313,7 +473,6 @@ class RockPaperScissorsGame:
                 ties += 1
 
         # Final results
-        console.clear()
         self.show_title()
         console.print("\n[bold cyan]GAME OVER![/bold cyan]\n")
 
@@ -327,15 +486,15 @@ class RockPaperScissorsGame:
                 player1_name, str(player1_wins), "[bold green]WINNER! 🎉[/bold green]"
             )
             results_table.add_row(player2_name, str(player2_wins), "[red]Loser[/red]")
-            self.leaderboard.record_win(player1_name)
-            self.leaderboard.record_loss(player2_name)
+            self.tasks.spawn_serial(self.leaderboard.record_win, player1_name)
+            self.tasks.spawn_serial(self.leaderboard.record_loss, player2_name)
         elif player2_wins > player1_wins:
             results_table.add_row(player1_name, str(player1_wins), "[red]Loser[/red]")
             results_table.add_row(
                 player2_name, str(player2_wins), "[bold green]WINNER! 🎉[/bold green]"
             )
-            self.leaderboard.record_loss(player1_name)
-            self.leaderboard.record_win(player2_name)
+            self.tasks.spawn_serial(self.leaderboard.record_loss, player1_name)
+            self.tasks.spawn_serial(self.leaderboard.record_win, player2_name)
         else:
             results_table.add_row(
                 player1_name, str(player1_wins), "[yellow]Draw[/yellow]"
@@ -343,21 +502,127 @@ class RockPaperScissorsGame:
             results_table.add_row(
                 player2_name, str(player2_wins), "[yellow]Draw[/yellow]"
             )
-            self.leaderboard.record_tie(player1_name)
-            self.leaderboard.record_tie(player2_name)
+            self.tasks.spawn_serial(self.leaderboard.record_tie, player1_name)
+            self.tasks.spawn_serial(self.leaderboard.record_tie, player2_name)
 
         console.print(results_table)
         console.print(f"\nTies: {ties}")
 
-        Prompt.ask("\nPress Enter to continue")
+        await self._ask(Prompt, "\nPress Enter to continue")
+
+    async def play_online(self):
+        """Play a match against another player through a game server."""
+        from src.client import ConnectionClosed, GameClient, play_match
+        from src.protocol import DEFAULT_HOST, DEFAULT_PORT
+
+        player_name = await self.get_player_name()
+        host = await self._ask(Prompt, "\nServer host", default=DEFAULT_HOST)
+        port = await self._ask(IntPrompt, "Server port", default=DEFAULT_PORT)
+
+        client = GameClient()
+        try:
+            await client.connect(host, port)
+        except OSError as exc:
+            console.print(f"\n[red]Could not connect to {host}:{port}: {exc}[/red]")
+            await self._ask(Prompt, "\nPress Enter to continue")
+            return
+
+        match = {"opponent": "Opponent", "rounds": 0, "score": [0, 0, 0]}
+        # A move prompt left open by a round that timed out. The terminal is
+        # still reading into it, so it answers the next round too.
+        prompt: List[asyncio.Future] = []
+
+        async def choose_move(message) -> Move:
+            wins, losses, ties = match["score"]
+            header = screen.render(
+                f"\n[bold]Round {message['round']}/{match['rounds']}[/bold]",
+                f"Score: [cyan]{player_name}: {wins}[/cyan] | [yellow]{match['opponent']}: {losses}[/yellow] | Ties: {ties}",
+                f"[dim]You have {message['timeout']:.0f}s to choose.[/dim]",
+            )
+            # Results don't pause online, so keep the last one on screen
+            if message["round"] == 1:
+                self.show_title(header)
+            else:
+                screen.write(header)
+            if prompt and not prompt[0].done():
+                self._show_move_options(player_name)
+                console.print("Your choice [1/2/3]: ", end="", markup=False)
+            else:
+                prompt[:] = [asyncio.ensure_future(self.get_move_choice(player_name))]
+            # play_match cancels us if the round times out; the prompt stays
+            return await asyncio.shield(prompt[0])
+
+        async def on_event(message):
+            kind = message["type"]
+            if kind == "waiting":
+                self.show_title(
+                    screen.render("\n[yellow]Waiting for an opponent...[/yellow]")
+                )
+            elif kind == "match_start":
+                match["opponent"] = message["opponent"]
+                match["rounds"] = message["rounds"]
+            elif kind == "round_result":
+                match["score"] = message["score"]
+                ROUNDS_PLAYED.inc(mode="online")
+                if message["your_move"] and message["opponent_move"]:
+                    await self.display_round_result(
+                        player_name,
+                        Move(message["your_move"]),
+                        match["opponent"],
+                        Move(message["opponent_move"]),
+                        GameResult(message["result"]),
+                        pause=False,
+                    )
+                else:
+                    console.print(
+                        f"\n[yellow]Round {message['round']} forfeited "
+                        f"(no move in time): {message['result'].upper()}[/yellow]"
+                    )
+            elif kind == "error":
+                console.print(f"[red]Server: {message['message']}[/red]")
+
+        try:
+            await client.hello(player_name)
+            end = await play_match(client, choose_move, on_event)
+        except ConnectionClosed:
+            end = None
+        finally:
+            await client.close()
+
+        if end is not None and end["reason"] == "done":
+            await self.pacer.wait_async(5)  # No next round: let the last result show
+        self.show_title()
+        if end is None:
+            console.print("\n[red]Lost connection to the server.[/red]")
+        else:
+            wins, losses, ties = end["score"]
+            result_text = {
+                "win": "[bold green]YOU WIN! 🎉[/bold green]",
+                "lose": f"[bold red]{match['opponent']} wins.[/bold red]",
+                "tie": "[yellow]It's a draw.[/yellow]",
+            }[end["result"]]
+            console.print("\n[bold cyan]GAME OVER![/bold cyan]\n")
+            console.print(result_text)
+            console.print(f"\nScore: {wins}-{losses} (ties: {ties})")
+            if end["reason"] == "disconnect":
+                console.print("[dim]Your opponent left the match.[/dim]")
+            console.print(
+                "\n[dim]Online results are recorded on the server's leaderboard.[/dim]"
+            )
+
+        if prompt and not prompt[0].done():
+            console.print("\n[dim]Enter 1, 2 or 3 to continue[/dim]")
+            await prompt[0]
+        else:
+            await self._ask(Prompt, "\nPress Enter to continue")
 
-    def view_leaderboard(self):
+    async def view_leaderboard(self):
         """Display the leaderboard."""
-        console.clear()
         self.show_title()
 
         console.print("\n[bold cyan]🏆 LEADERBOARD 🏆[/bold cyan]\n")
 
+        await self.tasks.flush()  # Include results still being saved
         top_players = self.leaderboard.get_top_players(10)
 
         if not top_players:
@@ -388,18 +653,18 @@ class RockPaperScissorsGame:
 
             console.print(table)
 
-        Prompt.ask("\nPress Enter to continue")
+        await self._ask(Prompt, "\nPress Enter to continue")
 
-    def view_player_stats(self):
+    async def view_player_stats(self):
         """View stats for the current player."""
         if not self.player_name:
-            player_name = self.get_player_name()
+            player_name = await self.get_player_name()
         else:
             player_name = self.player_name
 
-        console.clear()
         self.show_title()
 
+        await self.tasks.flush()  # Include results still being saved
         stats = self.leaderboard.get_player_stats(player_name)
 
         console.print(f"\n[bold cyan]📊 Stats for {player_name}[/bold cyan]\n")
@@ -416,11 +681,18 @@ class RockPaperScissorsGame:
 
         console.print(stats_table)
 
-        Prompt.ask("\nPress Enter to continue")
+        await self._ask(Prompt, "\nPress Enter to continue")
 
-    def ai_vs_ai_battle(self):
+    async def ai_vs_ai_battle(self):
         """Watch two AI opponents battle each other."""
-        console.clear()
+        from rich.live import Live
+
+        from src.ai import AI_OPPONENTS, create_ai
+        from src.battle_view import BattleView
+        from src.engine import Matchup
+        from src.match_cache import seeded
+        from src.replay import ReplayWriter, replay_path
+
         self.show_title()
 
         console.print("\n[bold cyan]⚔️  AI vs AI BATTLE ARENA ⚔️[/bold cyan]\n")
@@ -428,24 +700,22 @@ class RockPaperScissorsGame:
 
         # Select first AI
         console.print("[bold green]🥊 SELECT FIRST PLAYER:[/bold green]")
-        ai1_index = self.select_ai_opponent()
+        ai1_index = await self.select_ai_opponent()
         ai1 = create_ai(ai1_index)
         ai1_config = AI_OPPONENTS[ai1_index]
 
         # Select second AI
-        console.clear()
         self.show_title()
         console.print("\n[bold cyan]⚔️  AI vs AI BATTLE ARENA ⚔️[/bold cyan]\n")
         console.print(
             f"[green]✓ First Player: {ai1.name} ({ai1_config['difficulty']})[/green]\n"
         )
         console.print("[bold yellow]🥊 SELECT SECOND PLAYER:[/bold yellow]")
-        ai2_index = self.select_ai_opponent()
+        ai2_index = await self.select_ai_opponent()
         ai2 = create_ai(ai2_index)
         ai2_config = AI_OPPONENTS[ai2_index]
 
         # Get number of games
-        console.clear()
         self.show_title()
         console.print("\n[bold cyan]⚔️  AI vs AI BATTLE ARENA ⚔️[/bold cyan]\n")
 
@@ -458,108 +728,85 @@ class RockPaperScissorsGame:
         )
         console.print(matchup_panel)
 
-        num_games = IntPrompt.ask("\nHow many games should they play?", default=10)
+        num_games = await self._ask(
+            IntPrompt, "\nHow many games should they play?", default=10
+        )
 
-        # Initialize stats
-        ai1_wins = 0
-        ai2_wins = 0
-        ties = 0
-        ai1_history = []
-        ai2_history = []
+        matchup = Matchup(ai1, ai2)
+        # The battle plays from its own seed, so its replay records how to rerun it
+        battle_seed = random.randrange(2**63)
+        replay = ReplayWriter(
+            ai1.name,
+            ai2.name,
+            battle_seed,
+            {"ai1_index": ai1_index, "ai2_index": ai2_index},
+        )
 
         # Battle time!
-        console.clear()
         self.show_title()
         console.print(f"\n[bold cyan]⚔️  {ai1.name} vs {ai2.name} ⚔️[/bold cyan]\n")
         console.print("[yellow]Battle commencing...[/yellow]\n")
-        time.sleep(1)
-
-        # Create results table
-        results_display = Table(
-            show_header=True, box=box.ROUNDED, style="cyan", title="Battle Results"
-        )
-        results_display.add_column("Game", justify="center", style="bold", width=6)
-        results_display.add_column(ai1.name, justify="center", style="green")
-        results_display.add_column("Result", justify="center", width=10)
-        results_display.add_column(ai2.name, justify="center", style="yellow")
-        results_display.add_column("Score", justify="center", width=12)
-
-        for game_num in range(1, num_games + 1):
-            # AI 1 makes move
-            ai1_move = ai1.make_move(ai2_history)
-            ai1.record_move(ai1_move)
-            ai1_history.append(ai1_move)
-
-            # AI 2 makes move
-            ai2_move = ai2.make_move(ai1_history)
-            ai2.record_move(ai2_move)
-            ai2_history.append(ai2_move)
-
-            # Determine winner
-            result = Game.determine_winner(ai1_move, ai2_move)
-
-            # Update adaptive AIs
-            if isinstance(ai1, AdaptiveAI):
-                if result == GameResult.WIN:
-                    ai1.record_win(ai1_move)
-                elif result == GameResult.LOSE:
-                    ai1.record_loss(ai1_move)
-            if isinstance(ai2, AdaptiveAI):
-                if result == GameResult.LOSE:  # AI2 won
-                    ai2.record_win(ai2_move)
-                elif result == GameResult.WIN:  # AI2 lost
-                    ai2.record_loss(ai2_move)
+        if self.spectate_port is not None:
+            console.print(
+                f"[dim]📡 Spectators can watch with: "
+                f"python -m src.spectator --port {self.spectate_port}[/dim]\n"
+            )
+        await self.pacer.wait_async(1)
+
+        # Live view: a bounded window of recent games plus the running score,
+        # redrawn at a capped frame rate independent of the simulation speed
+        view = BattleView(ai1.name, ai2.name, num_games)
+        self._publish(
+            {
+                "type": "battle_start",
+                "ai1": ai1.name,
+                "ai2": ai2.name,
+                "games": num_games,
+            },
+            retain="battle",
+        )
 
-            # Update scores
-            if result == GameResult.WIN:
-                ai1_wins += 1
-                result_text = "[bold green]WIN[/bold green]"
-            elif result == GameResult.LOSE:
-                ai2_wins += 1
-                result_text = "[bold red]LOSS[/bold red]"
-            else:
-                ties += 1
-                result_text = "[yellow]TIE[/yellow]"
-
-            # Add row to results
-            score_text = f"{ai1_wins}-{ai2_wins}-{ties}"
-            results_display.add_row(
-                f"#{game_num}",
-                f"{Game.get_move_emoji(ai1_move)} {ai1_move}",
-                result_text,
-                f"{Game.get_move_emoji(ai2_move)} {ai2_move}",
-                score_text,
-            )
-
-            # Update display every game
-            console.clear()
-            self.show_title()
-            console.print(f"\n[bold cyan]⚔️  {ai1.name} vs {ai2.name} ⚔️[/bold cyan]\n")
-            console.print(results_display)
-
-            # Show current score prominently
-            score_panel = Panel(
-                f"[bold green]{ai1.name}: {ai1_wins}[/bold green]  |  "
-                f"[bold yellow]{ai2.name}: {ai2_wins}[/bold yellow]  |  "
-                f"Ties: {ties}",
-                title=f"Score After Game {game_num}/{num_games}",
-                style="cyan",
-            )
-            console.print(score_panel)
-
-            # Pause briefly between games (shorter for more games)
-            pause_time = 0.5 if num_games > 20 else 0.8 if num_games > 10 else 1.2
-            time.sleep(pause_time)
+        with seeded(battle_seed), Live(view, console=console, refresh_per_second=10):
+            for game_num in range(1, num_games + 1):
+                ai1_move, ai2_move, result = matchup.play_game()
+                ROUNDS_PLAYED.inc(mode="ai_battle")
+
+                view.add_game(ai1_move, ai2_move, result)
+                replay.add_game(ai1_move, ai2_move)
+                self._publish(
+                    {
+                        "type": "game",
+                        "game": game_num,
+                        "ai1_move": ai1_move.value,
+                        "ai2_move": ai2_move.value,
+                        "result": result.value,
+                        "score": list(matchup.score),
+                    }
+                )
+
+                # Pause briefly between games (shorter for more games)
+                pause_time = 0.5 if num_games > 20 else 0.8 if num_games > 10 else 1.2
+                await self.pacer.wait_async(pause_time)
+
+        ai1_wins, ai2_wins, ties = matchup.score
+        winner = matchup.winner
+        self._publish(
+            {
+                "type": "battle_end",
+                "score": list(matchup.score),
+                "winner": winner.name if winner else None,
+            },
+            retain="battle",
+        )
 
         # Final summary
-        console.clear()
         self.show_title()
         console.print("\n[bold cyan]⚔️  BATTLE COMPLETE! ⚔️[/bold cyan]\n")
 
         # Determine winner
-        if ai1_wins > ai2_wins:
+        if winner is ai1:
             winner_text = f"[bold green]🎉 {ai1.name} WINS THE BATTLE! 🎉[/bold green]"
-        elif ai2_wins > ai1_wins:
+        elif winner is ai2:
             winner_text = (
                 f"[bold yellow]🎉 {ai2.name} WINS THE BATTLE! 🎉[/bold yellow]"
             )
@@ -618,12 +865,93 @@ class RockPaperScissorsGame:
         console.print(
             "\n[dim]Note: AI battles are not recorded on the leaderboard.[/dim]"
         )
+        if self.replay_dir is not None:
+            path = replay_path(self.replay_dir, ai1.name, ai2.name)
+            await run_blocking(replay.save, path)
+            console.print(
+                f"[dim]Replay saved: python -m src.replay show {path}[/dim]"
+            )
+
+        await self._ask(Prompt, "\nPress Enter to return to main menu")
+
+    async def ai_tournament(self):
+        """Run an AI tournament in the format the player picks."""
+        from src.checkpoint import describe
+
+        self.show_title()
+        console.print("\n[bold cyan]🏆 AI TOURNAMENT MODE 🏆[/bold cyan]\n")
+        checkpoint = self._load_checkpoint()
+        if checkpoint is not None:
+            console.print(
+                f"[yellow]An interrupted tournament was saved at "
+                f"{checkpoint['saved']}: {describe(checkpoint)}.[/yellow]"
+            )
+            resume = await self._ask(
+                Prompt, "Resume it?", choices=["y", "n"], default="y"
+            )
+            if resume == "y":
+                await self._resume_tournament(checkpoint)
+                return
+            console.print()
+        console.print("1. Round robin: 2-4 AIs, everyone plays everyone")
+        console.print("2. Swiss: dozens to hundreds of AI variants")
+        choice = await self._ask(
+            Prompt, "\nTournament format", choices=["1", "2"], default="1"
+        )
+        if choice == "2":
+            await self.swiss_tournament()
+        else:
+            await self.round_robin_tournament()
+
+    def _load_checkpoint(self) -> Optional[Dict]:
+        """The saved checkpoint of an interrupted tournament, if there is one."""
+        from src.checkpoint import load_checkpoint
+
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return None
+        try:
+            return load_checkpoint(self.checkpoint_file)
+        except ValueError as exc:
+            console.print(f"[dim]Ignoring the tournament checkpoint: {exc}[/dim]")
+            return None
+
+    async def resume_tournament(self):
+        """Carry on with the interrupted tournament (``--resume``)."""
+        checkpoint = self._load_checkpoint()
+        if checkpoint is None:
+            console.print(
+                "[yellow]There is no interrupted tournament to resume.[/yellow]"
+            )
+            await self.pacer.wait_async(2)
+            return
+        await self._resume_tournament(checkpoint)
+
+    async def _resume_tournament(self, checkpoint: Dict):
+        from src.checkpoint import restore_random
+        from src.sequential import SequentialTest
+        from src.swiss import SwissTournament
 
-        Prompt.ask("\nPress Enter to return to main menu")
+        self.show_title()
+        console.print("\n[bold cyan]🏆 AI TOURNAMENT MODE 🏆[/bold cyan]\n")
+        if checkpoint["kind"] == "swiss":
+            tournament = SwissTournament.from_checkpoint(checkpoint)
+            restore_random(checkpoint)
+            await self._play_swiss(tournament)
+            return
+        config = checkpoint["config"]
+        settings = config["sequential"]
+        restore_random(checkpoint)
+        await self._play_round_robin(
+            config["players"],
+            config["games_per_matchup"],
+            SequentialTest(*settings) if settings else None,
+            checkpoint["progress"],
+        )
 
-    def ai_tournament(self):
+    async def round_robin_tournament(self):
         """Run a round-robin AI tournament."""
-        console.clear()
+        from src.ai import AI_OPPONENTS
+
         self.show_title()
 
         console.print("\n[bold cyan]🏆 AI TOURNAMENT MODE 🏆[/bold cyan]\n")
@@ -633,8 +961,11 @@ class RockPaperScissorsGame:
         console.print("[dim]Each AI will play against every other AI.[/dim]\n")
 
         # Select number of participants
-        num_participants = IntPrompt.ask(
-            "How many AI players should compete?", choices=["2", "3", "4"], default=4
+        num_participants = await self._ask(
+            IntPrompt,
+            "How many AI players should compete?",
+            choices=["2", "3", "4"],
+            default=4,
         )
 
         # Select AI participants
@@ -642,50 +973,36 @@ class RockPaperScissorsGame:
         selected_indices = []
 
         for i in range(num_participants):
-            console.clear()
-            self.show_title()
-            console.print("\n[bold cyan]🏆 AI TOURNAMENT MODE 🏆[/bold cyan]\n")
-
+            header = ["\n[bold cyan]🏆 AI TOURNAMENT MODE 🏆[/bold cyan]\n"]
             if selected_ais:
-                console.print("[bold green]Selected Players:[/bold green]")
+                header.append("[bold green]Selected Players:[/bold green]")
                 for j, ai_info in enumerate(selected_ais, 1):
-                    console.print(f"  {j}. {ai_info['name']} ({ai_info['difficulty']})")
-                console.print()
-
-            console.print(f"[bold yellow]SELECT PLAYER #{i + 1}:[/bold yellow]\n")
+                    header.append(f"  {j}. {ai_info['name']} ({ai_info['difficulty']})")
+                header.append("")
+            header.append(f"[bold yellow]SELECT PLAYER #{i + 1}:[/bold yellow]\n")
 
             # Show available AIs (excluding already selected)
-            table = Table(show_header=True, box=box.ROUNDED, style="cyan")
-            table.add_column("#", style="bold", width=3)
-            table.add_column("Name", style="bold yellow")
-            table.add_column("Difficulty", style="bold")
-            table.add_column("Personality")
-
-            available_choices = []
-            for idx, ai in enumerate(AI_OPPONENTS):
-                if idx not in selected_indices:
-                    difficulty_color = {
-                        "Easy": "green",
-                        "Medium": "yellow",
-                        "Hard": "red",
-                    }.get(ai["difficulty"], "white")
-                    table.add_row(
-                        str(idx + 1),
-                        ai["name"],
-                        f"[{difficulty_color}]{ai['difficulty']}[/{difficulty_color}]",
-                        ai["personality"],
-                    )
-                    available_choices.append(str(idx + 1))
-
-            console.print(table)
-
-            choice = IntPrompt.ask("\nSelect AI player", choices=available_choices)
+            excluded = tuple(sorted(selected_indices))
+            self.show_title(
+                screen.render(*header),
+                screen.cached(
+                    ("opponents", excluded), partial(_opponent_table, excluded)
+                ),
+            )
+            available_choices = [
+                str(idx + 1)
+                for idx in range(len(AI_OPPONENTS))
+                if idx not in selected_indices
+            ]
+
+            choice = await self._ask(
+                IntPrompt, "\nSelect AI player", choices=available_choices
+            )
             ai_index = choice - 1
             selected_indices.append(ai_index)
             selected_ais.append(AI_OPPONENTS[ai_index])
 
         # Get number of games per matchup
-        console.clear()
         self.show_title()
         console.print("\n[bold cyan]🏆 AI TOURNAMENT MODE 🏆[/bold cyan]\n")
 
@@ -694,7 +1011,27 @@ class RockPaperScissorsGame:
             console.print(f"  {i}. {ai_info['name']} ({ai_info['difficulty']})")
         console.print()
 
-        games_per_matchup = IntPrompt.ask("How many games per matchup?", default=10)
+        games_per_matchup = await self._ask(
+            IntPrompt, "How many games per matchup?", default=10
+        )
+        sequential = await self._ask_sequential()
+        await self._play_round_robin(selected_indices, games_per_matchup, sequential)
+
+    async def _play_round_robin(
+        self,
+        selected_indices: List[int],
+        games_per_matchup: int,
+        sequential: Optional["SequentialTest"],
+        resume: Optional[Dict] = None,
+    ):
+        """Play a round robin, or carry on from a checkpoint's ``resume``."""
+        from src.ai import AI_OPPONENTS, create_ai
+        from src.checkpoint import Checkpointer, matchup_state, restore_matchup
+        from src.engine import Matchup
+        from src.sequential import AI1, AI2, format_interval, score_interval
+
+        selected_ais = [AI_OPPONENTS[index] for index in selected_indices]
+        num_participants = len(selected_ais)
 
         # Calculate total matches
         total_matches = (num_participants * (num_participants - 1)) // 2
@@ -703,7 +1040,25 @@ class RockPaperScissorsGame:
         console.print(
             f"\n[yellow]Tournament will consist of {total_matches} matchups ({total_games} total games)[/yellow]"
         )
-        time.sleep(2)
+        if sequential is not None:
+            console.print(
+                "[dim]Matchups stop as soon as the result is clear, "
+                "so most will be shorter.[/dim]"
+            )
+        if resume is not None:
+            console.print(
+                f"[green]Resuming after {resume['next_matchup']} finished "
+                f"matchups.[/green]"
+            )
+        await self.pacer.wait_async(2)
+        self._publish(
+            {
+                "type": "tournament_start",
+                "players": [ai_info["name"] for ai_info in selected_ais],
+                "games_per_matchup": games_per_matchup,
+            },
+            retain="tournament",
+        )
 
         # Initialize tournament stats
         tournament_stats = {}
@@ -714,12 +1069,52 @@ class RockPaperScissorsGame:
                 "ties": 0,
                 "matches_played": 0,
             }
+        next_matchup = 0
+        resumed_matchup = None
+        if resume is not None:
+            tournament_stats = resume["stats"]
+            next_matchup = resume["next_matchup"]
+            resumed_matchup = resume["matchup"]
+
+        profiler = None
+        if self.profile_ai:
+            from src.profiling import Profiler
+
+            profiler = Profiler(track_allocations=self.profile_ai == "alloc")
+            profiler.start()
+
+        checkpointer = None
+        if self.checkpoint_file:
+            checkpointer = Checkpointer(
+                self.checkpoint_file,
+                "round_robin",
+                {
+                    "players": selected_indices,
+                    "games_per_matchup": games_per_matchup,
+                    "sequential": sequential.settings() if sequential else None,
+                },
+            )
+        # The matchup being played, if any, for checkpoints
+        in_progress = None
+
+        def progress() -> Dict:
+            return {
+                "next_matchup": next_matchup,
+                "matchups": total_matches,
+                "stats": tournament_stats,
+                "matchup": matchup_state(in_progress) if in_progress else None,
+            }
 
         # Run all matchups
-        matchup_num = 0
-        for i in range(len(selected_ais)):
-            for j in range(i + 1, len(selected_ais)):
-                matchup_num += 1
+        pairs = [
+            (i, j)
+            for i in range(len(selected_ais))
+            for j in range(i + 1, len(selected_ais))
+        ]
+        try:
+            for matchup_num, (i, j) in enumerate(
+                pairs[next_matchup:], next_matchup + 1
+            ):
                 ai1_info = selected_ais[i]
                 ai2_info = selected_ais[j]
 
@@ -727,7 +1122,6 @@ class RockPaperScissorsGame:
                 ai1 = create_ai(selected_indices[i])
                 ai2 = create_ai(selected_indices[j])
 
-                console.clear()
                 self.show_title()
                 console.print(
                     f"\n[bold cyan]🏆 TOURNAMENT - Match {matchup_num}/{total_matches} 🏆[/bold cyan]\n"
@@ -742,48 +1136,62 @@ class RockPaperScissorsGame:
                 )
                 console.print(matchup_panel)
                 console.print("\n[yellow]Playing games...[/yellow]\n")
-                time.sleep(1)
+                await self.pacer.wait_async(1)
+                self._publish(
+                    {
+                        "type": "battle_start",
+                        "ai1": ai1.name,
+                        "ai2": ai2.name,
+                        "games": games_per_matchup,
+                        "matchup": matchup_num,
+                        "matchups": total_matches,
+                    },
+                    retain="battle",
+                )
 
                 # Play games for this matchup
-                ai1_wins = 0
-                ai2_wins = 0
-                ties = 0
-                ai1_history = []
-                ai2_history = []
-
-                for game_num in range(games_per_matchup):
-                    # AI 1 makes move
-                    ai1_move = ai1.make_move(ai2_history)
-                    ai1.record_move(ai1_move)
-                    ai1_history.append(ai1_move)
-
-                    # AI 2 makes move
-                    ai2_move = ai2.make_move(ai1_history)
-                    ai2.record_move(ai2_move)
-                    ai2_history.append(ai2_move)
-
-                    # Determine winner
-                    result = Game.determine_winner(ai1_move, ai2_move)
-
-                    # Update adaptive AIs
-                    if isinstance(ai1, AdaptiveAI):
-                        if result == GameResult.WIN:
-                            ai1.record_win(ai1_move)
-                        elif result == GameResult.LOSE:
-                            ai1.record_loss(ai1_move)
-                    if isinstance(ai2, AdaptiveAI):
-                        if result == GameResult.LOSE:  # AI2 won
-                            ai2.record_win(ai2_move)
-                        elif result == GameResult.WIN:  # AI2 lost
-                            ai2.record_loss(ai2_move)
-
-                    # Update scores
-                    if result == GameResult.WIN:
-                        ai1_wins += 1
-                    elif result == GameResult.LOSE:
-                        ai2_wins += 1
-                    else:
-                        ties += 1
+                matchup = Matchup(ai1, ai2, profiler=profiler)
+                if resumed_matchup is not None:
+                    restore_matchup(matchup, resumed_matchup)
+                    resumed_matchup = None
+                in_progress = matchup
+                decision = None
+                for game_num in range(matchup.games_played + 1, games_per_matchup + 1):
+                    ai1_move, ai2_move, result = matchup.play_game()
+                    ROUNDS_PLAYED.inc(mode="tournament")
+                    self._publish(
+                        {
+                            "type": "game",
+                            "game": game_num,
+                            "ai1_move": ai1_move.value,
+                            "ai2_move": ai2_move.value,
+                            "result": result.value,
+                            "score": list(matchup.score),
+                        }
+                    )
+                    if sequential is not None and game_num % sequential.batch == 0:
+                        decision = sequential.decide(*matchup.score)
+                        if decision is not None:
+                            break
+                    if game_num % CHECKPOINT_GAMES == 0:
+                        # Give Ctrl+C (which cancels this task) a place to land
+                        await asyncio.sleep(0)
+                        if checkpointer is not None and checkpointer.due():
+                            checkpointer.save(progress())
+
+                ai1_wins, ai2_wins, ties = matchup.score
+                if decision is not None:
+                    winner = {AI1: ai1, AI2: ai2}.get(decision)
+                else:
+                    winner = matchup.winner
+                self._publish(
+                    {
+                        "type": "battle_end",
+                        "score": list(matchup.score),
+                        "winner": winner.name if winner else None,
+                    },
+                    retain="battle",
+                )
 
                 # Update tournament stats
                 tournament_stats[ai1.name]["wins"] += ai1_wins
@@ -795,27 +1203,47 @@ class RockPaperScissorsGame:
                 tournament_stats[ai2.name]["losses"] += ai1_wins
                 tournament_stats[ai2.name]["ties"] += ties
                 tournament_stats[ai2.name]["matches_played"] += 1
+                in_progress = None
+                next_matchup += 1
 
                 # Show matchup result
                 console.print(f"[bold green]{ai1.name}:[/bold green] {ai1_wins} wins")
                 console.print(f"[bold yellow]{ai2.name}:[/bold yellow] {ai2_wins} wins")
                 console.print(f"[dim]Ties: {ties}[/dim]")
+                if decision is not None:
+                    console.print(
+                        f"[dim]Decided after {matchup.games_played} of "
+                        f"{games_per_matchup} games[/dim]"
+                    )
 
-                if ai1_wins > ai2_wins:
+                if winner is ai1:
                     console.print(
                         f"\n[bold green]✓ {ai1.name} wins this matchup![/bold green]"
                     )
-                elif ai2_wins > ai1_wins:
+                elif winner is ai2:
                     console.print(
                         f"\n[bold yellow]✓ {ai2.name} wins this matchup![/bold yellow]"
                     )
                 else:
                     console.print(f"\n[dim]Draw in this matchup![/dim]")
 
-                time.sleep(2)
+                await self.pacer.wait_async(2)
+                if checkpointer is not None and checkpointer.due():
+                    checkpointer.save(progress())
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # Interrupted (Ctrl+C): save progress to pick up with --resume.
+            # Before Python 3.11, asyncio.run lets KeyboardInterrupt out of
+            # the running task instead of cancelling it.
+            if checkpointer is not None:
+                checkpointer.save(progress())
+            raise
+        if checkpointer is not None:
+            checkpointer.clear()
+
+        if profiler is not None:
+            profiler.stop()
 
         # Display final tournament standings
-        console.clear()
         self.show_title()
         console.print("\n[bold cyan]🏆 TOURNAMENT FINAL STANDINGS 🏆[/bold cyan]\n")
 
@@ -832,10 +1260,17 @@ class RockPaperScissorsGame:
                     "ties": stats["ties"],
                     "total": total_games,
                     "win_rate": win_rate,
+                    "score": score_interval(
+                        stats["wins"], stats["losses"], stats["ties"]
+                    )[0],
                 }
             )
 
-        standings.sort(key=lambda x: (x["wins"], x["win_rate"]), reverse=True)
+        if sequential is not None:
+            # Matchups differ in length, so rank by score per game, not totals
+            standings.sort(key=lambda x: x["score"], reverse=True)
+        else:
+            standings.sort(key=lambda x: (x["wins"], x["win_rate"]), reverse=True)
 
         # Display standings table
         standings_table = Table(
@@ -848,10 +1283,19 @@ class RockPaperScissorsGame:
         standings_table.add_column("Ties", justify="center")
         standings_table.add_column("Total", justify="center")
         standings_table.add_column("Win Rate", justify="center")
+        standings_table.add_column("Score ± 95%", justify="center", no_wrap=True)
+        if profiler is not None:
+            from src.profiling import format_bytes, format_seconds
+
+            standings_table.add_column("Move p50", justify="right", style="dim")
+            standings_table.add_column("Move p99", justify="right", style="dim")
+            standings_table.add_column("Move max", justify="right", style="dim")
+            if profiler.track_allocations:
+                standings_table.add_column("Alloc p99", justify="right", style="dim")
 
         for i, player in enumerate(standings, 1):
             rank_emoji = {1: "🥇", 2: "🥈", 3: "🥉", 4: "4th"}.get(i, f"{i}.")
-            standings_table.add_row(
+            row = [
                 rank_emoji,
                 player["name"],
                 str(player["wins"]),
@@ -859,9 +1303,42 @@ class RockPaperScissorsGame:
                 str(player["ties"]),
                 str(player["total"]),
                 f"{player['win_rate']:.1f}%",
-            )
+                format_interval(player["wins"], player["losses"], player["ties"]),
+            ]
+            if profiler is not None:
+                profile = profiler.get(player["name"])
+                row += [
+                    format_seconds(profile.make_move.quantile(0.50)),
+                    format_seconds(profile.make_move.quantile(0.99)),
+                    format_seconds(profile.make_move.max),
+                ]
+                if profiler.track_allocations:
+                    row.append(format_bytes(profile.peak_alloc.quantile(0.99)))
+            standings_table.add_row(*row)
 
         console.print(standings_table)
+        if profiler is not None:
+            profile_path = os.path.join(
+                os.path.dirname(self.leaderboard.data_file), "ai_profile.json"
+            )
+            profiler.write_json(profile_path)
+            console.print(f"[dim]Full AI profile written to {profile_path}[/dim]")
+        self._publish(
+            {
+                "type": "tournament_end",
+                "standings": [
+                    {
+                        "name": player["name"],
+                        "wins": player["wins"],
+                        "losses": player["losses"],
+                        "ties": player["ties"],
+                        "win_rate": player["win_rate"],
+                    }
+                    for player in standings
+                ],
+            },
+            retain="tournament",
+        )
 
         # Announce winner
         winner = standings[0]
@@ -876,41 +1353,319 @@ class RockPaperScissorsGame:
             "\n[dim]Note: Tournament results are not recorded on the leaderboard.[/dim]"
         )
 
-        Prompt.ask("\nPress Enter to return to main menu")
+        await self._ask(Prompt, "\nPress Enter to return to main menu")
 
-    def run(self):
-        """Main game loop."""
-        while True:
+    async def _ask_sequential(self) -> Optional["SequentialTest"]:
+        """Ask whether matchups should stop early; the test to use if so."""
+        early = await self._ask(
+            Prompt,
+            "Stop each matchup early once the result is clear?",
+            choices=["y", "n"],
+            default="n",
+        )
+        if early != "y":
+            return None
+        from src.sequential import SequentialTest
+
+        return SequentialTest()
+
+    async def swiss_tournament(self):
+        """Run a Swiss-system tournament over a large field of AI variants."""
+        from src.swiss import SwissTournament, build_field, default_rounds
+
+        self.show_title()
+        console.print("\n[bold cyan]🏆 SWISS TOURNAMENT 🏆[/bold cyan]\n")
+        console.print(
+            "[yellow]Every AI opponent, plus Mind Reader Mike variants with more "
+            "or less randomness.[/yellow]"
+        )
+        console.print(
+            "[dim]Each round pairs AIs with similar scores who haven't met yet.[/dim]\n"
+        )
+
+        size = max(2, await self._ask(IntPrompt, "How many entrants?", default=32))
+        games_per_matchup = await self._ask(
+            IntPrompt, "How many games per matchup?", default=20
+        )
+        rounds = await self._ask(
+            IntPrompt, "How many rounds?", default=default_rounds(size)
+        )
+        sequential = await self._ask_sequential()
+
+        tournament = SwissTournament(
+            build_field(size), games_per_matchup, rounds, sequential=sequential
+        )
+        await self._play_swiss(tournament)
+
+    async def _play_swiss(self, tournament: "SwissTournament"):
+        """Play a Swiss tournament's remaining matchups and show the standings."""
+        from rich.progress import Progress
+
+        from src.checkpoint import Checkpointer
+        from src.sequential import format_interval
+
+        size = len(tournament.entrants)
+        self._publish(
+            {
+                "type": "tournament_start",
+                "players": [entrant.name for entrant in tournament.entrants],
+                "games_per_matchup": tournament.games_per_matchup,
+            },
+            retain="tournament",
+        )
+        checkpointer = None
+        if self.checkpoint_file:
+            checkpointer = Checkpointer(
+                self.checkpoint_file, "swiss", tournament.config()
+            )
+
+        def on_matchup(round_num, entrant1, entrant2, matchup):
+            ROUNDS_PLAYED.inc(matchup.games_played, mode="tournament")
+            progress.advance(task)
+
+        console.print()
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task(
+                "Playing rounds...",
+                total=tournament.rounds * (size // 2),
+                completed=tournament.matchups_played,
+            )
             try:
-                choice = self.main_menu()
+                while not tournament.finished:
+                    tournament.play_next(on_matchup)
+                    progress.update(
+                        task,
+                        description=f"Round {tournament.round}/{tournament.rounds}",
+                    )
+                    # Let spectators, background saves and Ctrl+C in between
+                    await asyncio.sleep(0)
+                    if checkpointer is not None and checkpointer.due():
+                        checkpointer.save(tournament.state())
+            except (asyncio.CancelledError, KeyboardInterrupt):
+                if checkpointer is not None:
+                    checkpointer.save(tournament.state())
+                raise
+        if checkpointer is not None:
+            checkpointer.clear()
+
+        standings = tournament.standings()
+        self.show_title()
+        console.print("\n[bold cyan]🏆 SWISS TOURNAMENT STANDINGS 🏆[/bold cyan]\n")
+        table = Table(
+            show_header=True,
+            box=box.ROUNDED,
+            style="cyan",
+            title=f"Top {min(SWISS_STANDINGS_ROWS, size)} of {size} "
+            f"({tournament.rounds} rounds, {tournament.matchups_played} matchups)",
+        )
+        table.add_column("Rank", style="bold", width=6)
+        table.add_column("Player", style="bold yellow", no_wrap=True)
+        table.add_column("Points", justify="center", style="green")
+        table.add_column("Buchholz", justify="center")
+        table.add_column("W-L-T", justify="center")
+        table.add_column("Score ± 95%", justify="center", no_wrap=True)
+        for rank, entrant in enumerate(standings[:SWISS_STANDINGS_ROWS], 1):
+            table.add_row(
+                {1: "🥇", 2: "🥈", 3: "🥉"}.get(rank, f"{rank}."),
+                entrant.name,
+                f"{entrant.points:g}",
+                f"{entrant.buchholz:g}",
+                f"{entrant.wins}-{entrant.losses}-{entrant.ties}",
+                format_interval(entrant.wins, entrant.losses, entrant.ties),
+            )
+        console.print(table)
+        self._publish(
+            {
+                "type": "tournament_end",
+                "standings": [
+                    {
+                        "name": entrant.name,
+                        "wins": entrant.wins,
+                        "losses": entrant.losses,
+                        "ties": entrant.ties,
+                        "win_rate": entrant.win_rate,
+                    }
+                    for entrant in standings[:SWISS_STANDINGS_ROWS]
+                ],
+            },
+            retain="tournament",
+        )
+        console.print(
+            f"\n[bold green]🎉 TOURNAMENT CHAMPION: {standings[0].name}! 🎉[/bold green]"
+        )
+        console.print(
+            "\n[dim]Note: Tournament results are not recorded on the leaderboard.[/dim]"
+        )
+
+        await self._ask(Prompt, "\nPress Enter to return to main menu")
+
+    async def run_async(self):
+        """Main game loop.
+
+        Input is read in a worker thread while sounds and leaderboard saves
+        run as background tasks, so none of them hold up the next screen.
+        """
+        def preload_sounds():
+            # Imported here so loading the audio modules doesn't delay the menu
+            from src.sounds import preload
+
+            preload()
+
+        if self.seed is not None:
+            random.seed(self.seed)
+        # Decode the round sounds and read the leaderboard in the background
+        # while the menu is up
+        self.tasks.spawn(preload_sounds)
+        self.tasks.spawn_serial(self.leaderboard.load)
+        if self.spectate_port is not None and self.broadcaster is None:
+            from src.spectator import Broadcaster
+
+            self.broadcaster = Broadcaster()
+            await self.broadcaster.start(port=self.spectate_port)
+        metrics_api = None
+        if self.metrics_port is not None:
+            from src.http_api import ApiServer
+
+            metrics_api = ApiServer(None)
+            await metrics_api.start(port=self.metrics_port)
+
+        try:
+            if self.resume:
+                screen.screen = "tournament"
+                await self.resume_tournament()
+            while True:
+                choice = await self.main_menu()
+                screen.screen = SCREEN_NAMES.get(choice, "menu")
 
                 if choice == "1":
-                    self.play_vs_ai()
+                    await self.play_vs_ai()
                 elif choice == "2":
-                    self.play_vs_human()
+                    await self.play_vs_human()
                 elif choice == "3":
-                    self.ai_vs_ai_battle()
+                    await self.ai_vs_ai_battle()
                 elif choice == "4":
-                    self.ai_tournament()
+                    await self.ai_tournament()
                 elif choice == "5":
-                    self.view_leaderboard()
+                    await self.view_leaderboard()
                 elif choice == "6":
-                    self.view_player_stats()
+                    await self.view_player_stats()
                 elif choice == "7":
+                    await self.play_online()
+                elif choice == "8":
                     console.clear()
                     console.print(
                         "\n[bold cyan]Thanks for playing! See you next time! 👋[/bold cyan]\n"
                     )
                     break
-            except KeyboardInterrupt:
-                console.print("\n\n[yellow]Game interrupted. Goodbye![/yellow]\n")
-                break
+        finally:
+            # Make sure pending saves reach the disk before the loop closes
+            await self.tasks.drain()
+            from src.sounds import close as close_sounds
+
+            close_sounds()
+            if self.metrics_file:
+                metrics.REGISTRY.write_textfile(self.metrics_file)
+            if metrics_api is not None:
+                await metrics_api.close()
+            if self.broadcaster is not None:
+                await self.broadcaster.close()
+
+    def run(self):
+        """Run the game loop until the player quits."""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            console.print("\n\n[yellow]Game interrupted. Goodbye![/yellow]\n")
 
 
 def main():
     """Entry point."""
-    game = RockPaperScissorsGame()
-    game.run()
+    from src.paths import DEFAULT_CHECKPOINT_FILE, DEFAULT_REPLAY_DIR
+
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors TUI game")
+    parser.add_argument(
+        "--pace",
+        choices=[str(mode) for mode in PacingMode],
+        default=str(PacingMode.NORMAL),
+        help="How long screens pause between steps (turbo disables pauses)",
+    )
+    parser.add_argument(
+        "--spectate-port",
+        type=int,
+        default=None,
+        help="Broadcast AI battles and tournaments to spectators on this port",
+    )
+    parser.add_argument(
+        "--profile-ai",
+        nargs="?",
+        const="time",
+        choices=["time", "alloc"],
+        default=None,
+        help="Show AI decision latency (and with 'alloc', memory) in tournaments",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        default=None,
+        help="Record this session's inputs for replay with python -m src.session",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed the AIs' random choices"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics at http://localhost:PORT/metrics",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Write Prometheus metrics to this file (e.g. for a textfile collector)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Resume the last interrupted tournament (from {DEFAULT_CHECKPOINT_FILE})",
+    )
+    parser.add_argument(
+        "--save-replays",
+        nargs="?",
+        const=DEFAULT_REPLAY_DIR,
+        metavar="DIR",
+        default=None,
+        help=f"Save every AI battle as a replay in DIR (default {DEFAULT_REPLAY_DIR})",
+    )
+    args = parser.parse_args()
+
+    seed = args.seed
+    session = None
+    if args.record:
+        from src.session import SessionRecorder
+
+        if seed is None:
+            seed = random.randrange(2**32)
+        session = SessionRecorder(
+            args.record, seed, options={"profile_ai": args.profile_ai}
+        )
+
+    game = RockPaperScissorsGame(
+        pacer=Pacer(PacingMode(args.pace)),
+        spectate_port=args.spectate_port,
+        profile_ai=args.profile_ai,
+        metrics_port=args.metrics_port,
+        metrics_file=args.metrics_file,
+        seed=seed,
+        session=session,
+        replay_dir=args.save_replays,
+        checkpoint_file=DEFAULT_CHECKPOINT_FILE,
+        resume=args.resume,
+    )
+    try:
+        game.run()
+    finally:
+        if session is not None:
+            session.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+"""On-disk cache of headless matchup results.
+
+A seeded matchup is deterministic: the same two strategies, set up the same
+way, playing the same number of games from the same seed always end with
+the same score. ``MatchCache`` stores those scores under a content hash of
+everything that goes into them:
+
+* each AI's strategy: the source of its class and every ``AIPlayer`` base
+  (or the class's ``version`` attribute, if it has one), plus the
+  module-level tables and helper functions their methods use
+* each AI's parameters: its attributes before the first game
+  (``randomness_factor``, names, ...)
+* the source of the matchup engine and of the game rules (``src.game``)
+* the seed, the game count and the ``SequentialTest`` settings, if any
+
+Editing one strategy changes only the keys of matchups it plays in, so a
+rerun recomputes just those. The cache keeps the ``max_entries`` most
+recently used results and lives in one JSON file, written atomically by
+``save``.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import random
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import CodeType
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set
+
+from src import game
+from src.ai import AIPlayer
+from src.engine import Matchup
+
+if TYPE_CHECKING:
+    from src.sequential import SequentialTest
+
+DEFAULT_CACHE_FILE = "data/match_cache.json"
+CACHE_VERSION = 1
+
+# Strategy class -> hash of its source, so each class is read only once
+_class_hashes: Dict[type, str] = {}
+
+
+def _hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _source(obj) -> str:
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):  # Defined somewhere without source
+        return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _globals_used(klass: type) -> List[str]:
+    """The module globals ``klass``'s methods read, each as text to hash.
+
+    Tables are included by value and functions by source; helper functions
+    are followed to the globals they read in turn. Modules are left out.
+    """
+    namespace = vars(sys.modules[klass.__module__])
+    codes = []
+    for value in vars(klass).values():
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        if isinstance(value, property):
+            codes.extend(f.__code__ for f in (value.fget, value.fset) if f)
+        elif hasattr(value, "__code__"):
+            codes.append(value.__code__)
+
+    parts: Dict[str, str] = {}
+    seen: Set[CodeType] = set()
+    while codes:
+        code = codes.pop()
+        if code in seen:
+            continue
+        seen.add(code)
+        codes.extend(c for c in code.co_consts if isinstance(c, CodeType))
+        for name in code.co_names:  # Attribute names too; only globals count
+            if name in parts or name not in namespace:
+                continue
+            value = namespace[name]
+            if inspect.ismodule(value) or value is klass:
+                continue
+            if inspect.isfunction(value):
+                parts[name] = _source(value)
+                codes.append(value.__code__)
+            elif inspect.isclass(value):
+                parts[name] = _source(value)
+            else:
+                parts[name] = f"{name} = {value!r}"
+    return [parts[name] for name in sorted(parts)]
+
+
+def strategy_hash(cls: type) -> str:
+    """Hash of a strategy class: its ``version`` if set, else its source.
+
+    Source hashes also cover the module globals the class uses.
+    """
+    cached = _class_hashes.get(cls)
+    if cached is None:
+        parts = []
+        for klass in cls.__mro__:
+            if not issubclass(klass, AIPlayer):
+                break
+            version = klass.__dict__.get("version")
+            if version is not None:
+                parts.append(f"{klass.__qualname__}=v{version}")
+            else:
+                parts.append(_source(klass))
+                parts.extend(_globals_used(klass))
+        cached = _class_hashes[cls] = _hash("\n".join(parts))
+    return cached
+
+
+def ai_fingerprint(ai: AIPlayer) -> Dict:
+    """Everything about a freshly built AI that can change how it plays."""
+    params = sorted(
+        (name, value) for name, value in vars(ai).items() if not callable(value)
+    )
+    # repr, not JSON: some AIs keep dicts keyed by Move
+    return {"strategy": strategy_hash(type(ai)), "params": repr(params)}
+
+
+def derive_seed(seed: int, *parts) -> int:
+    """A 64-bit seed for one matchup, from the run's seed and what it is."""
+    text = ":".join(str(part) for part in (seed,) + parts)
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+@contextmanager
+def seeded(seed: Optional[int]) -> Iterator[None]:
+    """Run the block with ``random`` seeded, then restore its old state.
+
+    With ``seed=None`` the block just uses ``random`` as it is.
+    """
+    if seed is None:
+        yield
+        return
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def play_seeded(
+    matchup: Matchup,
+    games: int,
+    seed: Optional[int] = None,
+    sequential: Optional["SequentialTest"] = None,
+) -> Optional[str]:
+    """Play ``games`` games (or until ``sequential`` decides) from ``seed``.
+
+    Returns the sequential decision, or None without one.
+    """
+    with seeded(seed):
+        if sequential is not None:
+            return sequential.run(matchup, games)
+        matchup.play(games)
+        return None
+
+
+class MatchCache:
+    """Seeded matchup results, least recently used evicted first."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_FILE, max_entries: int = 100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, List]" = OrderedDict()
+        self._engine_hash = _hash(
+            _source(sys.modules[Matchup.__module__]) + _source(game)
+        )
+        self._dirty = False
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self):
+        """Read the cache file; a missing or unreadable one starts empty."""
+        entries: "OrderedDict[str, List]" = OrderedDict()
+        if os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    entries = OrderedDict(data["entries"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                pass  # Corrupt: results can always be recomputed
+        self._entries = entries
+        self._dirty = False
+
+    def save(self):
+        """Write the cache if it changed (atomically, oldest entries first)."""
+        if not self._dirty and len(self._entries) <= self.max_entries:
+            return
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(
+                {"version": CACHE_VERSION, "entries": list(self._entries.items())},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+    def key(
+        self,
+        ai1: AIPlayer,
+        ai2: AIPlayer,
+        games: int,
+        seed: int,
+        sequential: Optional["SequentialTest"] = None,
+    ) -> str:
+        """Content hash identifying one matchup; build it before any games."""
+        settings = sequential.settings() if sequential is not None else None
+        return _hash(
+            json.dumps(
+                {
+                    "engine": self._engine_hash,
+                    "ai1": ai_fingerprint(ai1),
+                    "ai2": ai_fingerprint(ai2),
+                    "games": games,
+                    "seed": seed,
+                    "sequential": settings,
+                },
+                sort_keys=True,
+            )
+        )
+
+    def play(
+        self,
+        matchup: Matchup,
+        games: int,
+        seed: int,
+        sequential: Optional["SequentialTest"] = None,
+    ) -> Optional[str]:
+        """``play_seeded``, skipped when the result is already cached.
+
+        ``matchup`` must not have played yet. On a hit only its score is
+        filled in: the AIs and move histories stay as they were built.
+        """
+        key = self.key(matchup.ai1, matchup.ai2, games, seed, sequential)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self._dirty = True  # The order on disk is the LRU order
+            self.hits += 1
+            matchup.ai1_wins, matchup.ai2_wins, matchup.ties, decision = cached
+            return decision
+
+        self.misses += 1
+        decision = play_seeded(matchup, games, seed, sequential)
+        self._entries[key] = [*matchup.score, decision]
+        self._dirty = True
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return decision
@@ -0,0 +1,114 @@
+"""Pacing control for on-screen pauses (normal, fast, turbo)."""
+
+import asyncio
+import os
+import sys
+import time
+from enum import Enum
+
+
+class PacingMode(Enum):
+    """How long the TUI lingers on screens between steps."""
+
+    NORMAL = "normal"
+    FAST = "fast"
+    TURBO = "turbo"  # No pauses at all (headless / benchmarking)
+
+    def __str__(self):
+        return self.value
+
+
+# Multiplier applied to every requested pause
+_SCALE = {
+    PacingMode.NORMAL: 1.0,
+    PacingMode.FAST: 0.25,
+    PacingMode.TURBO: 0.0,
+}
+
+
+class Pacer:
+    """Central replacement for ``time.sleep`` in screen code.
+
+    Pauses are scaled by the current mode, and when ``skippable`` is set a
+    keypress on an interactive terminal ends the pause early.
+    """
+
+    def __init__(self, mode: PacingMode = PacingMode.NORMAL, skippable: bool = True):
+        self.mode = mode
+        self.skippable = skippable
+
+    def scaled(self, seconds: float) -> float:
+        """Return the actual pause length for a requested pause."""
+        return seconds * _SCALE[self.mode]
+
+    def wait(self, seconds: float) -> bool:
+        """Pause for ``seconds`` (scaled by mode).
+
+        Returns:
+            True if the pause was cut short by a keypress
+        """
+        duration = self.scaled(seconds)
+        if duration <= 0:
+            return False
+
+        if self.skippable and _stdin_is_tty():
+            return _wait_for_key(duration)
+
+        time.sleep(duration)
+        return False
+
+    async def wait_async(self, seconds: float) -> bool:
+        """Like ``wait``, but yields to the event loop while pausing."""
+        duration = self.scaled(seconds)
+        if duration <= 0:
+            return False
+
+        if self.skippable and _stdin_is_tty():
+            return await asyncio.to_thread(_wait_for_key, duration)
+
+        await asyncio.sleep(duration)
+        return False
+
+
+def _stdin_is_tty() -> bool:
+    try:
+        return sys.stdin is not None and sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _wait_for_key(duration: float) -> bool:
+    """Sleep up to ``duration`` seconds; return True early on a keypress."""
+    if sys.platform == "win32":
+        import msvcrt
+
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                while msvcrt.kbhit():
+                    msvcrt.getwch()
+                return True
+            time.sleep(0.02)
+        return False
+
+    import select
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    try:
+        old_attrs = termios.tcgetattr(fd)
+    except termios.error:
+        time.sleep(duration)
+        return False
+
+    try:
+        # cbreak: deliver single keys without waiting for Enter
+        tty.setcbreak(fd)
+        ready, _, _ = select.select([fd], [], [], duration)
+        if ready:
+            os.read(fd, 1024)  # Swallow the key so it doesn't leak into the next prompt
+            return True
+        return False
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
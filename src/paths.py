@@ -0,0 +1,8 @@
+"""Default locations of the game's data files.
+
+Kept free of imports so the command line can show them without loading
+the modules that use them.
+"""
+
+DEFAULT_CHECKPOINT_FILE = "data/tournament.ckpt"
+DEFAULT_REPLAY_DIR = "data/replays"
@@ -0,0 +1,198 @@
+"""Opt-in latency and allocation profiling of AI strategies.
+
+``Profiler.instrument`` wraps one AI's ``make_move`` and ``record_move``;
+AIs that aren't instrumented run untouched, so profiling costs nothing when
+it's off. Stats are grouped by AI name, so a strategy's figures add up
+across every matchup it plays.
+"""
+
+import json
+import math
+import os
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+from src.ai import AIPlayer
+
+_BUCKETS_PER_OCTAVE = 8
+
+
+class Histogram:
+    """Log-bucketed histogram of positive values (seconds, bytes, ...).
+
+    Buckets are an eighth of an octave wide, so quantiles are accurate to
+    within about 5% whatever the scale, in constant memory. ``max`` is exact.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        bucket = math.floor(math.log2(max(value, 1e-12)) * _BUCKETS_PER_OCTAVE)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile (0 if empty)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(2 ** ((bucket + 0.5) / _BUCKETS_PER_OCTAVE), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class StrategyProfile:
+    """Everything measured for one AI."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.make_move = Histogram()
+        self.record_move = Histogram()
+        # make_move latency by opponent history length (power-of-ten bucket),
+        # to spot strategies whose cost grows with the length of the game
+        self.by_history: Dict[int, Histogram] = {}
+        self.peak_alloc = Histogram()  # Bytes
+        self.retained_bytes = 0
+
+    def to_dict(self) -> Dict:
+        data = {
+            "make_move": self.make_move.to_dict(),
+            "record_move": self.record_move.to_dict(),
+            "make_move_by_history": {
+                f"<{10 ** (size + 1)}": hist.to_dict()
+                for size, hist in sorted(self.by_history.items())
+            },
+        }
+        if self.peak_alloc.count:
+            data["allocations"] = {
+                "peak_bytes_per_move": self.peak_alloc.to_dict(),
+                "retained_bytes": self.retained_bytes,
+            }
+        return data
+
+
+class Profiler:
+    """Collects per-strategy ``make_move``/``record_move`` latencies.
+
+    With ``track_allocations`` it also records, via ``tracemalloc``, the
+    peak memory each ``make_move`` call allocates and how much stays
+    allocated afterwards. Tracing slows every allocation down, so latencies
+    measured with it on are inflated; compare them only with each other.
+    """
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.strategies: Dict[str, StrategyProfile] = {}
+        self._started_tracing = False
+
+    def start(self):
+        """Start ``tracemalloc`` if tracking allocations (no-op otherwise)."""
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        """Stop ``tracemalloc`` if ``start`` started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def get(self, name: str) -> Optional[StrategyProfile]:
+        return self.strategies.get(name)
+
+    def instrument(self, ai: AIPlayer) -> AIPlayer:
+        """Wrap ``ai``'s move methods in place; returns the same AI."""
+        profile = self.strategies.get(ai.name)
+        if profile is None:
+            profile = self.strategies[ai.name] = StrategyProfile(ai.name)
+        make_move = ai.make_move
+        record_move = ai.record_move
+        perf_counter = time.perf_counter
+        track_allocations = self.track_allocations
+
+        def timed_make_move(opponent_history):
+            if track_allocations and tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                start = perf_counter()
+                move = make_move(opponent_history)
+                elapsed = perf_counter() - start
+                current, peak = tracemalloc.get_traced_memory()
+                profile.peak_alloc.add(max(peak - before, 0))
+                profile.retained_bytes += current - before
+            else:
+                start = perf_counter()
+                move = make_move(opponent_history)
+                elapsed = perf_counter() - start
+            profile.make_move.add(elapsed)
+            size = int(math.log10(len(opponent_history))) if opponent_history else 0
+            by_history = profile.by_history.get(size)
+            if by_history is None:
+                by_history = profile.by_history[size] = Histogram()
+            by_history.add(elapsed)
+            return move
+
+        def timed_record_move(move):
+            start = perf_counter()
+            record_move(move)
+            profile.record_move.add(perf_counter() - start)
+
+        ai.make_move = timed_make_move
+        ai.record_move = timed_record_move
+        return ai
+
+    def report(self) -> Dict[str, Dict]:
+        """All stats as plain data (seconds, bytes), by AI name."""
+        return {name: profile.to_dict() for name, profile in self.strategies.items()}
+
+    def write_json(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def format_seconds(seconds: float) -> str:
+    """Compact latency for tables: 850ns, 12.3µs, 4.5ms, 1.20s."""
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.1f}ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.1f}µs"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def format_bytes(size: float) -> str:
+    """Compact size for tables: 512B, 3.2KiB, 1.5MiB."""
+    if size >= 1 << 20:
+        return f"{size / (1 << 20):.1f}MiB"
+    if size >= 1 << 10:
+        return f"{size / (1 << 10):.1f}KiB"
+    return f"{size:.0f}B"
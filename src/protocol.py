@@ -0,0 +1,69 @@
+"""Wire protocol shared by the game server, client and tools.
+
+Messages are JSON objects, one per line (newline-delimited JSON), each with a
+``type`` field. Client to server:
+
+    {"type": "hello", "name": "bob"}
+    {"type": "play"}                        # ask to be paired for a match
+    {"type": "play", "bots": false}         # ...but never with a bot
+    {"type": "move", "round": 1, "move": "rock"}   # answer to round_start
+    {"type": "stats"}                       # server and matchmaking metrics
+    {"type": "quit"}
+
+Server to client:
+
+    {"type": "welcome", "name": "bob"}
+    {"type": "waiting", "queue_depth": 4}
+    {"type": "match_start", "match": 7, "opponent": "ann", "rounds": 3}
+    {"type": "round_start", "round": 1, "timeout": 30.0}
+    {"type": "round_result", "round": 1, "your_move": "rock",
+     "opponent_move": "paper", "result": "lose", "score": [0, 1, 0]}
+    {"type": "match_end", "result": "lose", "score": [1, 2, 0], "reason": "done"}
+    {"type": "stats", "players": 12, "active_matches": 5, "matches_played": 40,
+     "queue_depth": 2, "matched": 38, "bot_matches": 2,
+     "wait_p50": 0.4, "wait_p95": 6.1, "wait_max": 15.2}
+    {"type": "error", "message": "..."}
+
+Players are paired with someone of similar skill (see ``src/matchmaking.py``);
+if nobody suitable turns up in time the opponent is a bot, named like
+``"Pattern Pete (bot)"``. Results and scores are always from the receiving
+player's perspective (``score`` is ``[your wins, opponent wins, ties]``).
+A move must name the round it answers; one for a round that has already
+timed out is rejected rather than counted towards the next round.
+"""
+
+import json
+from typing import Dict, Optional
+
+from src.game import Move
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Longest line a peer may send; anything bigger is a protocol error
+MAX_LINE = 4096
+
+
+def encode(message: Dict) -> bytes:
+    """Serialize a message to one line of compact JSON."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode(line: bytes) -> Dict:
+    """Parse one line into a message dict.
+
+    Raises:
+        ValueError: If the line is not a JSON object with a ``type``
+    """
+    message = json.loads(line)
+    if not isinstance(message, dict) or "type" not in message:
+        raise ValueError("message must be a JSON object with a 'type'")
+    return message
+
+
+def parse_move(value) -> Optional[Move]:
+    """Turn a wire value ("rock", "paper", "scissors") into a Move."""
+    try:
+        return Move(value)
+    except ValueError:
+        return None
@@ -0,0 +1,83 @@
+"""Cache of pre-rendered screen fragments, written to the terminal in one go."""
+
+import time
+from typing import Callable, Dict, Hashable
+
+from rich.console import Console, RenderableType
+from rich.control import Control
+
+from src import metrics
+
+RENDER_SECONDS = metrics.histogram(
+    "rps_render_seconds",
+    "Time spent rendering screen fragments (render) and writing them (write)",
+    ["screen", "stage"],
+    buckets=metrics.FAST_BUCKETS,
+)
+
+# Escape codes Rich uses for console.clear()
+_CLEAR_HOME = Control.clear().segment.text + Control.home().segment.text
+
+
+class RenderCache:
+    """Renders static fragments once per terminal width and batches output.
+
+    Fragments are rendered to their final ANSI text with ``console.capture``
+    and kept until the terminal width changes, at which point the whole cache
+    is dropped and fragments are rebuilt on next use. ``write`` joins any
+    number of fragments into a single write to the terminal.
+
+    Render and write times are recorded in ``rps_render_seconds`` under the
+    current ``screen`` name, which the caller updates as the user moves
+    between screens.
+    """
+
+    def __init__(self, console: Console, screen: str = "menu"):
+        self.console = console
+        self.screen = screen
+        self._width = console.width
+        self._fragments: Dict[Hashable, str] = {}
+
+    def _check_width(self):
+        width = self.console.width
+        if width != self._width:
+            self._fragments.clear()
+            self._width = width
+
+    def render(self, *renderables: RenderableType) -> str:
+        """Render renderables (or markup strings) to text without caching."""
+        start = time.perf_counter()
+        with self.console.capture() as capture:
+            for renderable in renderables:
+                self.console.print(renderable)
+        text = capture.get()
+        RENDER_SECONDS.observe(
+            time.perf_counter() - start, screen=self.screen, stage="render"
+        )
+        return text
+
+    def cached(self, key: Hashable, build: Callable[[], RenderableType]) -> str:
+        """Return the rendered text for ``key``, calling ``build`` on a miss."""
+        self._check_width()
+        text = self._fragments.get(key)
+        if text is None:
+            text = self.render(build())
+            self._fragments[key] = text
+        return text
+
+    def warm(self, builders: Dict[Hashable, Callable[[], RenderableType]]):
+        """Pre-render every fragment in ``builders`` that isn't cached yet."""
+        for key, build in builders.items():
+            self.cached(key, build)
+
+    def write(self, *fragments: str, clear: bool = False):
+        """Write fragments to the terminal as one write, optionally clearing first."""
+        start = time.perf_counter()
+        text = "".join(fragments)
+        if clear and self.console.is_terminal and not self.console.is_dumb_terminal:
+            text = _CLEAR_HOME + text
+        self.console.file.write(text)
+        self.console.file.flush()
+        RENDER_SECONDS.observe(
+            time.perf_counter() - start, screen=self.screen, stage="write"
+        )
@@ -0,0 +1,347 @@
+"""Compact binary replays of AI battles.
+
+A replay stores every move of a battle, so the battle view can be redrawn
+at any game without running the AIs again. The file layout::
+
+    "RPSR" | version (u8) | header length (u32) | header (JSON)
+    moves: one byte per two games, game 2k in the low nibble
+    index: score before every ``index_interval``-th game, 3 x u32 each
+
+Each game takes 4 bits: AI 1's move in the high two, AI 2's in the low
+two (rock 0, paper 1, scissors 2), so a million games take about 500 KB.
+The header holds both AIs' names, the seed the battle was played from and
+its settings. The index means the score at any game is one lookup plus at
+most ``index_interval`` games of arithmetic.
+
+Save replays from the TUI with ``play.py --save-replays``, record one
+headless, and view them::
+
+    python -m src.replay record --ai1 0 --ai2 1 --games 1000000 big.rpsr
+    python -m src.replay show big.rpsr --game 500000
+    python -m src.replay show big.rpsr --interactive
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.battle_view import BattleView
+from src.game import Game, GameResult, Move
+from src.paths import DEFAULT_REPLAY_DIR
+
+MAGIC = b"RPSR"
+REPLAY_VERSION = 1
+INDEX_INTERVAL = 4096  # Games between index points; must be even
+
+_PREAMBLE = struct.Struct(">4sBI")
+_INDEX_ENTRY = struct.Struct(">III")
+
+MOVES = (Move.ROCK, Move.PAPER, Move.SCISSORS)
+_CODES = {move: code for code, move in enumerate(MOVES)}
+
+Score = Tuple[int, int, int]
+
+
+def _nibble_score(nibble: int) -> Score:
+    """(AI 1 wins, AI 2 wins, ties) contributed by one packed game."""
+    result = Game.determine_winner(MOVES[nibble >> 2], MOVES[nibble & 3])
+    return (
+        int(result == GameResult.WIN),
+        int(result == GameResult.LOSE),
+        int(result == GameResult.TIE),
+    )
+
+
+# Lookup tables over every valid nibble and byte, for fast score scans
+_NIBBLE_SCORES: Dict[int, Score] = {
+    (a << 2) | b: _nibble_score((a << 2) | b) for a in range(3) for b in range(3)
+}
+_BYTE_SCORES: List[Score] = [(0, 0, 0)] * 256
+for _low, (_w1, _w2, _t) in _NIBBLE_SCORES.items():
+    for _high, (_hw1, _hw2, _ht) in _NIBBLE_SCORES.items():
+        _BYTE_SCORES[(_high << 4) | _low] = (_w1 + _hw1, _w2 + _hw2, _t + _ht)
+
+
+class ReplayWriter:
+    """Collects a battle's moves as it's played; ``save`` writes the file."""
+
+    def __init__(
+        self,
+        ai1: str,
+        ai2: str,
+        seed: Optional[int] = None,
+        config: Optional[Dict] = None,
+        index_interval: int = INDEX_INTERVAL,
+    ):
+        if index_interval <= 0 or index_interval % 2:
+            raise ValueError("index_interval must be a positive even number")
+        self.ai1 = ai1
+        self.ai2 = ai2
+        self.seed = seed
+        self.config = config or {}
+        self.index_interval = index_interval
+        self.games = 0
+        self.score = [0, 0, 0]
+        self._moves = bytearray()
+        self._index: List[Score] = []
+
+    def add_game(self, ai1_move: Move, ai2_move: Move):
+        if self.games % self.index_interval == 0:
+            self._index.append(tuple(self.score))
+        nibble = (_CODES[ai1_move] << 2) | _CODES[ai2_move]
+        if self.games % 2:
+            self._moves[-1] |= nibble << 4
+        else:
+            self._moves.append(nibble)
+        for i, delta in enumerate(_NIBBLE_SCORES[nibble]):
+            self.score[i] += delta
+        self.games += 1
+
+    def header(self) -> Dict:
+        return {
+            "ai1": self.ai1,
+            "ai2": self.ai2,
+            "games": self.games,
+            "score": self.score,
+            "seed": self.seed,
+            "config": self.config,
+            "index_interval": self.index_interval,
+            "created": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(self.header()).encode("utf-8")
+        return b"".join(
+            [
+                _PREAMBLE.pack(MAGIC, REPLAY_VERSION, len(header)),
+                header,
+                bytes(self._moves),
+                b"".join(_INDEX_ENTRY.pack(*entry) for entry in self._index),
+            ]
+        )
+
+    def save(self, path: str):
+        """Write the replay to ``path`` atomically."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.to_bytes())
+        os.replace(temp_path, path)
+
+
+class Replay:
+    """A loaded replay: random access to any game's moves and score."""
+
+    def __init__(self, data: bytes):
+        if len(data) < _PREAMBLE.size:
+            raise ValueError("not a replay file")
+        magic, version, header_length = _PREAMBLE.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        start = _PREAMBLE.size
+        self.header = json.loads(data[start : start + header_length])
+        self.games: int = self.header["games"]
+        self.index_interval: int = self.header["index_interval"]
+
+        start += header_length
+        move_bytes = (self.games + 1) // 2
+        self._moves = memoryview(data)[start : start + move_bytes]
+        start += move_bytes
+        entries = -(-self.games // self.index_interval)
+        if len(data) != start + entries * _INDEX_ENTRY.size:
+            raise ValueError("replay file is truncated or corrupt")
+        self._index = [
+            _INDEX_ENTRY.unpack_from(data, start + i * _INDEX_ENTRY.size)
+            for i in range(entries)
+        ]
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    @property
+    def ai1(self) -> str:
+        return self.header["ai1"]
+
+    @property
+    def ai2(self) -> str:
+        return self.header["ai2"]
+
+    def _nibble(self, game: int) -> int:
+        """Packed moves of ``game`` (0-based); ValueError if they're invalid."""
+        byte = self._moves[game >> 1]
+        nibble = byte >> 4 if game & 1 else byte & 0x0F
+        if nibble not in _NIBBLE_SCORES:
+            raise ValueError(f"replay data for game {game + 1} is corrupt")
+        return nibble
+
+    def moves(self, game: int) -> Tuple[Move, Move]:
+        """Both moves of ``game`` (1-based)."""
+        if not 1 <= game <= self.games:
+            raise IndexError(f"game {game} is not in 1..{self.games}")
+        nibble = self._nibble(game - 1)
+        return MOVES[nibble >> 2], MOVES[nibble & 3]
+
+    def score_after(self, game: int) -> Score:
+        """(AI 1 wins, AI 2 wins, ties) after the first ``game`` games."""
+        if not 0 <= game <= self.games:
+            raise IndexError(f"game {game} is not in 0..{self.games}")
+        if game == self.games:
+            return tuple(self.header["score"])
+        point = game // self.index_interval
+        wins1, wins2, ties = self._index[point]
+        # Index points fall on even games, so whole bytes up to the last one
+        for byte in self._moves[point * self.index_interval // 2 : game // 2]:
+            w1, w2, t = _BYTE_SCORES[byte]
+            wins1 += w1
+            wins2 += w2
+            ties += t
+        if game & 1:
+            w1, w2, t = _NIBBLE_SCORES[self._nibble(game - 1)]
+            wins1 += w1
+            wins2 += w2
+            ties += t
+        return wins1, wins2, ties
+
+    def games_between(self, first: int, last: int) -> Iterator[Tuple[Move, Move]]:
+        """Moves of games ``first``..``last`` (1-based, inclusive)."""
+        for game in range(first, last + 1):
+            yield self.moves(game)
+
+    def view(self, game: Optional[int] = None, window: int = 15) -> BattleView:
+        """The battle view as it looked right after ``game`` (default: the end)."""
+        game = self.games if game is None else game
+        view = BattleView(self.ai1, self.ai2, self.games, window)
+        first = max(1, game - window + 1)
+        score = list(self.score_after(first - 1))
+        for ai1_move, ai2_move in self.games_between(first, game):
+            result = Game.determine_winner(ai1_move, ai2_move)
+            if result == GameResult.WIN:
+                score[0] += 1
+            elif result == GameResult.LOSE:
+                score[1] += 1
+            else:
+                score[2] += 1
+            view.add_game(ai1_move, ai2_move, result, tuple(score))
+        return view
+
+
+def replay_path(directory: str, ai1: str, ai2: str) -> str:
+    """A new file name in ``directory`` for a battle between ``ai1`` and ``ai2``."""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    slug = "-vs-".join(name.lower().replace(" ", "-") for name in (ai1, ai2))
+    path = os.path.join(directory, f"{stamp}-{slug}.rpsr")
+    suffix = 1
+    while os.path.exists(path):
+        suffix += 1
+        path = os.path.join(directory, f"{stamp}-{slug}-{suffix}.rpsr")
+    return path
+
+
+# --- Command line -----------------------------------------------------------
+
+
+def _record(args) -> int:
+    from src.ai import create_ai
+    from src.engine import Matchup
+    from src.match_cache import seeded
+
+    seed = args.seed if args.seed is not None else int.from_bytes(os.urandom(8), "big")
+    ai1, ai2 = create_ai(args.ai1), create_ai(args.ai2)
+    writer = ReplayWriter(
+        ai1.name, ai2.name, seed, {"ai1_index": args.ai1, "ai2_index": args.ai2}
+    )
+    matchup = Matchup(ai1, ai2)
+    started = time.perf_counter()
+    with seeded(seed):
+        for _ in range(args.games):
+            ai1_move, ai2_move, _ = matchup.play_game()
+            writer.add_game(ai1_move, ai2_move)
+    elapsed = time.perf_counter() - started
+    writer.save(args.file)
+    print(
+        f"{args.games} games in {elapsed:.1f}s, "
+        f"{os.path.getsize(args.file) / 1024:.0f} KiB written to {args.file}"
+    )
+    return 0
+
+
+def _show(args) -> int:
+    from rich.console import Console
+    from rich.prompt import Prompt
+
+    console = Console()
+    started = time.perf_counter()
+    replay = Replay.load(args.file)
+    loaded = time.perf_counter() - started
+    header = replay.header
+    wins1, wins2, ties = header["score"]
+    console.print(
+        f"[bold]{replay.ai1} vs {replay.ai2}[/bold]: {replay.games} games, "
+        f"final score {wins1}-{wins2}-{ties}, seed {header['seed']}\n"
+        f"[dim]Recorded {header['created']}, "
+        f"{os.path.getsize(args.file) / 1024:.0f} KiB, "
+        f"loaded in {loaded * 1000:.1f} ms[/dim]"
+    )
+    if not replay.games:
+        return 0
+
+    game = replay.games if args.game is None else args.game
+    if not 1 <= game <= replay.games:
+        console.print(f"[red]Game must be between 1 and {replay.games}[/red]")
+        return 1
+    console.print(replay.view(game, args.window))
+    while args.interactive:
+        answer = Prompt.ask(
+            "Game number, +N/-N to step, Enter to quit", default="", show_default=False
+        ).strip()
+        if not answer:
+            break
+        try:
+            target = game + int(answer) if answer[0] in "+-" else int(answer)
+        except ValueError:
+            console.print("[red]Enter a game number, +N or -N[/red]")
+            continue
+        game = min(max(target, 1), replay.games)
+        console.print(replay.view(game, args.window))
+    return 0
+
+
+def main(argv=None) -> int:
+    """Command-line entry point: ``python -m src.replay``."""
+    parser = argparse.ArgumentParser(description="AI battle replays")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show = commands.add_parser("show", help="Redraw a battle at any game")
+    show.add_argument("file", help="Replay file")
+    show.add_argument("--game", type=int, default=None, help="Game (default: last)")
+    show.add_argument("--window", type=int, default=15, help="Games shown")
+    show.add_argument(
+        "--interactive", action="store_true", help="Keep asking for games to show"
+    )
+
+    record = commands.add_parser("record", help="Play a battle headless and save it")
+    record.add_argument("file", help="Replay file to write")
+    record.add_argument("--ai1", type=int, default=0, help="AI_OPPONENTS index")
+    record.add_argument("--ai2", type=int, default=1, help="AI_OPPONENTS index")
+    record.add_argument("--games", type=int, default=1000, help="Games to play")
+    record.add_argument("--seed", type=int, default=None, help="Seed the AIs' RNG")
+    args = parser.parse_args(argv)
+
+    try:
+        return _record(args) if args.command == "record" else _show(args)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
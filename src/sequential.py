@@ -0,0 +1,122 @@
+"""Sequential early stopping for AI matchups, and score confidence intervals.
+
+A game is worth 1 to the winner, 0 to the loser and 1/2 each for a tie, so
+a matchup estimates AI 1's expected score. ``SequentialTest`` runs two
+sequential probability ratio tests (SPRTs) on that score after every batch
+of games:
+
+* "AI 1 is better": score 0.5 against 0.5 + ``delta``
+* "AI 2 is better": score 0.5 against 0.5 - ``delta``
+
+If either accepts its alternative, that AI has won. If both accept 0.5, the
+matchup is a draw: neither side is ``delta`` better. One-sided matchups
+(Cyclone Cathy against Pattern Pete) finish within a batch or two, and coin
+flips stop once the draw is clear, instead of always playing the full count.
+``alpha`` and ``beta`` bound the chance of calling a winner that isn't one,
+and of missing a winner that is.
+
+The log-likelihood ratio uses the normal approximation to the score
+distribution (as chess engine testing does), so each check is O(1) from
+the win/loss/tie counts alone.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+from src.engine import Matchup
+
+AI1 = "ai1"
+AI2 = "ai2"
+DRAW = "draw"
+
+# Floor for the per-game score variance, so a one-sided run can't divide by 0
+_MIN_VARIANCE = 1e-3
+
+
+def score_stats(wins: int, losses: int, ties: int) -> Tuple[float, float]:
+    """Mean and variance of the per-game score (1 win, 1/2 tie, 0 loss)."""
+    games = wins + losses + ties
+    if not games:
+        return 0.5, 0.25
+    mean = (wins + 0.5 * ties) / games
+    variance = (wins + 0.25 * ties) / games - mean * mean
+    return mean, max(variance, 0.0)
+
+
+def score_interval(
+    wins: int, losses: int, ties: int, z: float = 1.96
+) -> Tuple[float, float, float]:
+    """(mean score, lower, upper): a normal confidence interval, 95% by default."""
+    games = wins + losses + ties
+    mean, variance = score_stats(wins, losses, ties)
+    if not games:
+        return mean, 0.0, 1.0
+    half_width = z * math.sqrt(variance / games)
+    return mean, max(0.0, mean - half_width), min(1.0, mean + half_width)
+
+
+class SequentialTest:
+    """Decides a matchup as early as the evidence allows."""
+
+    def __init__(
+        self,
+        delta: float = 0.1,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+        batch: int = 10,
+        min_games: int = 20,
+    ):
+        self.delta = delta
+        self.alpha = alpha
+        self.beta = beta
+        self.batch = batch
+        self.min_games = min_games
+        self.lower_bound = math.log(beta / (1 - alpha))
+        self.upper_bound = math.log((1 - beta) / alpha)
+
+    def settings(self) -> List[float]:
+        """Constructor arguments, in order: ``SequentialTest(*settings)``."""
+        return [self.delta, self.alpha, self.beta, self.batch, self.min_games]
+
+    def llr(self, wins: int, losses: int, ties: int) -> Tuple[float, float]:
+        """Log-likelihood ratios for "AI 1 is better" and "AI 2 is better"."""
+        games = wins + losses + ties
+        mean, variance = score_stats(wins, losses, ties)
+        variance = max(variance, _MIN_VARIANCE)
+        # LLR of N(0.5 + d, var) over N(0.5, var) for n games with mean m
+        drift = games * self.delta / variance
+        return (
+            drift * (mean - 0.5 - self.delta / 2),
+            drift * (0.5 - self.delta / 2 - mean),
+        )
+
+    def decide(self, wins: int, losses: int, ties: int) -> Optional[str]:
+        """``AI1``, ``AI2`` or ``DRAW`` once decided, else None."""
+        if wins + losses + ties < self.min_games:
+            return None
+        better1, better2 = self.llr(wins, losses, ties)
+        if better1 >= self.upper_bound:
+            return AI1
+        if better2 >= self.upper_bound:
+            return AI2
+        if better1 <= self.lower_bound and better2 <= self.lower_bound:
+            return DRAW
+        return None
+
+    def run(self, matchup: Matchup, max_games: int) -> Optional[str]:
+        """Play batches until decided or ``max_games``; returns the decision.
+
+        A matchup that reaches ``max_games`` undecided returns None.
+        """
+        while matchup.games_played < max_games:
+            matchup.play(min(self.batch, max_games - matchup.games_played))
+            decision = self.decide(*matchup.score)
+            if decision is not None:
+                return decision
+        return None
+
+
+def format_interval(wins: int, losses: int, ties: int) -> str:
+    """Mean score and 95% margin for tables: ``61.2% ± 4.1``."""
+    mean, low, high = score_interval(wins, losses, ties)
+    return f"{mean * 100:.1f}% ± {(high - low) * 50:.1f}"
@@ -0,0 +1,556 @@
+"""Asyncio TCP game server hosting many concurrent online matches.
+
+Run with ``python -m src.server``; see ``src/protocol.py`` for the messages.
+Both players submit their move for a round without seeing the other's, the
+server adjudicates with ``Game.determine_winner`` once both are in (or the
+round times out), and finished matches are recorded on the leaderboard.
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Set, Union
+
+from src import metrics
+from src.game import ROUNDS_PLAYED, Game, GameResult, Move
+from src.leaderboard import Leaderboard
+from src.matchmaking import Matchmaker, bot_for_skill, skill_of
+from src.protocol import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, decode, encode, parse_move
+
+logger = logging.getLogger(__name__)
+
+# Clients that let this much unread output pile up are disconnected
+MAX_WRITE_BUFFER = 64 * 1024
+
+if TYPE_CHECKING:
+    from src.ai import AIPlayer
+
+MATCHES_FINISHED = metrics.counter(
+    "rps_server_matches_total", "Online matches finished, by how they ended", ["reason"]
+)
+CONNECTED_PLAYERS = metrics.gauge("rps_server_players", "Connected clients")
+ACTIVE_MATCHES = metrics.gauge("rps_server_active_matches", "Matches in progress")
+QUEUE_DEPTH = metrics.gauge("rps_server_queue_depth", "Players waiting for a match")
+
+_FLIPPED = {
+    GameResult.WIN: GameResult.LOSE,
+    GameResult.LOSE: GameResult.WIN,
+    GameResult.TIE: GameResult.TIE,
+}
+
+
+class Player:
+    """A connected client."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.name: Optional[str] = None
+        self.match: Optional["Match"] = None
+        self.move: Optional[asyncio.Future] = None
+        self.round: Optional[int] = None  # Round the pending move is for
+        self.connected = True
+
+    def send(self, message: Dict):
+        """Queue a message without waiting; drop clients that stop reading."""
+        if not self.connected:
+            return
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.close()
+            return
+        self.writer.write(encode(message))
+
+    def error(self, text: str):
+        self.send({"type": "error", "message": text})
+
+    def submit_move(self, move: Optional[Move], round_num: Optional[int]):
+        """Accept a move for the round in progress.
+
+        A late answer to an earlier round is rejected, not taken as this one's.
+        """
+        if self.move is None or self.move.done():
+            self.error("no move expected right now")
+        elif round_num is None:
+            self.error("move must say which round it is for")
+        elif round_num != self.round:
+            self.error(f"move for round {round_num}, but round {self.round} is on")
+        elif move is None:
+            self.error("move must be rock, paper or scissors")
+        else:
+            self.move.set_result(move)
+
+    def close(self):
+        if not self.connected:
+            return
+        self.connected = False
+        self.writer.close()
+        if self.match is not None:
+            self.match.abort()
+
+
+class BotPlayer:
+    """Server-side opponent driven by an AI, used when no human is available."""
+
+    connected = True
+
+    def __init__(self, ai: "AIPlayer"):
+        self.ai = ai
+        self.name = f"{ai.name} (bot)"
+        self.match: Optional["Match"] = None
+        self.opponent_history: List[Move] = []
+
+    def next_move(self) -> Move:
+        move = self.ai.make_move(self.opponent_history)
+        self.ai.record_move(move)
+        return move
+
+    def send(self, message: Dict):
+        """Learn from round results; everything else is ignored."""
+        if message["type"] != "round_result":
+            return
+        opponent_move = parse_move(message["opponent_move"])
+        if opponent_move is not None:
+            self.opponent_history.append(opponent_move)
+        my_move = parse_move(message["your_move"])
+        if my_move is not None and opponent_move is not None:
+            self.ai.record_result(my_move, opponent_move, GameResult(message["result"]))
+
+    def close(self):
+        pass
+
+
+class Match:
+    """Two players, a fixed number of rounds and a per-round move timeout."""
+
+    def __init__(
+        self,
+        match_id: int,
+        player1: Player,
+        player2: Union[Player, BotPlayer],
+        rounds: int,
+        move_timeout: float,
+    ):
+        self.match_id = match_id
+        self.player1 = player1
+        self.player2 = player2
+        self.rounds = rounds
+        self.move_timeout = move_timeout
+        self.score: List[int] = [0, 0, 0]  # player1 wins, player2 wins, ties
+        self.aborted = asyncio.get_running_loop().create_future()
+
+    def abort(self):
+        """End the match early (a player disconnected)."""
+        if not self.aborted.done():
+            self.aborted.set_result(None)
+
+    def score_for(self, player: Player) -> List[int]:
+        """Score as [own wins, opponent wins, ties]."""
+        if player is self.player1:
+            return list(self.score)
+        return [self.score[1], self.score[0], self.score[2]]
+
+
+class GameServer:
+    """Hosts online matches over TCP.
+
+    ``start`` binds the listening socket (use ``port=0`` for an ephemeral
+    port, e.g. in tests) and returns the port actually bound. Players are
+    paired by ``matchmaker``, which is re-polled every ``matchmaking_interval``
+    seconds so waiting players' skill windows widen and, eventually, a bot
+    steps in.
+    """
+
+    def __init__(
+        self,
+        leaderboard: Optional[Leaderboard] = None,
+        rounds: int = 3,
+        move_timeout: float = 30.0,
+        save_interval: float = 2.0,
+        matchmaker: Optional[Matchmaker] = None,
+        matchmaking_interval: float = 0.5,
+        history_size: int = 1000,
+    ):
+        self.leaderboard = leaderboard if leaderboard is not None else Leaderboard()
+        self.rounds = rounds
+        self.move_timeout = move_timeout
+        self.save_interval = save_interval
+        self.players: Set[Player] = set()
+        self.matches: Dict[int, Match] = {}
+        self.matches_played = 0
+        # Most recent finished matches, oldest first
+        self.history: Deque[Dict] = deque(maxlen=history_size)
+        self.matchmaker = matchmaker if matchmaker is not None else Matchmaker()
+        self.matchmaking_interval = matchmaking_interval
+        self._match_ids = itertools.count(1)
+        self._match_tasks: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._saver: Optional[asyncio.Task] = None
+        self._pairer: Optional[asyncio.Task] = None
+        self._writing: Optional[asyncio.Future] = None  # Leaderboard write
+        self._changes = 0  # Leaderboard updates so far...
+        self._saved_changes = 0  # ...and how many of them are on disk
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
+        """Start listening; returns the bound port."""
+        self._server = await asyncio.start_server(
+            self._handle, host, port, limit=MAX_LINE, backlog=4096
+        )
+        self._saver = asyncio.ensure_future(self._save_loop())
+        self._pairer = asyncio.ensure_future(self._matchmaking_loop())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting, end all matches and save the leaderboard."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for player in list(self.players):
+            player.close()
+        if self._match_tasks:
+            await asyncio.wait(list(self._match_tasks))
+        tasks = [task for task in (self._saver, self._pairer) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._writing is not None:  # Never two writes to the file at once
+            await asyncio.gather(self._writing, return_exceptions=True)
+        await self._try_save()
+
+    # --- Connections ------------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        player = Player(writer)
+        self.players.add(player)
+        try:
+            while player.connected:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):  # ValueError: line too long
+                    break
+                if not line:
+                    break
+                try:
+                    message = decode(line)
+                except ValueError:
+                    player.error("malformed message")
+                    continue
+                if not self._dispatch(player, message):
+                    break
+        finally:
+            self._disconnect(player)
+
+    def _dispatch(self, player: Player, message: Dict) -> bool:
+        """Handle one client message; returns False to hang up."""
+        kind = message["type"]
+        if kind == "hello":
+            name = str(message.get("name", "")).strip()[:32]
+            if not name:
+                player.error("name required")
+            else:
+                player.name = name
+                player.send({"type": "welcome", "name": name})
+        elif kind == "play":
+            if player.name is None:
+                player.error("say hello first")
+            elif player.match is not None or player in self.matchmaker:
+                player.error("already playing or waiting")
+            else:
+                self._enqueue(player, allow_bots=bool(message.get("bots", True)))
+        elif kind == "move":
+            player.submit_move(parse_move(message.get("move")), message.get("round"))
+        elif kind == "stats":
+            player.send({"type": "stats", **self.stats()})
+        elif kind == "quit":
+            return False
+        else:
+            player.error(f"unknown message type {kind!r}")
+        return True
+
+    def _disconnect(self, player: Player):
+        player.close()
+        self.players.discard(player)
+        self.matchmaker.remove(player)
+
+    # --- Pairing ----------------------------------------------------------
+
+    def stats(self) -> Dict:
+        """Connection and match counts plus matchmaking queue metrics."""
+        return {
+            "players": len(self.players),
+            "active_matches": len(self.matches),
+            "matches_played": self.matches_played,
+            **self.matchmaker.stats(),
+        }
+
+    def update_metrics(self):
+        """Refresh the gauges in ``src.metrics`` (called when they're scraped)."""
+        CONNECTED_PLAYERS.set(len(self.players))
+        ACTIVE_MATCHES.set(len(self.matches))
+        QUEUE_DEPTH.set(len(self.matchmaker))
+
+    def skill(self, name: str) -> float:
+        """Matchmaking skill for a player name (0.5 if unknown)."""
+        return skill_of(self.leaderboard.entries.get(name))
+
+    def _enqueue(self, player: Player, allow_bots: bool = True):
+        """Pair with a waiting player of similar skill, or join the queue."""
+        pair = self.matchmaker.add(player, self.skill(player.name), allow_bots)
+        if pair is not None:
+            self._start_match(*pair)
+        else:
+            player.send({"type": "waiting", "queue_depth": len(self.matchmaker)})
+
+    def _start_bot_match(self, player: Player, skill: float):
+        from src.ai import create_ai
+
+        self._start_match(player, BotPlayer(create_ai(bot_for_skill(skill))))
+
+    async def _matchmaking_loop(self):
+        while True:
+            await asyncio.sleep(self.matchmaking_interval)
+            pairs, bot_matches = self.matchmaker.poll()
+            for player1, player2 in pairs:
+                self._start_match(player1, player2)
+            for player, skill in bot_matches:
+                self._start_bot_match(player, skill)
+
+    def _start_match(self, player1: Player, player2: Union[Player, BotPlayer]):
+        match = Match(
+            next(self._match_ids), player1, player2, self.rounds, self.move_timeout
+        )
+        player1.match = player2.match = match
+        self.matches[match.match_id] = match
+        task = asyncio.ensure_future(self._run_match(match))
+        self._match_tasks.add(task)
+        task.add_done_callback(self._match_tasks.discard)
+
+    # --- Matches ----------------------------------------------------------
+
+    async def _collect_move(self, match: Match, player: Player, round_num: int):
+        """Ask for a move and wait for it, the timeout, or the match aborting."""
+        if isinstance(player, BotPlayer):
+            return player.next_move()
+        player.move = asyncio.get_running_loop().create_future()
+        player.round = round_num
+        player.send(
+            {"type": "round_start", "round": round_num, "timeout": match.move_timeout}
+        )
+        try:
+            await asyncio.wait(
+                [player.move, match.aborted],
+                timeout=match.move_timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            return player.move.result() if player.move.done() else None
+        finally:
+            player.move = None
+
+    async def _run_match(self, match: Match):
+        player1, player2 = match.player1, match.player2
+        for player, opponent in ((player1, player2), (player2, player1)):
+            player.send(
+                {
+                    "type": "match_start",
+                    "match": match.match_id,
+                    "opponent": opponent.name,
+                    "rounds": match.rounds,
+                }
+            )
+
+        reason = "done"
+        try:
+            for round_num in range(1, match.rounds + 1):
+                move1, move2 = await asyncio.gather(
+                    self._collect_move(match, player1, round_num),
+                    self._collect_move(match, player2, round_num),
+                )
+                if match.aborted.done():
+                    reason = "disconnect"
+                    break
+
+                # A missing move (timeout) forfeits the round
+                if move1 is None and move2 is None:
+                    result = GameResult.TIE
+                elif move1 is None:
+                    result = GameResult.LOSE
+                elif move2 is None:
+                    result = GameResult.WIN
+                else:
+                    result = Game.determine_winner(move1, move2)
+                ROUNDS_PLAYED.inc(mode="server")
+
+                if result == GameResult.WIN:
+                    match.score[0] += 1
+                elif result == GameResult.LOSE:
+                    match.score[1] += 1
+                else:
+                    match.score[2] += 1
+
+                for player, mine, theirs, outcome in (
+                    (player1, move1, move2, result),
+                    (player2, move2, move1, _FLIPPED[result]),
+                ):
+                    player.send(
+                        {
+                            "type": "round_result",
+                            "round": round_num,
+                            "your_move": mine.value if mine else None,
+                            "opponent_move": theirs.value if theirs else None,
+                            "result": outcome.value,
+                            "score": match.score_for(player),
+                        }
+                    )
+        finally:
+            self._finish_match(match, reason)
+
+    def _finish_match(self, match: Match, reason: str):
+        player1, player2 = match.player1, match.player2
+        if reason == "disconnect":
+            # Whoever is still here wins by forfeit
+            if player1.connected and not player2.connected:
+                result = GameResult.WIN
+            elif player2.connected and not player1.connected:
+                result = GameResult.LOSE
+            else:
+                result = GameResult.TIE
+        elif match.score[0] > match.score[1]:
+            result = GameResult.WIN
+        elif match.score[1] > match.score[0]:
+            result = GameResult.LOSE
+        else:
+            result = GameResult.TIE
+
+        for player, outcome in ((player1, result), (player2, _FLIPPED[result])):
+            player.match = None
+            player.send(
+                {
+                    "type": "match_end",
+                    "match": match.match_id,
+                    "result": outcome.value,
+                    "score": match.score_for(player),
+                    "reason": reason,
+                }
+            )
+        self.matches.pop(match.match_id, None)
+        self.matches_played += 1
+        MATCHES_FINISHED.inc(reason=reason)
+        self.history.append(
+            {
+                "match": match.match_id,
+                "players": [player1.name, player2.name],
+                "score": list(match.score),
+                "winner": {
+                    GameResult.WIN: player1.name,
+                    GameResult.LOSE: player2.name,
+                }.get(result),
+                "reason": reason,
+                "finished_at": datetime.now().isoformat(),
+            }
+        )
+        self._record(player1, result)
+        self._record(player2, _FLIPPED[result])
+
+    # --- Persistence ------------------------------------------------------
+
+    def _record(self, player: Union[Player, BotPlayer], result: GameResult):
+        """Update a leaderboard entry now; the save loop writes it later.
+
+        Bots aren't ranked, matching local games where only people are.
+        """
+        if isinstance(player, BotPlayer):
+            return
+        board = self.leaderboard
+        if result == GameResult.WIN:
+            board.record_win(player.name, save=False)
+        elif result == GameResult.LOSE:
+            board.record_loss(player.name, save=False)
+        else:
+            board.record_tie(player.name, save=False)
+        self._changes += 1
+
+    async def _save(self):
+        """Write the leaderboard if it changed since the last successful save."""
+        changes = self._changes
+        if changes == self._saved_changes:
+            return
+        # Snapshot on the loop thread; only the file write happens off it
+        self._writing = asyncio.ensure_future(
+            asyncio.to_thread(self.leaderboard.save, self.leaderboard.to_dict())
+        )
+        # Shielded so cancelling the saver can't abandon a write half done
+        await asyncio.shield(self._writing)
+        self._saved_changes = changes
+
+    async def _try_save(self):
+        try:
+            await self._save()
+        except Exception:  # Still counted as unsaved, so the next save retries
+            logger.exception("Could not save the leaderboard")
+
+    async def _save_loop(self):
+        while True:
+            await asyncio.sleep(self.save_interval)
+            await self._try_save()
+
+
+async def _serve(args):
+    server = GameServer(
+        rounds=args.rounds,
+        move_timeout=args.move_timeout,
+        matchmaker=Matchmaker(bot_after=args.bot_after),
+    )
+    port = await server.start(args.host, args.port)
+    print(f"Rock Paper Scissors server listening on {args.host}:{port}")
+    api = None
+    if args.http_port is not None:
+        from src.http_api import ApiServer
+
+        api = ApiServer(server.leaderboard, server)
+        http_port = await api.start(args.host, args.http_port)
+        print(f"Leaderboard API listening on http://{args.host}:{http_port}")
+    try:
+        await server.serve_forever()
+    finally:
+        if api is not None:
+            await api.close()
+        await server.close()
+
+
+def main(argv=None):
+    """Command-line entry point: ``python -m src.server``."""
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors game server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per match")
+    parser.add_argument(
+        "--move-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds a player has to submit each move",
+    )
+    parser.add_argument(
+        "--bot-after",
+        type=float,
+        default=15.0,
+        help="Seconds a player waits for a human opponent before getting a bot",
+    )
+    parser.add_argument(
+        "--http-port",
+        type=int,
+        default=None,
+        help="Also serve the leaderboard, matches and metrics over HTTP on this port",
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
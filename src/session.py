@@ -0,0 +1,365 @@
+"""Recording and headless replay of TUI sessions.
+
+Every answer the TUI reads goes through ``RockPaperScissorsGame._ask``. A
+``SessionRecorder`` sits in that seam during a normal game and writes each
+prompt, the answer given and how long it took to a JSON Lines file, after a
+header holding the RNG seed and options the game ran with::
+
+    python3 play.py --record session.jsonl
+
+``replay`` then drives the real TUI from that file with a ``ScriptedInput``:
+same seed, same answers, pacing off, output going to a virtual terminal
+that is never displayed. It reports where the time went on each screen:
+rendering (everything inside ``Console.print``, including live battle
+frames) versus everything else (AI moves, game logic, saves)::
+
+    python -m src.session session.jsonl
+    python -m src.session session.jsonl --repeat 5 --json
+
+Online play depends on a live server and can't be reproduced; a replay that
+reaches it stops with a ``SessionMismatch``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from src.tasks import run_blocking
+
+SESSION_VERSION = 1
+
+# Called as on_ask(screen) before each scripted answer is handed over
+AskHook = Callable[[str], None]
+
+
+class SessionMismatch(Exception):
+    """The game asked something other than what the recording says."""
+
+
+class EndOfSession(Exception):
+    """The recording has no more answers (it was cut short)."""
+
+
+def _describe(prompt_cls, args: Tuple) -> Tuple[str, str]:
+    """(prompt class name, prompt text) identifying one question."""
+    return prompt_cls.__name__, str(args[0]) if args else ""
+
+
+class SessionRecorder:
+    """Answers prompts from the terminal and logs them to ``path``.
+
+    Each line is flushed as it's written, so a session cut short by Ctrl+C
+    is still replayable up to that point.
+    """
+
+    def __init__(self, path: str, seed: int, options: Optional[Dict] = None):
+        self.path = path
+        self.seed = seed
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "w")
+        self._write(
+            {
+                "type": "session",
+                "version": SESSION_VERSION,
+                "seed": seed,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "options": options or {},
+            }
+        )
+        self._last = time.perf_counter()
+
+    def _write(self, record: Dict):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    async def ask(self, screen: str, prompt_cls, *args, **kwargs) -> Any:
+        asked = time.perf_counter()
+        answer = await run_blocking(prompt_cls.ask, *args, **kwargs)
+        answered = time.perf_counter()
+        kind, prompt = _describe(prompt_cls, args)
+        self._write(
+            {
+                "type": "input",
+                "screen": screen,
+                "prompt_cls": kind,
+                "prompt": prompt,
+                "answer": answer,
+                # Time the game spent before asking, then the player's time
+                "busy": round(asked - self._last, 6),
+                "think": round(answered - asked, 6),
+            }
+        )
+        self._last = answered
+        return answer
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class ScriptedInput:
+    """Answers prompts from a recording, checking each one matches."""
+
+    def __init__(self, inputs: List[Dict], on_ask: Optional[AskHook] = None):
+        self.inputs = inputs
+        self.on_ask = on_ask
+        self.position = 0
+
+    async def ask(self, screen: str, prompt_cls, *args, **kwargs) -> Any:
+        if self.on_ask is not None:
+            self.on_ask(screen)
+        if self.position >= len(self.inputs):
+            raise EndOfSession()
+        expected = self.inputs[self.position]
+        kind, prompt = _describe(prompt_cls, args)
+        if (kind, prompt) != (expected["prompt_cls"], expected["prompt"]):
+            raise SessionMismatch(
+                f"input {self.position + 1}: game asked {kind} {prompt!r}, "
+                f"recording has {expected['prompt_cls']} {expected['prompt']!r}"
+            )
+        self.position += 1
+        return expected["answer"]
+
+
+def load_session(path: str) -> Tuple[Dict, List[Dict]]:
+    """Read a recording; returns (header, inputs)."""
+    with open(path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    if not records or records[0].get("type") != "session":
+        raise ValueError(f"{path} is not a session recording")
+    header = records[0]
+    if header["version"] != SESSION_VERSION:
+        raise ValueError(f"unsupported session version {header['version']}")
+    return header, [r for r in records[1:] if r.get("type") == "input"]
+
+
+# --- Replay -----------------------------------------------------------------
+
+
+class _NullFile:
+    """Terminal stand-in that only counts what's written to it."""
+
+    def __init__(self):
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        self.bytes_written += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _TimedConsole(Console):
+    """Console that adds up the time spent in ``print`` (from any thread)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.render_seconds = 0.0
+        self._timing_lock = threading.Lock()
+
+    def print(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            super().print(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._timing_lock:
+                self.render_seconds += elapsed
+
+
+class ScreenTimes:
+    """Wall time split into render and other compute, by screen.
+
+    The time between two prompts is charged to the screen that asks the
+    second one, so each screen's figure covers drawing it and everything
+    it computes before waiting for input.
+    """
+
+    def __init__(self, console: _TimedConsole):
+        self.console = console
+        self.screens: Dict[str, Dict[str, float]] = {}
+        self._last = time.perf_counter()
+        self._last_render = console.render_seconds
+
+    def mark(self, screen: str):
+        now = time.perf_counter()
+        render = self.console.render_seconds
+        stats = self.screens.setdefault(
+            screen, {"prompts": 0, "total": 0.0, "render": 0.0, "compute": 0.0}
+        )
+        total = now - self._last
+        rendered = min(render - self._last_render, total)
+        stats["prompts"] += 1
+        stats["total"] += total
+        stats["render"] += rendered
+        stats["compute"] += total - rendered
+        self._last = now
+        self._last_render = render
+
+
+async def replay_once(
+    header: Dict,
+    inputs: List[Dict],
+    leaderboard_file: Optional[str] = None,
+    width: int = 100,
+) -> Dict:
+    """Play a recording through the TUI once; returns timings by screen.
+
+    The game gets a scratch copy of ``leaderboard_file`` (or an empty
+    leaderboard), so replays never touch real data.
+    """
+    from src import main as tui
+    from src.leaderboard import Leaderboard
+    from src.pacing import Pacer, PacingMode
+
+    console = _TimedConsole(
+        file=_NullFile(), force_terminal=True, width=width, height=40
+    )
+    previous_console = tui.console
+    tui.use_console(console)
+    times = ScreenTimes(console)
+    options = header.get("options", {})
+    game = tui.RockPaperScissorsGame(
+        pacer=Pacer(PacingMode.TURBO, skippable=False),
+        profile_ai=options.get("profile_ai"),
+        seed=header["seed"],
+        session=ScriptedInput(inputs, on_ask=times.mark),
+    )
+    completed = True
+    with tempfile.TemporaryDirectory() as work_dir:
+        data_file = os.path.join(work_dir, "data", "leaderboard.json")
+        os.makedirs(os.path.dirname(data_file))
+        if leaderboard_file:
+            shutil.copyfile(leaderboard_file, data_file)
+        game.leaderboard = Leaderboard(data_file)
+        started = time.perf_counter()
+        try:
+            await game.run_async()
+        except EndOfSession:
+            completed = False
+        finally:
+            times.mark(tui.screen.screen)
+            tui.use_console(previous_console)
+        elapsed = time.perf_counter() - started
+    return {
+        "inputs": game.session.position,
+        "completed": completed,
+        "total_s": elapsed,
+        "bytes_written": console.file.bytes_written,
+        "screens": times.screens,
+    }
+
+
+def replay(
+    path: str,
+    repeat: int = 1,
+    leaderboard_file: Optional[str] = None,
+    width: int = 100,
+) -> Dict:
+    """Replay ``path`` ``repeat`` times; per-screen figures are medians."""
+    header, inputs = load_session(path)
+    runs = [
+        asyncio.run(replay_once(header, inputs, leaderboard_file, width))
+        for _ in range(repeat)
+    ]
+    screens: Dict[str, Dict[str, float]] = {}
+    for name in runs[0]["screens"]:
+        samples = [run["screens"].get(name) for run in runs]
+        screens[name] = {
+            key: statistics.median(sample[key] for sample in samples if sample)
+            for key in ("prompts", "total", "render", "compute")
+        }
+        # What the same screen cost while the session was being recorded
+        screens[name]["recorded"] = sum(
+            record["busy"] for record in inputs if record["screen"] == name
+        )
+    return {
+        "session": path,
+        "seed": header["seed"],
+        "inputs": len(inputs),
+        "repeat": repeat,
+        "completed": all(run["completed"] for run in runs),
+        "total_s": statistics.median(run["total_s"] for run in runs),
+        "bytes_written": runs[0]["bytes_written"],
+        "screens": screens,
+    }
+
+
+def print_report(report: Dict):
+    from rich.table import Table
+
+    from src.profiling import format_seconds
+
+    console = Console()
+    table = Table(
+        title=f"Replay of {report['session']} ({report['inputs']} inputs, "
+        f"median of {report['repeat']})"
+    )
+    table.add_column("Screen", style="bold")
+    table.add_column("Prompts", justify="right")
+    table.add_column("Render", justify="right")
+    table.add_column("Compute", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Recorded", justify="right", style="dim")
+    for name, stats in sorted(
+        report["screens"].items(), key=lambda item: -item[1]["total"]
+    ):
+        table.add_row(
+            name,
+            str(int(stats["prompts"])),
+            format_seconds(stats["render"]),
+            format_seconds(stats["compute"]),
+            format_seconds(stats["total"]),
+            format_seconds(stats["recorded"]),
+        )
+    console.print(table)
+    console.print(
+        f"Total {format_seconds(report['total_s'])}, "
+        f"{report['bytes_written'] / 1024:.0f} KiB of terminal output"
+    )
+    if not report["completed"]:
+        console.print("[yellow]The recording ends before the session does.[/yellow]")
+
+
+def main(argv=None) -> int:
+    """Command-line entry point: ``python -m src.session``."""
+    parser = argparse.ArgumentParser(description="Replay a recorded TUI session")
+    parser.add_argument("session", help="File written by play.py --record")
+    parser.add_argument("--repeat", type=int, default=1, help="Replays to run")
+    parser.add_argument(
+        "--leaderboard", help="Start from a copy of this leaderboard file"
+    )
+    parser.add_argument("--width", type=int, default=100, help="Terminal width")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    os.environ["RPS_AUDIO"] = "off"  # Sounds are queued as usual, never heard
+    try:
+        report = replay(args.session, args.repeat, args.leaderboard, args.width)
+    except SessionMismatch as exc:
+        print(f"Replay diverged from the recording: {exc}", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
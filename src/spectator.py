@@ -0,0 +1,299 @@
+"""Broadcast AI battles and tournaments to spectators over localhost.
+
+Start the game with ``python play.py --spectate-port 8766`` and watch from any
+number of other terminals with ``python -m src.spectator --port 8766``.
+
+Events are newline-delimited JSON (see ``src/protocol.py``), server to
+spectator only:
+
+    {"type": "tournament_start", "players": ["Randy Random", ...],
+     "games_per_matchup": 10}
+    {"type": "battle_start", "ai1": "Randy Random", "ai2": "Pattern Pete",
+     "games": 10, "matchup": 1, "matchups": 6}      # matchup fields: tournaments
+    {"type": "game", "game": 3, "ai1_move": "rock", "ai2_move": "paper",
+     "result": "lose", "score": [1, 2, 0]}
+    {"type": "battle_end", "score": [4, 5, 1], "winner": "Pattern Pete"}
+    {"type": "tournament_end", "standings": [{"name": ..., "wins": ...}, ...]}
+
+``result`` and ``score`` are from ``ai1``'s side. Every ``game`` event
+carries the full score, so a spectator that misses some still shows the
+right totals.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+
+from src.protocol import DEFAULT_HOST, decode, encode
+
+DEFAULT_SPECTATE_PORT = 8766
+
+# Retained events are replayed to new or re-synced spectators in this order
+_RETAIN_SLOTS = ("tournament", "battle")
+
+
+class Subscriber:
+    """One connected spectator."""
+
+    __slots__ = ("writer", "skipped", "lagging", "stalled_ticks")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.skipped = 0
+        self.lagging = False
+        self.stalled_ticks = 0
+
+    @property
+    def buffered(self) -> int:
+        return self.writer.transport.get_write_buffer_size()
+
+
+class Broadcaster:
+    """Fans events out to many spectators without holding up the publisher.
+
+    ``publish`` encodes each event once and queues the bytes; pending events
+    are joined into one batch and written to every spectator at most every
+    ``flush_interval`` seconds. A spectator whose unsent output exceeds
+    ``max_buffer`` bytes skips batches until it catches up, then gets the
+    retained state (current tournament and battle) before live events
+    resume. One that stays stuck for ``drop_after`` consecutive flush ticks
+    is disconnected. If the publisher outpaces flushing, only the newest
+    ``max_pending`` events are kept.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.05,
+        max_buffer: int = 256 * 1024,
+        max_pending: int = 4096,
+        drop_after: int = 100,
+    ):
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.drop_after = drop_after
+        self.published = 0
+        self.overflowed = 0
+        self.dropped = 0
+        self.subscribers: Set[Subscriber] = set()
+        self._pending: Deque[bytes] = deque(maxlen=max_pending)
+        self._retained: Dict[str, bytes] = {}
+        self._last_flush = 0.0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._ticker: Optional[asyncio.Task] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    async def start(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_SPECTATE_PORT
+    ) -> int:
+        """Start accepting spectators; returns the bound port."""
+        self._server = await asyncio.start_server(
+            self._accept, host, port, backlog=1024
+        )
+        self._ticker = asyncio.ensure_future(self._tick_loop())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._ticker is not None:
+            self._ticker.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.flush()
+        for subscriber in list(self.subscribers):
+            self._drop(subscriber)
+        if self._handlers:
+            await asyncio.wait(list(self._handlers), timeout=1.0)
+
+    def publish(self, event: Dict, retain: Optional[str] = None):
+        """Queue an event for every spectator.
+
+        Args:
+            event: Message to send
+            retain: Slot ("tournament" or "battle") in which to keep this
+                event for spectators who join or re-sync later
+        """
+        data = encode(event)
+        self.published += 1
+        if retain is not None:
+            self._retained[retain] = data
+            if retain == "tournament":
+                self._retained.pop("battle", None)
+        if len(self._pending) == self._pending.maxlen:
+            self.overflowed += 1
+        self._pending.append(data)
+        # Flush from here too, so a publisher that never yields still streams
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write pending events to every spectator that can keep up."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        count = len(self._pending)
+        batch = b"".join(self._pending)
+        self._pending.clear()
+        for subscriber in list(self.subscribers):
+            if subscriber.buffered > self.max_buffer:
+                subscriber.skipped += count
+                subscriber.lagging = True
+                continue
+            if subscriber.lagging:
+                subscriber.lagging = False
+                self._write(subscriber, self._retained_state())
+            self._write(subscriber, batch)
+
+    # --- Internals --------------------------------------------------------
+
+    def _retained_state(self) -> bytes:
+        return b"".join(
+            self._retained[slot] for slot in _RETAIN_SLOTS if slot in self._retained
+        )
+
+    def _write(self, subscriber: Subscriber, data: bytes):
+        try:
+            subscriber.writer.write(data)
+        except (ConnectionError, RuntimeError):
+            self._drop(subscriber)
+
+    def _drop(self, subscriber: Subscriber):
+        if subscriber in self.subscribers:
+            self.subscribers.discard(subscriber)
+            subscriber.writer.close()
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        subscriber = Subscriber(writer)
+        self.subscribers.add(subscriber)
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        self._write(subscriber, self._retained_state())
+        try:
+            # Spectators don't talk; this just notices when they leave
+            while await reader.read(1024):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            self._drop(subscriber)
+            self._handlers.discard(handler)
+
+    async def _tick_loop(self):
+        """Flush stragglers and drop spectators that have stopped reading.
+
+        Runs only when the event loop is free, so a publisher hogging the
+        loop (which also stops sockets draining) doesn't count against
+        spectators.
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+            for subscriber in list(self.subscribers):
+                if subscriber.buffered > self.max_buffer:
+                    subscriber.stalled_ticks += 1
+                    if subscriber.stalled_ticks >= self.drop_after:
+                        self.dropped += 1
+                        self._drop(subscriber)
+                else:
+                    subscriber.stalled_ticks = 0
+
+
+# --- Spectator client -------------------------------------------------------
+
+
+async def _watch(args):
+    from rich.console import Console
+    from rich.live import Live
+    from rich.table import Table
+
+    from src.battle_view import BattleView
+    from src.game import GameResult, Move
+
+    console = Console()
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    console.print(f"[dim]Watching {args.host}:{args.port} (Ctrl+C to leave)[/dim]")
+
+    live: Optional[Live] = None
+    view: Optional[BattleView] = None
+
+    def stop_live():
+        nonlocal live
+        if live is not None:
+            live.stop()
+            live = None
+
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            event = decode(line)
+            kind = event["type"]
+            if kind == "tournament_start":
+                stop_live()
+                players = event["players"]
+                names = ", ".join(players[:8])
+                if len(players) > 8:
+                    names += f" and {len(players) - 8} more"
+                console.print(
+                    f"\n[bold cyan]🏆 Tournament: {names} "
+                    f"({event['games_per_matchup']} games per matchup)[/bold cyan]"
+                )
+            elif kind == "battle_start":
+                stop_live()
+                title = f"⚔️  {event['ai1']} vs {event['ai2']}"
+                if "matchup" in event:
+                    title += f"  (matchup {event['matchup']}/{event['matchups']})"
+                console.print(f"\n[bold cyan]{title}[/bold cyan]")
+                view = BattleView(event["ai1"], event["ai2"], event["games"])
+                live = Live(view, console=console, refresh_per_second=10)
+                live.start()
+            elif kind == "game" and view is not None:
+                view.add_game(
+                    Move(event["ai1_move"]),
+                    Move(event["ai2_move"]),
+                    GameResult(event["result"]),
+                    score=tuple(event["score"]),
+                )
+            elif kind == "battle_end":
+                stop_live()
+                winner = event["winner"] or "Nobody - it's a draw"
+                console.print(f"[bold green]Winner: {winner}[/bold green]")
+            elif kind == "tournament_end":
+                stop_live()
+                table = Table(title="Final Standings", style="cyan")
+                for column in ("Player", "Wins", "Losses", "Ties", "Win Rate"):
+                    table.add_column(column)
+                for row in event["standings"]:
+                    table.add_row(
+                        row["name"],
+                        str(row["wins"]),
+                        str(row["losses"]),
+                        str(row["ties"]),
+                        f"{row['win_rate']:.1f}%",
+                    )
+                console.print(table)
+    finally:
+        stop_live()
+        writer.close()
+
+
+def main(argv=None):
+    """Command-line entry point: ``python -m src.spectator``."""
+    parser = argparse.ArgumentParser(description="Watch AI battles live")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_SPECTATE_PORT)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_watch(args))
+    except KeyboardInterrupt:
+        pass
+    except OSError as exc:
+        print(f"Could not connect to {args.host}:{args.port}: {exc}")
+        return
+    print("\nStopped watching.")
+
+
+if __name__ == "__main__":
+    main()
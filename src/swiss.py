@@ -0,0 +1,558 @@
+"""Swiss-system tournaments for large fields of AI entrants.
+
+A round robin needs n(n-1)/2 matchups; a Swiss tournament plays about
+log2(n) rounds of n/2 matchups each. Every round pairs entrants with the
+same (or the nearest) score who haven't met yet, so the strong quickly meet
+the strong and the final ranking is credible after O(n log n) matchups.
+
+Each matchup is a ``Matchup`` of ``games_per_matchup`` games and is worth
+1 point to the entrant who wins more games, half a point each for a draw.
+Ties in points are broken by Buchholz (the sum of the opponents' points),
+then by game difference. With an odd field, the lowest-ranked entrant who
+hasn't had one yet gets a bye, worth a win. With a ``SequentialTest`` each
+matchup stops as soon as it's decided (``games_per_matchup`` becomes the
+cap) and a matchup the test calls a draw is worth half a point each.
+
+With a ``seed`` every matchup plays from its own seed, derived from the
+tournament's and the two entrants, so its result doesn't depend on what
+was played before it. Seeded results can then come from a ``MatchCache``:
+rerunning an unchanged tournament replays nothing, and after editing one
+strategy only its matchups (and any pairings that change as a result) are
+played again.
+
+Run a field of every AI opponent plus ``PsychologicalAI`` variants with
+different ``randomness_factor`` values from the command line::
+
+    python -m src.swiss --entrants 256 --games 20 --seed 1
+    python -m src.swiss --entrants 256 --games 500 --sequential
+    python -m src.swiss --entrants 256 --games 20 --seed 1 --cache
+    python -m src.swiss --entrants 1024 --games 1000 --checkpoint run.ckpt
+    python -m src.swiss --resume run.ckpt
+"""
+
+import argparse
+import json
+import math
+import signal
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.ai import AI_OPPONENTS, AIPlayer, PsychologicalAI, create_ai
+from src.checkpoint import (
+    DEFAULT_INTERVAL,
+    Checkpointer,
+    load_checkpoint,
+    restore_random,
+)
+from src.engine import Matchup
+from src.match_cache import DEFAULT_CACHE_FILE, MatchCache, derive_seed, play_seeded
+from src.paths import DEFAULT_CHECKPOINT_FILE
+from src.sequential import AI1, AI2, SequentialTest, score_interval
+
+# Called after each matchup with (round number, entrant 1, entrant 2, matchup)
+MatchupHook = Callable[[int, "Entrant", "Entrant", Matchup], None]
+
+# Pairing gives up on avoiding rematches after this many steps
+MAX_PAIRING_STEPS = 10_000
+
+
+class Entrant:
+    """One tournament entrant: a way to build its AI plus its record."""
+
+    def __init__(
+        self, name: str, factory: Callable[[], AIPlayer], difficulty: str = ""
+    ):
+        self.name = name
+        self.factory = factory
+        self.difficulty = difficulty
+        self.points = 0.0
+        self.opponents: List["Entrant"] = []
+        self.met: Set[str] = set()
+        self.had_bye = False
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+
+    @property
+    def buchholz(self) -> float:
+        """Sum of the points of everyone this entrant has played."""
+        return sum(opponent.points for opponent in self.opponents)
+
+    @property
+    def total_games(self) -> int:
+        return self.wins + self.losses + self.ties
+
+    @property
+    def win_rate(self) -> float:
+        """Percentage of games won."""
+        return self.wins / self.total_games * 100 if self.total_games else 0.0
+
+    def rank_key(self) -> Tuple[float, float, int]:
+        return (self.points, self.buchholz, self.wins - self.losses)
+
+
+def psychological_variant(randomness: float, digits: int = 3) -> Entrant:
+    """A ``PsychologicalAI`` entrant with its own ``randomness_factor``.
+
+    Its name shows ``randomness`` to ``digits`` decimal places.
+    """
+    config = next(c for c in AI_OPPONENTS if c["class"] is PsychologicalAI)
+    name = f"{config['name']} (r={randomness:.{digits}f})"
+
+    def factory() -> AIPlayer:
+        ai = PsychologicalAI(name, config["personality"])
+        ai.randomness_factor = randomness
+        return ai
+
+    return Entrant(name, factory, config["difficulty"])
+
+
+def build_field(size: int) -> List[Entrant]:
+    """Every ``AI_OPPONENTS`` entry, topped up with ``PsychologicalAI`` variants.
+
+    The variants' ``randomness_factor`` values are spread evenly over 0..1,
+    and named with enough decimal places to tell them all apart.
+    """
+    field = [
+        Entrant(
+            config["name"], lambda index=index: create_ai(index), config["difficulty"]
+        )
+        for index, config in enumerate(AI_OPPONENTS[:size])
+    ]
+    variants = size - len(field)
+    steps = max(1, variants - 1)
+    # Values 1/steps apart stay distinct when rounded to 1/10**digits
+    digits = max(3, len(str(steps)))
+    for i in range(variants):
+        field.append(psychological_variant(i / steps, digits))
+    return field
+
+
+def default_rounds(size: int) -> int:
+    """Enough rounds for one entrant to be able to win every matchup."""
+    return max(1, math.ceil(math.log2(max(2, size))))
+
+
+def pair_entrants(ranked: List[Entrant]) -> List[Tuple[Entrant, Entrant]]:
+    """Pair an even list of entrants, best first, avoiding rematches.
+
+    The top unpaired entrant is paired with the next one down they haven't
+    met, backtracking when that leaves the rest unpairable. In practice this
+    is a single linear pass (a Swiss tournament has far fewer rounds than
+    entrants). If no rematch-free pairing turns up within
+    ``MAX_PAIRING_STEPS``, adjacent entrants are paired regardless.
+    """
+    count = len(ranked)
+    paired = [False] * count
+    pairs: List[Tuple[int, int]] = []
+
+    def first_unpaired(index: int) -> int:
+        while index < count and paired[index]:
+            index += 1
+        return index
+
+    start = first_unpaired(0)
+    candidate = start + 1
+    for _ in range(MAX_PAIRING_STEPS):
+        if start >= count:
+            return [(ranked[i], ranked[j]) for i, j in pairs]
+        met = ranked[start].met
+        while candidate < count and (
+            paired[candidate] or ranked[candidate].name in met
+        ):
+            candidate += 1
+        if candidate < count:
+            paired[start] = paired[candidate] = True
+            pairs.append((start, candidate))
+            start = first_unpaired(start + 1)
+            candidate = start + 1
+        elif pairs:
+            # Nobody left for ``start``: undo the last pair and try its next option
+            start, previous = pairs.pop()
+            paired[start] = paired[previous] = False
+            candidate = previous + 1
+        else:
+            break
+    return [(ranked[i], ranked[i + 1]) for i in range(0, count - 1, 2)]
+
+
+class SwissTournament:
+    """A Swiss-system tournament between ``entrants``."""
+
+    def __init__(
+        self,
+        entrants: List[Entrant],
+        games_per_matchup: int = 10,
+        rounds: Optional[int] = None,
+        profiler=None,
+        sequential: Optional[SequentialTest] = None,
+        seed: Optional[int] = None,
+        cache: Optional[MatchCache] = None,
+    ):
+        if len(entrants) < 2:
+            raise ValueError("a tournament needs at least two entrants")
+        if len({entrant.name for entrant in entrants}) != len(entrants):
+            raise ValueError("entrant names must be unique")
+        self.entrants = entrants
+        self.games_per_matchup = games_per_matchup
+        self.rounds = rounds if rounds is not None else default_rounds(len(entrants))
+        self.profiler = profiler
+        self.sequential = sequential
+        self.seed = seed
+        # Profiling needs every game played, so it bypasses the cache
+        self.cache = cache if seed is not None and profiler is None else None
+        self.round = 0
+        self.matchups_played = 0
+        self.games_played = 0
+        # The current round's matchups still to play
+        self.pending: List[Tuple[Entrant, Entrant]] = []
+
+    @property
+    def finished(self) -> bool:
+        return self.round >= self.rounds and not self.pending
+
+    def standings(self) -> List[Entrant]:
+        """Entrants best first: points, then Buchholz, then game difference."""
+        return sorted(self.entrants, key=Entrant.rank_key, reverse=True)
+
+    def pair_round(self) -> Tuple[List[Tuple[Entrant, Entrant]], Optional[Entrant]]:
+        """Pairings for the next round, plus the entrant with a bye (if any)."""
+        # Pair by points only; Buchholz only separates entrants at the end
+        ranked = sorted(self.entrants, key=lambda e: e.points, reverse=True)
+        bye = None
+        if len(ranked) % 2:
+            for entrant in reversed(ranked):
+                if not entrant.had_bye:
+                    bye = entrant
+                    break
+            else:
+                bye = ranked[-1]
+            ranked.remove(bye)
+        return pair_entrants(ranked), bye
+
+    def play_matchup(self, entrant1: Entrant, entrant2: Entrant) -> Matchup:
+        matchup = Matchup(
+            entrant1.factory(), entrant2.factory(), profiler=self.profiler
+        )
+        seed = None
+        if self.seed is not None:
+            # Rematches (rare) get a different seed from the first meeting
+            meetings = entrant1.opponents.count(entrant2)
+            seed = derive_seed(self.seed, entrant1.name, entrant2.name, meetings)
+        if self.cache is not None:
+            decision = self.cache.play(
+                matchup, self.games_per_matchup, seed, self.sequential
+            )
+        else:
+            decision = play_seeded(
+                matchup, self.games_per_matchup, seed, self.sequential
+            )
+        wins1, wins2, ties = matchup.score
+        entrant1.wins += wins1
+        entrant1.losses += wins2
+        entrant1.ties += ties
+        entrant2.wins += wins2
+        entrant2.losses += wins1
+        entrant2.ties += ties
+        if decision is None:
+            decision = AI1 if wins1 > wins2 else AI2 if wins2 > wins1 else None
+        if decision == AI1:
+            entrant1.points += 1
+        elif decision == AI2:
+            entrant2.points += 1
+        else:
+            entrant1.points += 0.5
+            entrant2.points += 0.5
+        entrant1.opponents.append(entrant2)
+        entrant2.opponents.append(entrant1)
+        entrant1.met.add(entrant2.name)
+        entrant2.met.add(entrant1.name)
+        self.matchups_played += 1
+        self.games_played += matchup.games_played
+        return matchup
+
+    def start_round(self):
+        """Pair the next round and award its bye."""
+        pairs, bye = self.pair_round()
+        self.round += 1
+        if bye is not None:
+            bye.points += 1
+            bye.had_bye = True
+        self.pending = pairs
+
+    def play_next(self, on_matchup: Optional[MatchupHook] = None):
+        """Play the next matchup, starting a new round if this one is done."""
+        if not self.pending:
+            self.start_round()
+        entrant1, entrant2 = self.pending[0]
+        matchup = self.play_matchup(entrant1, entrant2)
+        del self.pending[0]
+        if on_matchup is not None:
+            on_matchup(self.round, entrant1, entrant2, matchup)
+
+    def play_round(self, on_matchup: Optional[MatchupHook] = None):
+        """Play the rest of the current round, or all of the next one."""
+        if not self.pending:
+            self.start_round()
+        while self.pending:
+            self.play_next(on_matchup)
+
+    def play(self, on_matchup: Optional[MatchupHook] = None) -> List[Entrant]:
+        """Play all remaining rounds; returns the final standings."""
+        while not self.finished:
+            self.play_round(on_matchup)
+        return self.standings()
+
+    def state(self) -> Dict:
+        """Progress so far, for checkpoints (entrants are referred to by name)."""
+        return {
+            "round": self.round,
+            "matchups_played": self.matchups_played,
+            "games_played": self.games_played,
+            "entrants": [
+                {
+                    "name": entrant.name,
+                    "points": entrant.points,
+                    "opponents": [opponent.name for opponent in entrant.opponents],
+                    "had_bye": entrant.had_bye,
+                    "wins": entrant.wins,
+                    "losses": entrant.losses,
+                    "ties": entrant.ties,
+                }
+                for entrant in self.entrants
+            ],
+            "pending": [[e1.name, e2.name] for e1, e2 in self.pending],
+        }
+
+    def load_state(self, state: Dict):
+        """Carry on from ``state``; the entrants must be the same field."""
+        by_name = {entrant.name: entrant for entrant in self.entrants}
+        try:
+            for record in state["entrants"]:
+                entrant = by_name[record["name"]]
+                entrant.points = record["points"]
+                entrant.opponents = [by_name[name] for name in record["opponents"]]
+                entrant.met = set(record["opponents"])
+                entrant.had_bye = record["had_bye"]
+                entrant.wins = record["wins"]
+                entrant.losses = record["losses"]
+                entrant.ties = record["ties"]
+            self.pending = [(by_name[a], by_name[b]) for a, b in state["pending"]]
+        except KeyError as exc:
+            raise ValueError(f"entrant {exc} is not in this field") from None
+        self.round = state["round"]
+        self.matchups_played = state["matchups_played"]
+        self.games_played = state["games_played"]
+
+    def config(self) -> Dict:
+        """Settings to rebuild this tournament with ``from_checkpoint``."""
+        return {
+            "entrants": len(self.entrants),
+            "games": self.games_per_matchup,
+            "rounds": self.rounds,
+            "sequential": self.sequential.settings() if self.sequential else None,
+            "seed": self.seed,
+        }
+
+    @classmethod
+    def from_checkpoint(
+        cls, checkpoint: Dict, cache: Optional[MatchCache] = None
+    ) -> "SwissTournament":
+        """A ``build_field`` tournament, picked up where ``checkpoint`` stopped.
+
+        The shared RNG is not touched; see ``checkpoint.restore_random``.
+        """
+        if checkpoint["kind"] != "swiss":
+            raise ValueError(f"not a Swiss checkpoint ({checkpoint['kind']})")
+        config = checkpoint["config"]
+        settings = config["sequential"]
+        tournament = cls(
+            build_field(config["entrants"]),
+            config["games"],
+            config["rounds"],
+            sequential=SequentialTest(*settings) if settings else None,
+            seed=config["seed"],
+            cache=cache,
+        )
+        tournament.load_state(checkpoint["progress"])
+        return tournament
+
+
+def standings_json(standings: List[Entrant]) -> List[Dict]:
+    rows = []
+    for rank, entrant in enumerate(standings, 1):
+        score, low, high = score_interval(entrant.wins, entrant.losses, entrant.ties)
+        rows.append(
+            {
+                "rank": rank,
+                "name": entrant.name,
+                "points": entrant.points,
+                "buchholz": entrant.buchholz,
+                "wins": entrant.wins,
+                "losses": entrant.losses,
+                "ties": entrant.ties,
+                "win_rate": round(entrant.win_rate, 1),
+                # Mean per-game score with its 95% confidence interval
+                "score": round(score, 4),
+                "score_ci": [round(low, 4), round(high, 4)],
+            }
+        )
+    return rows
+
+
+def main(argv=None) -> int:
+    """Command-line entry point: ``python -m src.swiss``."""
+    parser = argparse.ArgumentParser(description="Swiss-system AI tournament")
+    parser.add_argument("--entrants", type=int, default=64, help="Field size")
+    parser.add_argument("--games", type=int, default=20, help="Games per matchup")
+    parser.add_argument(
+        "--rounds", type=int, default=None, help="Rounds (default: log2 of the field)"
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Stop each matchup once decided (--games becomes the cap)",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed the AIs' RNG")
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_FILE,
+        metavar="FILE",
+        help=f"Reuse seeded matchup results from FILE (default {DEFAULT_CACHE_FILE})",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=100_000,
+        help="Matchup results the cache keeps",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        nargs="?",
+        const=DEFAULT_CHECKPOINT_FILE,
+        metavar="FILE",
+        help=f"Save progress to FILE as it goes (default {DEFAULT_CHECKPOINT_FILE})",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help="Seconds between checkpoints",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="FILE",
+        help="Carry on from a checkpoint (the other tournament options are ignored)",
+    )
+    parser.add_argument("--top", type=int, default=20, help="Standings rows to show")
+    parser.add_argument("--json", action="store_true", help="Print JSON only")
+    args = parser.parse_args(argv)
+
+    checkpoint = None
+    seed = args.seed
+    if args.resume:
+        try:
+            checkpoint = load_checkpoint(args.resume)
+        except ValueError as exc:
+            parser.error(str(exc))
+        seed = checkpoint["config"]["seed"]
+    if args.cache and seed is None:
+        parser.error("--cache needs --seed (unseeded results can't be reused)")
+    cache = MatchCache(args.cache, args.cache_size) if args.cache else None
+    if checkpoint is not None:
+        try:
+            tournament = SwissTournament.from_checkpoint(checkpoint, cache)
+        except ValueError as exc:
+            parser.error(str(exc))
+        restore_random(checkpoint)
+    else:
+        tournament = SwissTournament(
+            build_field(args.entrants),
+            args.games,
+            args.rounds,
+            sequential=SequentialTest() if args.sequential else None,
+            seed=seed,
+            cache=cache,
+        )
+    checkpoint_path = args.checkpoint or args.resume
+    checkpointer = None
+    if checkpoint_path:
+        checkpointer = Checkpointer(
+            checkpoint_path, "swiss", tournament.config(), args.checkpoint_interval
+        )
+
+    # With checkpoints, the first Ctrl+C stops after the current matchup
+    interrupted = False
+
+    def stop_after_matchup(signum, frame):
+        nonlocal interrupted
+        interrupted = True
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    if checkpointer is not None:
+        signal.signal(signal.SIGINT, stop_after_matchup)
+    started = time.perf_counter()
+    try:
+        while not tournament.finished and not interrupted:
+            tournament.play_next()
+            if checkpointer is not None and checkpointer.due():
+                checkpointer.save(tournament.state())
+    finally:
+        # Keep what was played, even if the run is interrupted
+        if cache is not None:
+            cache.save()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+    elapsed = time.perf_counter() - started
+
+    if checkpointer is not None:
+        if interrupted:
+            checkpointer.save(tournament.state())
+            print(
+                f"Stopped after {tournament.matchups_played} matchups. Carry on "
+                f"with: python -m src.swiss --resume {checkpointer.path}",
+                file=sys.stderr,
+            )
+            return 130
+        checkpointer.clear()
+    standings = tournament.standings()
+
+    if args.json:
+        report = {
+            "entrants": len(standings),
+            "rounds": tournament.rounds,
+            "matchups": tournament.matchups_played,
+            "games_per_matchup": tournament.games_per_matchup,
+            "games": tournament.games_played,
+            "elapsed_s": elapsed,
+            "cache": (
+                {"hits": cache.hits, "misses": cache.misses} if cache else None
+            ),
+            "standings": standings_json(standings),
+        }
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(
+        f"{len(standings)} entrants, {tournament.rounds} rounds, "
+        f"{tournament.matchups_played} matchups ({tournament.games_played} games) "
+        f"in {elapsed:.1f}s"
+    )
+    if cache is not None:
+        print(
+            f"Cache: {cache.hits} matchups reused, {cache.misses} played "
+            f"({len(cache)} results in {cache.path})"
+        )
+    for row in standings_json(standings)[: args.top]:
+        print(
+            f"{row['rank']:4d}. {row['name']:<32} {row['points']:5.1f} pts  "
+            f"Buchholz {row['buchholz']:6.1f}  {row['wins']}-{row['losses']}-"
+            f"{row['ties']}  score {row['score'] * 100:.1f}% "
+            f"[{row['score_ci'][0] * 100:.1f}, {row['score_ci'][1] * 100:.1f}]"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
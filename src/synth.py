@@ -0,0 +1,220 @@
+"""Sound synthesis with whole-buffer operations and a parameter-keyed cache.
+
+Sounds are described by plain spec dicts (see ``src/sounds.py``). Rendering
+works on whole sample buffers at once: NumPy arrays when NumPy is installed,
+otherwise ``map`` over Python lists, which keeps the per-sample work in C.
+Rendered clips are cached in memory and, optionally, as WAV files whose
+names carry a hash of the spec, so editing a spec regenerates the sound.
+"""
+
+import glob
+import hashlib
+import json
+import math
+import operator
+import os
+import random
+import sys
+import wave
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from src.audio import Clip
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional
+    _np = None
+
+# Bump when rendering code changes in a way that alters the output
+SYNTH_VERSION = 1
+
+
+# --- Buffer helpers (NumPy when available, lists otherwise) ---------------
+
+
+def _arange(n: int):
+    if _np is not None:
+        return _np.arange(n, dtype=float)
+    return [float(i) for i in range(n)]
+
+
+def _from_list(values: List[float]):
+    return _np.asarray(values, dtype=float) if _np is not None else values
+
+
+def _binary(op: Callable, a, b):
+    """Elementwise ``op`` where either side may be a scalar."""
+    if _np is not None:
+        return op(a, b)
+    if not isinstance(a, list):
+        return [op(a, y) for y in b]
+    if not isinstance(b, list):
+        return [op(x, b) for x in a]
+    return list(map(op, a, b))
+
+
+def _mul(a, b):
+    return _binary(operator.mul, a, b)
+
+
+def _add(a, b):
+    return _binary(operator.add, a, b)
+
+
+def _sub(a, b):
+    return _binary(operator.sub, a, b)
+
+
+def _minimum(a, b):
+    if _np is not None:
+        return _np.minimum(a, b)
+    return _binary(min, a, b)
+
+
+def _sin(xs):
+    return _np.sin(xs) if _np is not None else list(map(math.sin, xs))
+
+
+def _exp(xs):
+    return _np.exp(xs) if _np is not None else list(map(math.exp, xs))
+
+
+def _zeros(n: int):
+    return _np.zeros(n) if _np is not None else [0.0] * n
+
+
+def _concat(parts):
+    if _np is not None:
+        return _np.concatenate(parts) if parts else _np.zeros(0)
+    return [s for part in parts for s in part]
+
+
+def _to_pcm16(samples) -> bytes:
+    """Clamp to 16-bit range and pack little-endian in one go."""
+    if _np is not None:
+        return _np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+    pcm = array("h", (max(-32768, min(32767, int(s))) for s in samples))
+    if sys.byteorder == "big":
+        pcm.byteswap()
+    return pcm.tobytes()
+
+
+# --- Building blocks --------------------------------------------------------
+
+
+def _sine(n: int, freq: float, rate: int):
+    return _sin(_mul(_arange(n), 2 * math.pi * freq / rate))
+
+
+def _linear_envelope(n: int, attack: float, release: float):
+    """Ramp up over the first ``attack`` and down over the last ``release``
+    fraction of ``n`` samples."""
+    i = _arange(n)
+    rise = _mul(i, 1 / (n * attack))
+    fall = _mul(_sub(float(n), i), 1 / (n * release))
+    return _minimum(_minimum(rise, fall), 1.0)
+
+
+def _noise(n: int, amplitude: float, seed: int):
+    """Uniform noise in [-amplitude/2, amplitude/2), reproducible by seed."""
+    rng = random.Random(seed)
+    return _from_list([(rng.random() - 0.5) * amplitude for _ in range(n)])
+
+
+# --- Synthesizers -----------------------------------------------------------
+
+
+def _fanfare(spec: Dict) -> bytes:
+    """Sequence of enveloped sine notes separated by short gaps."""
+    rate = spec["rate"]
+    n = int(rate * spec["note_duration"])
+    gap = _zeros(int(rate * spec["gap"]))
+    envelope = _linear_envelope(n, spec["attack"], spec["release"])
+    peak = spec["amplitude"] * 32767
+
+    parts = []
+    for freq in spec["notes"]:
+        parts.append(_mul(_mul(_sine(n, freq, rate), envelope), peak))
+        parts.append(gap)
+    return _to_pcm16(_concat(parts))
+
+
+def _thud(spec: Dict) -> bytes:
+    """Exponentially decaying low sine with a burst of noise on the attack."""
+    rate = spec["rate"]
+    n = int(rate * spec["duration"])
+    envelope = _exp(_mul(_arange(n), -spec["decay"] / rate))
+    peak = spec["amplitude"] * 32767
+    tone = _mul(_mul(_sine(n, spec["freq"], rate), envelope), peak)
+
+    noisy = int(n * spec["noise_fraction"])
+    noise = _concat(
+        [
+            _mul(_noise(noisy, spec["noise"], spec["seed"]), envelope[:noisy]),
+            _zeros(n - noisy),
+        ]
+    )
+    return _to_pcm16(_add(tone, noise))
+
+
+SYNTHESIZERS: Dict[str, Callable[[Dict], bytes]] = {
+    "fanfare": _fanfare,
+    "thud": _thud,
+}
+
+
+# --- Rendering and caching --------------------------------------------------
+
+
+def spec_digest(spec: Dict) -> str:
+    """Stable short hash of a sound spec (and the synth version)."""
+    payload = json.dumps({"version": SYNTH_VERSION, **spec}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def render(spec: Dict) -> Clip:
+    """Synthesize a spec into a mono 16-bit clip."""
+    pcm = SYNTHESIZERS[spec["kind"]](spec)
+    return Clip(pcm, spec["rate"], channels=1, sample_width=2)
+
+
+_memory_cache: Dict[str, Clip] = {}
+
+
+def load_clip(name: str, spec: Dict, cache_dir: Optional[str] = None) -> Clip:
+    """Return the clip for ``spec``, rendering it only if no cached copy exists.
+
+    With ``cache_dir`` the clip is also kept on disk as ``<name>-<digest>.wav``;
+    files for older versions of the same sound are removed.
+    """
+    key = spec_digest(spec)
+    clip = _memory_cache.get(key)
+    if clip is not None:
+        return clip
+
+    path = os.path.join(cache_dir, f"{name}-{key}.wav") if cache_dir else None
+    if path and os.path.isfile(path):
+        try:
+            clip = Clip.from_wav_file(path)
+        except (OSError, EOFError, ValueError, wave.Error):
+            clip = None  # Unreadable: render it again
+
+    if clip is None:
+        clip = render(spec)
+        if path:
+            _write_cache_file(name, path, clip)
+
+    _memory_cache[key] = clip
+    return clip
+
+
+def _write_cache_file(name: str, path: str, clip: Clip):
+    try:
+        for stale in glob.glob(os.path.join(os.path.dirname(path), f"{name}-*.wav")):
+            if stale != path:
+                os.remove(stale)
+        with open(path, "wb") as f:
+            f.write(clip.to_wav_bytes())
+    except OSError:
+        pass  # Cache is best effort; the clip is still in memory
@@ -0,0 +1,78 @@
+"""Helpers for running blocking work alongside the asyncio game loop."""
+
+import asyncio
+import threading
+from typing import Any, Callable, Optional, Set
+
+
+async def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call (e.g. a terminal prompt) in a daemon thread.
+
+    Unlike ``asyncio.to_thread`` the thread is a daemon, so a prompt that is
+    still waiting for input never keeps the interpreter alive after Ctrl+C.
+    Only use this for calls that are safe to abandon mid-way.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _deliver(setter: Callable[[Any], None], value: Any):
+        if not future.done():
+            setter(value)
+
+    def _worker():
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:  # Re-raised in the awaiting coroutine
+            outcome = (future.set_exception, exc)
+        else:
+            outcome = (future.set_result, result)
+        try:
+            loop.call_soon_threadsafe(_deliver, *outcome)
+        except RuntimeError:
+            pass  # Loop already closed; nobody is waiting any more
+
+    threading.Thread(target=_worker, daemon=True).start()
+    return await future
+
+
+class BackgroundTasks:
+    """Fire-and-forget work (sounds, saves) that must not block the screen."""
+
+    def __init__(self):
+        self._tasks: Set[asyncio.Task] = set()
+        self._serial_tail: Optional[asyncio.Task] = None
+
+    def _track(self, task: asyncio.Task) -> asyncio.Task:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def spawn(self, fn: Callable[..., Any], *args) -> asyncio.Task:
+        """Run ``fn(*args)`` in a worker thread without waiting for it."""
+        return self._track(asyncio.ensure_future(asyncio.to_thread(fn, *args)))
+
+    def spawn_serial(self, fn: Callable[..., Any], *args) -> asyncio.Task:
+        """Like ``spawn``, but only starts once every earlier serial job is done.
+
+        Used for persistence so saves land on disk in the order they were made.
+        """
+        previous = self._serial_tail
+
+        async def _job():
+            if previous is not None:
+                await asyncio.wait([previous])
+            return await asyncio.to_thread(fn, *args)
+
+        task = self._track(asyncio.ensure_future(_job()))
+        self._serial_tail = task
+        return task
+
+    async def flush(self):
+        """Wait until every serial job queued so far has finished."""
+        if self._serial_tail is not None:
+            await asyncio.wait([self._serial_tail])
+
+    async def drain(self):
+        """Wait for all outstanding background work."""
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))